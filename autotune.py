@@ -0,0 +1,301 @@
+"""
+Game of Life Backend Autotuning
+-------------------------------------------------------
+The "auto" backend: picks the fastest engine and Numba thread count for a board.
+
+On first use for a (board size, initial density, rule, candidate backends, machine)
+combination, every candidate backend that supports the rule is benchmarked with
+benchmark.measure() at every thread count from 1 to the size of the Numba thread
+pool (powers of two and the maximum). The winner is stored in a JSON tuning cache on disk
+(~/.cache/game_of_life/tuning.json, or $LIFE_TUNING_CACHE), so later runs only look
+it up. Sizes are bucketed to the nearest power of two (boards above
+MAX_TUNING_SIZE are tuned at that size) and densities to one decimal.
+
+Usage:
+    sim = Simulation(1024, 1024, random_init=True, backend="auto")
+    python autotune.py --sizes 32 64 256 1024 4096 --densities 0.2     # fill the cache ahead
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import argparse
+import json
+import math
+import os
+import numpy as np
+from benchmark import Case, machine_metadata, measure, set_threads
+from rules import as_rule
+from simulation import Backend, load_backend
+
+# Version 2 added the candidate backends to the cache keys.
+TUNING_VERSION = 2
+# Backends the auto backend chooses from, in order of preference on ties.
+CANDIDATES = ["numpy", "numba", "halo", "tiled", "packed"]
+# Candidates stepped by Numba kernels, whose thread count is tuned.
+NUMBA_BACKENDS = {"numba", "halo", "tiled", "packed"}
+# Largest board edge benchmarked while tuning.
+MAX_TUNING_SIZE = 2048
+
+def default_cache_path():
+    """
+    Location of the tuning cache: $LIFE_TUNING_CACHE or ~/.cache/game_of_life/tuning.json.
+    """
+    return os.environ.get("LIFE_TUNING_CACHE",
+                          os.path.join(os.path.expanduser("~"), ".cache", "game_of_life",
+                                       "tuning.json"))
+
+def machine_key():
+    """
+    Identifier of the machine and library versions that tuning results depend on.
+    """
+    metadata = machine_metadata()
+    return "|".join(str(metadata[key]) for key in ("cpu", "cpu_count", "numba_threads",
+                                                   "numpy", "numba"))
+
+def size_bucket(rows, cols):
+    """
+    Board edge rounded to the nearest power of two (at least 16), from the cell count.
+    """
+    return 1 << max(4, round(math.log2(max(math.sqrt(rows * cols), 1))))
+
+def tuning_key(rows, cols, density, rule, candidates=None):
+    """
+    Cache key of a board: machine, size bucket, density bucket, rule and the backends
+    the winner was chosen from.
+
+    Parameters:
+    - rows (int): Number of rows.
+    - cols (int): Number of columns.
+    - density (float): Fraction of live cells.
+    - rule (Rule or str): Rule.
+    - candidates (list of str, optional): Backends to choose from, see candidates_for().
+
+    Returns:
+    - str: Cache key.
+    """
+    names = ",".join(sorted(set(candidates or candidates_for(rule))))
+    return f"{machine_key()}|{size_bucket(rows, cols)}|{round(density, 1):.1f}|{as_rule(rule)}|{names}"
+
+def thread_counts():
+    """
+    Numba thread counts to try: powers of two up to the size of the thread pool, and
+    the full pool.
+    """
+    import numba
+    limit = numba.config.NUMBA_NUM_THREADS
+    counts = [1 << power for power in range(limit.bit_length()) if 1 << power <= limit]
+    return counts if counts[-1] == limit else counts + [limit]
+
+def candidates_for(rule):
+    """
+    Candidate backends that can run a rule and whose dependencies are installed.
+
+    Parameters:
+    - rule (Rule or str): Rule.
+
+    Returns:
+    - list of str: Backend names.
+    """
+    rule = as_rule(rule)
+    names = []
+    for name in CANDIDATES:
+        try:
+            backend_class = load_backend(name)
+        except ImportError:
+            continue
+        if rule.is_generations and not backend_class.supports_generations:
+            continue
+        if 0 in rule.birth and not backend_class.supports_birth_on_zero:
+            continue
+        names.append(name)
+    return names
+
+def tune(rows, cols, density, rule, candidates=None, repeats=3, min_time=0.05):
+    """
+    Benchmark the candidate backends and thread counts for a board.
+
+    Parameters:
+    - rows (int): Number of rows.
+    - cols (int): Number of columns.
+    - density (float): Fraction of live cells.
+    - rule (Rule or str): Rule.
+    - candidates (list of str, optional): Backends to try, see candidates_for().
+    - repeats (int): Timed repeats per configuration.
+    - min_time (float): Minimum seconds per repeat.
+
+    Returns:
+    - dict: backend, threads and cells_per_second of the winner, the benchmarked size
+      and all measurements.
+    """
+    rule = as_rule(rule)
+    size = min(size_bucket(rows, cols), MAX_TUNING_SIZE)
+    measurements = []
+    for backend in candidates or candidates_for(rule):
+        for threads in thread_counts() if backend in NUMBA_BACKENDS else [None]:
+            result = measure(Case(backend, size, density, threads), repeats=repeats,
+                             min_time=min_time, rule=str(rule))
+            measurements.append({"backend": backend, "threads": threads,
+                                 "cells_per_second": result["cells_per_second"]})
+    best = max(measurements, key=lambda entry: entry["cells_per_second"])
+    return dict(best, size=size, measurements=measurements)
+
+def load_cache(path):
+    """
+    Read the tuning cache; a missing, unreadable or outdated file gives an empty one.
+
+    Parameters:
+    - path (str): Cache file.
+
+    Returns:
+    - dict: Cache key -> tuning result.
+    """
+    try:
+        with open(path) as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return data.get("entries", {}) if data.get("version") == TUNING_VERSION else {}
+
+def save_cache(entries, path):
+    """
+    Atomically write the tuning cache.
+
+    Parameters:
+    - entries (dict): Cache key -> tuning result.
+    - path (str): Cache file.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w") as handle:
+        json.dump({"version": TUNING_VERSION, "entries": entries}, handle, indent=2)
+    os.replace(temporary, path)
+
+def lookup(rows, cols, density, rule, cache_path=None, retune=False, candidates=None):
+    """
+    Tuning result of a board, from the cache or freshly measured (and then cached).
+
+    Parameters:
+    - rows, cols (int): Board size.
+    - density (float): Fraction of live cells.
+    - rule (Rule or str): Rule.
+    - cache_path (str, optional): Cache file, default_cache_path() if None.
+    - retune (bool): Measure again even if the board is in the cache.
+    - candidates (list of str, optional): Backends to try when tuning.
+
+    Returns:
+    - dict: See tune().
+    """
+    cache_path = cache_path or default_cache_path()
+    key = tuning_key(rows, cols, density, rule, candidates)
+    entries = load_cache(cache_path)
+    if retune or key not in entries:
+        result = tune(rows, cols, density, rule, candidates)
+        # Re-read in case another process tuned other boards meanwhile.
+        entries = load_cache(cache_path)
+        entries[key] = result
+        save_cache(entries, cache_path)
+    return entries[key]
+
+class AutoBackend(Backend):
+    """
+    Delegates to the fastest backend for the board, chosen by lookup(), and runs it
+    with the tuned Numba thread count.
+
+    The thread count is set before every call into the backend, because Numba's
+    setting applies to the calling thread only (the viewer steps in its own thread),
+    and the caller's count is restored after it.
+
+    Parameters:
+    - grid (np.ndarray): Initial dense grid.
+    - rule (Rule or str, optional): Rule to apply, Conway's Life by default.
+    - cache_path (str, optional): Tuning cache file.
+    - retune (bool): Ignore the cached result for this board.
+    - candidates (list of str, optional): Backends to choose from.
+    """
+    supports_generations = True
+
+    def __init__(self, grid, rule=None, cache_path=None, retune=False, candidates=None):
+        self.rule = as_rule(rule)
+        grid = np.asarray(grid)
+        density = np.count_nonzero(grid == 1) / max(grid.size, 1)
+        self.tuning = lookup(grid.shape[0], grid.shape[1], density, self.rule, cache_path,
+                             retune, candidates)
+        self.backend_name = self.tuning["backend"]
+        self.threads = self.tuning["threads"]
+        previous = self._set_threads()
+        try:
+            self.inner = load_backend(self.backend_name)(grid, rule=self.rule)
+        finally:
+            set_threads(previous)
+
+    def _set_threads(self):
+        """
+        Apply the tuned thread count; returns the previous one, see benchmark.set_threads().
+        """
+        if self.threads is None:
+            return None
+        import numba
+        return set_threads(min(self.threads, numba.config.NUMBA_NUM_THREADS))
+
+    @property
+    def grid(self):
+        return self.inner.grid
+
+    @grid.setter
+    def grid(self, value):
+        self.inner.grid = value
+
+    def step(self):
+        previous = self._set_threads()
+        try:
+            self.inner.step()
+        finally:
+            set_threads(previous)
+
+    def advance(self, steps):
+        previous = self._set_threads()
+        try:
+            self.inner.advance(steps)
+        finally:
+            set_threads(previous)
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+
+    Parameters:
+    - argv (list of str, optional): Arguments to parse, defaults to sys.argv[1:].
+
+    Returns:
+    - argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Tune the auto backend ahead of time.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[32, 64, 128, 256, 512, 1024],
+                        help="Board sizes N (NxN boards) to tune.")
+    parser.add_argument("--densities", nargs="+", type=float, default=[0.2],
+                        help="Initial probabilities of a live cell.")
+    parser.add_argument("--rule", default="B3/S23", help="Rule to tune for.")
+    parser.add_argument("--cache", help="Tuning cache file (default: $LIFE_TUNING_CACHE or "
+                                        "~/.cache/game_of_life/tuning.json).")
+    parser.add_argument("--retune", action="store_true", help="Measure cached boards again.")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Tune every size and density given on the command line and print the winners.
+
+    Parameters:
+    - argv (list of str, optional): Arguments to parse, defaults to sys.argv[1:].
+    """
+    args = parse_args(argv)
+    print(f"{'size':>6} {'density':>7} {'backend':>9} {'threads':>7} {'cells/s':>12}")
+    for size in args.sizes:
+        for density in args.densities:
+            result = lookup(size, size, density, args.rule, args.cache, args.retune)
+            threads = "-" if result["threads"] is None else result["threads"]
+            print(f"{size:>6} {density:>7.2f} {result['backend']:>9} {threads:>7} "
+                  f"{result['cells_per_second']:>12.3e}", flush=True)
+    print(f"tuning cache: {args.cache or default_cache_path()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""
+Game of Life Benchmark Suite
+-------------------------------------------------------
+Non-interactive benchmarks of every backend over grid sizes, densities and thread
+counts, with results written to JSON and CSV.
+
+Each case is measured the same way:
+- warm-up: the first generations (which include the Numba JIT compile) are run and
+  timed separately, and never counted in the measurement;
+- calibration: unless --steps is given, the number of generations per repeat is
+  doubled until a repeat takes at least --min-time seconds;
+- repeats: the same initial board is run --repeats times with time.perf_counter()
+  and the garbage collector disabled, and the median and interquartile range of the
+  time per generation are reported, with cells updated per second.
+
+Usage:
+    python benchmark.py --backends numpy numba --sizes 64 256 1024 --json results/bench.json
+    python benchmark.py --backends numba --sizes 2048 --threads 1 2 4 8 --csv results/threads.csv
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import argparse
+import csv
+import gc
+import itertools
+import json
+import os
+import platform
+import subprocess
+import time
+from collections import namedtuple
+import numpy as np
+from simulation import BACKENDS, Simulation, pin_threading_layer
+
+# One benchmark configuration; threads is None to keep the Numba default.
+Case = namedtuple("Case", ["backend", "size", "density", "threads"])
+
+# Columns of the CSV output, in order.
+FIELDS = ["backend", "size", "density", "threads", "steps", "repeats", "warmup_seconds",
+          "median_seconds", "q1_seconds", "q3_seconds", "iqr_seconds", "min_seconds",
+          "mean_seconds", "cells_per_second"]
+
+def set_threads(threads):
+    """
+    Set the number of Numba threads of the calling thread (None leaves it unchanged).
+
+    Parameters:
+    - threads (int or None): Number of threads.
+
+    Returns:
+    - int or None: The previous number, to restore it with set_threads(); None if
+      threads is None.
+    """
+    if threads is None:
+        return None
+    # Starting the thread pool fixes the threading layer, possibly before any module
+    # with parallel kernels (which pins it) was imported.
+    pin_threading_layer()
+    import numba
+    previous = numba.get_num_threads()
+    numba.set_num_threads(threads)
+    return previous
+
+def timed_run(simulation, steps):
+    """
+    Wall time of simulation.run(steps), with the garbage collector disabled.
+
+    Parameters:
+    - simulation (Simulation): Simulation to advance.
+    - steps (int): Number of generations.
+
+    Returns:
+    - float: Elapsed seconds.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        simulation.run(steps)
+        return time.perf_counter() - start
+    finally:
+        if enabled:
+            gc.enable()
+
+def summarize(samples):
+    """
+    Order statistics of per-generation times.
+
+    Parameters:
+    - samples (list of float): Seconds per generation, one value per repeat.
+
+    Returns:
+    - dict: median, q1, q3, iqr, min and mean seconds.
+    """
+    q1, median, q3 = np.percentile(samples, [25, 50, 75])
+    return {
+        "median_seconds": float(median),
+        "q1_seconds": float(q1),
+        "q3_seconds": float(q3),
+        "iqr_seconds": float(q3 - q1),
+        "min_seconds": float(min(samples)),
+        "mean_seconds": float(np.mean(samples)),
+    }
+
+def measure(case, steps=None, repeats=7, warmup=2, min_time=0.2, seed=0, rule="B3/S23"):
+    """
+    Benchmark one case. The Numba thread count is set to the case's for the
+    measurement only.
+
+    Parameters:
+    - case (Case): Backend, board size, initial density and thread count.
+    - steps (int, optional): Generations per repeat; calibrated from min_time if None.
+    - repeats (int): Number of timed repeats.
+    - warmup (int): Generations run (and timed separately) before measuring.
+    - min_time (float): Target duration of one repeat when calibrating.
+    - seed (int): Seed of the random initial board.
+    - rule (str): Rule to simulate.
+
+    Returns:
+    - dict: The case, steps, repeats, warmup_seconds, the statistics of summarize(),
+      cells_per_second and the raw per-generation samples.
+    """
+    previous_threads = set_threads(case.threads)
+    simulation = None
+    try:
+        simulation = Simulation(case.size, case.size, random_init=True, prob_alive=case.density,
+                                backend=case.backend, seed=seed, rule=rule)
+        initial = np.array(simulation.grid)
+        warmup_seconds = timed_run(simulation, warmup) if warmup > 0 else 0.0
+
+        if steps is None:
+            steps = 1
+            while timed_run(simulation, steps) < min_time and steps < 1 << 20:
+                steps *= 2
+
+        samples = []
+        for _ in range(repeats):
+            simulation.grid = initial.copy()
+            samples.append(timed_run(simulation, steps) / steps)
+    finally:
+        # The caller's thread count is left as it was.
+        set_threads(previous_threads)
+        if simulation is not None and hasattr(simulation.backend, "close"):
+            simulation.backend.close()
+
+    result = dict(case._asdict(), steps=steps, repeats=repeats, warmup_seconds=warmup_seconds)
+    result.update(summarize(samples))
+    result["cells_per_second"] = case.size * case.size / result["median_seconds"]
+    result["samples"] = samples
+    return result
+
+def run_suite(backends, sizes, densities=(0.2,), threads=(None,), **options):
+    """
+    Benchmark every combination of backend, size, density and thread count.
+
+    Parameters:
+    - backends, sizes, densities, threads (iterables): Values of each Case field.
+    - options: Keyword arguments of measure().
+
+    Returns:
+    - list of dict: One result per case, in order.
+    """
+    return [measure(Case(*values), **options)
+            for values in itertools.product(backends, sizes, densities, threads)]
+
+def _cpu_model():
+    """
+    CPU model name from /proc/cpuinfo, or platform.processor() elsewhere.
+    """
+    try:
+        with open("/proc/cpuinfo") as handle:
+            for line in handle:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+def machine_metadata():
+    """
+    Description of the machine and software a benchmark ran on.
+
+    Returns:
+    - dict: cpu, cpu_count, numba_threads, machine, system, python, numpy, numba and
+      the git commit of the code (None when unavailable).
+    """
+    metadata = {
+        "cpu": _cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "numba_threads": None,
+        "machine": platform.machine(),
+        "system": platform.platform(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "numba": None,
+        "commit": None,
+    }
+    try:
+        import numba
+        metadata["numba"] = numba.__version__
+        metadata["numba_threads"] = numba.config.NUMBA_NUM_THREADS
+    except ImportError:
+        pass
+    try:
+        metadata["commit"] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return metadata
+
+def write_json(results, path, settings=None):
+    """
+    Save results (with their raw samples), the machine metadata and the measurement
+    settings as JSON.
+
+    Parameters:
+    - results (list of dict): Results of measure().
+    - path (str): Output file.
+    - settings (dict, optional): Keyword arguments given to measure(), so the same
+      cases can be measured again (see regression.py).
+    """
+    with open(path, "w") as handle:
+        json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                   "machine": machine_metadata(),
+                   "settings": settings or {},
+                   "results": results}, handle, indent=2)
+
+def write_csv(results, path):
+    """
+    Save results as CSV, one row per case (raw samples omitted).
+    """
+    with open(path, "w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+def format_row(result):
+    """
+    One line of the console table.
+    """
+    threads = "-" if result["threads"] is None else result["threads"]
+    return (f"{result['backend']:>9} {result['size']:>6} {result['density']:>7.2f} {threads:>7} "
+            f"{result['steps']:>7} {result['median_seconds'] * 1e3:>11.4f} "
+            f"{result['iqr_seconds'] * 1e3:>9.4f} {result['cells_per_second']:>12.3e} "
+            f"{result['warmup_seconds']:>9.3f}")
+
+HEADER = (f"{'backend':>9} {'size':>6} {'density':>7} {'threads':>7} {'steps':>7} "
+          f"{'median ms':>11} {'IQR ms':>9} {'cells/s':>12} {'warmup s':>9}")
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+
+    Parameters:
+    - argv (list of str, optional): Arguments to parse, defaults to sys.argv[1:].
+
+    Returns:
+    - argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark Game of Life backends.")
+    parser.add_argument("--backends", nargs="+", default=["numpy", "numba"],
+                        choices=sorted(BACKENDS), help="Backends to measure.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[32, 64, 128, 256, 512, 1024],
+                        help="Board sizes N (NxN boards).")
+    parser.add_argument("--densities", nargs="+", type=float, default=[0.2],
+                        help="Initial probabilities of a live cell.")
+    parser.add_argument("--threads", nargs="+", type=int,
+                        help="Numba thread counts (default: leave the thread pool as is).")
+    parser.add_argument("--steps", type=int,
+                        help="Generations per repeat (default: calibrated from --min-time).")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="Minimum seconds per repeat when calibrating --steps.")
+    parser.add_argument("--repeats", type=int, default=7, help="Timed repeats per case.")
+    parser.add_argument("--warmup", type=int, default=2,
+                        help="Untimed generations before measuring (includes JIT compile).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the initial boards.")
+    parser.add_argument("--rule", default="B3/S23", help="Rule to simulate.")
+    parser.add_argument("--json", metavar="PATH", help="Write the results to a JSON file.")
+    parser.add_argument("--csv", metavar="PATH", help="Write the results to a CSV file.")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Run the benchmark suite described by the command line.
+
+    Parameters:
+    - argv (list of str, optional): Arguments to parse, defaults to sys.argv[1:].
+
+    Returns:
+    - list of dict: Benchmark results.
+    """
+    args = parse_args(argv)
+    settings = {"steps": args.steps, "repeats": args.repeats, "warmup": args.warmup,
+                "min_time": args.min_time, "seed": args.seed, "rule": args.rule}
+    print(HEADER)
+    results = []
+    for values in itertools.product(args.backends, args.sizes, args.densities,
+                                    args.threads or [None]):
+        result = measure(Case(*values), **settings)
+        print(format_row(result), flush=True)
+        results.append(result)
+    if args.json:
+        write_json(results, args.json, settings)
+        print(f"results saved to {args.json}")
+    if args.csv:
+        write_csv(results, args.csv)
+        print(f"results saved to {args.csv}")
+    return results
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Game of Life Cycle Detection
+-------------------------------------------------------
+Detects when a board becomes still or periodic by fingerprinting every generation.
+
+Each generation is reduced to a 64-bit fingerprint, and the fingerprints of the last
+`history` generations are kept. A repeated fingerprint means the board has entered a
+cycle; its start and period are then recovered from the stored fingerprints.
+
+Simulations take fingerprints from Backend.fingerprint(), which hashes the backend's
+own storage (e.g. the packed words). fingerprint() here is a BLAKE2b digest of a grid
+buffer (no copy is made for contiguous grids).
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import hashlib
+from collections import deque, namedtuple
+import numpy as np
+
+Cycle = namedtuple("Cycle", ["start", "period"])
+Cycle.__doc__ = """
+Detected cycle: the board at generation g equals the board at generation g + period
+for every g >= start. A still life has period 1.
+"""
+
+def fingerprint(grid):
+    """
+    64-bit fingerprint of a grid.
+
+    Parameters:
+    - grid (np.ndarray): Dense grid, or any array of a backend's storage.
+
+    Returns:
+    - int: Fingerprint.
+    """
+    digest = hashlib.blake2b(np.ascontiguousarray(grid).data, digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+class CycleDetector:
+    """
+    Bounded history of generation fingerprints.
+
+    Parameters:
+    - history (int): Number of recent generations remembered; cycles with a longer
+      period are not detected.
+    """
+    def __init__(self, history=1024):
+        self._hashes = deque(maxlen=history)
+        self._latest = {}
+        self._first = 0
+
+    def reset(self):
+        """
+        Forget all recorded generations (e.g. after the grid was edited).
+        """
+        self._hashes.clear()
+        self._latest.clear()
+
+    def observe(self, generation, grid):
+        """
+        Record a generation and check whether it repeats a remembered one.
+
+        Generations must be observed consecutively; a gap resets the history.
+
+        Parameters:
+        - generation (int): Generation number of grid.
+        - grid (np.ndarray): Dense grid of that generation.
+
+        Returns:
+        - Cycle or None: The detected cycle, or None if the board has not repeated.
+        """
+        return self.observe_fingerprint(generation, fingerprint(grid))
+
+    def observe_fingerprint(self, generation, value):
+        """
+        Record a generation given by its fingerprint, see observe().
+
+        Parameters:
+        - generation (int): Generation number.
+        - value (int): Fingerprint of that generation, e.g. from Backend.fingerprint().
+
+        Returns:
+        - Cycle or None: The detected cycle, or None if the board has not repeated.
+        """
+        if self._hashes and generation != self._first + len(self._hashes):
+            self.reset()
+        if not self._hashes:
+            self._first = generation
+
+        previous = self._latest.get(value)
+        if previous is not None:
+            period = generation - previous
+            start = previous
+            # Walk back to the first generation already inside the cycle.
+            while (start - 1 >= self._first
+                   and self._hashes[start - 1 - self._first]
+                   == self._hashes[start - 1 + period - self._first]):
+                start -= 1
+            return Cycle(start, period)
+
+        if len(self._hashes) == self._hashes.maxlen:
+            dropped = self._hashes[0]
+            if self._latest.get(dropped) == self._first:
+                del self._latest[dropped]
+            self._first += 1
+        self._hashes.append(value)
+        self._latest[value] = generation
+        return None
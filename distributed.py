@@ -0,0 +1,196 @@
+"""
+Game of Life Multi-Process Engine
+-------------------------------------------------------
+Domain decomposition of the board over worker processes.
+
+The grid is split into horizontal strips. Each strip lives in its own
+multiprocessing.shared_memory block with a one-row halo above and below and two
+buffers (current and next generation). Every generation each worker:
+1. computes the interior of its strip with NumPy,
+2. waits at a barrier until every strip is done,
+3. copies the edge rows of its neighbours' strips into its own halo rows,
+4. waits at a second barrier before the next generation.
+
+Workers are separate processes, so there is no GIL contention and every core can
+be used, independently of Numba's thread pool.
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import multiprocessing as mp
+import weakref
+from multiprocessing import shared_memory
+import numpy as np
+from rules import as_rule
+from simulation import Backend
+
+# Workers are started from a fork server rather than forked from the caller: forking a
+# process whose Numba thread pool is already running can hang it at exit.
+_CONTEXT = mp.get_context("forkserver")
+
+def _attach(name, shape):
+    """
+    Attach to a strip's shared memory block.
+
+    Returns:
+    - tuple: (SharedMemory, np.ndarray of shape (2, strip_rows + 2, cols))
+    """
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=np.uint8, buffer=block.buf)
+
+def compute_strip_into(padded, out, birth_bits, survive_bits):
+    """
+    Compute the next generation of the interior rows of a halo-padded strip.
+
+    Parameters:
+    - padded (np.ndarray): Strip of shape (strip_rows + 2, cols) with up-to-date halo rows.
+    - out (np.ndarray): Array of the same shape receiving the next generation in rows 1..strip_rows.
+    - birth_bits (int): Birth bitmask of a two-state rule, see rules.Rule.
+    - survive_bits (int): Survival bitmask of a two-state rule, see rules.Rule.
+    """
+    # 3x3 block sum including the cell itself; columns wrap around.
+    vertical = padded[:-2] + padded[1:-1] + padded[2:]
+    total = vertical + np.roll(vertical, 1, axis=1) + np.roll(vertical, -1, axis=1)
+    alive = padded[1:-1]
+    out[1:-1] = ((np.right_shift(np.uint16(birth_bits), total) & (alive ^ 1))
+                 | (np.right_shift(np.uint16(survive_bits), total) & alive))
+
+def _worker(index, names, shapes, barrier, conn, rule_bits):
+    """
+    Worker process loop: reports that it is ready, then waits for ("advance", n)
+    commands and steps its strip.
+
+    Parameters:
+    - index (int): Strip owned by this worker.
+    - names (list of str): Shared memory names of all strips.
+    - shapes (list of tuple): Array shapes of all strips.
+    - barrier (multiprocessing.Barrier): Barrier shared by all workers.
+    - conn (multiprocessing.connection.Connection): Command pipe to the parent.
+    - rule_bits (tuple): (birth_bits, survive_bits) of the rule.
+    """
+    count = len(names)
+    attached = [_attach(name, shape) for name, shape in zip(names, shapes)]
+    strips = [array for _, array in attached]
+    own = strips[index]
+    above = strips[(index - 1) % count]
+    below = strips[(index + 1) % count]
+    current = 0
+    conn.send(current)
+
+    while True:
+        command, value = conn.recv()
+        if command == "stop":
+            break
+        if command == "advance":
+            for _ in range(value):
+                nxt = 1 - current
+                compute_strip_into(own[current], own[nxt], *rule_bits)
+                barrier.wait()
+                own[nxt, 0] = above[nxt, -2]
+                own[nxt, -1] = below[nxt, 1]
+                barrier.wait()
+                current = nxt
+        conn.send(current)
+
+    for block, _ in attached:
+        block.close()
+    conn.close()
+
+def _shutdown(workers, connections, blocks):
+    """
+    Stop the workers and release the shared memory blocks.
+    """
+    for conn in connections:
+        try:
+            conn.send(("stop", None))
+        except (BrokenPipeError, OSError):
+            pass
+    for worker in workers:
+        worker.join(timeout=5)
+        if worker.is_alive():
+            worker.terminate()
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+class ProcessBackend(Backend):
+    """
+    Dense uint8 grid split into row strips stepped by separate worker processes.
+
+    Call close() (or let the backend be garbage collected) to stop the workers. Workers
+    re-import the main module, so scripts must guard their entry point with
+    `if __name__ == "__main__":`.
+
+    Parameters:
+    - grid (np.ndarray): Initial dense grid.
+    - rule (Rule or str, optional): Two-state rule, Conway's Life by default.
+    - processes (int, optional): Number of worker processes, defaults to the CPU count.
+    """
+    def __init__(self, grid, rule=None, processes=None):
+        rule = as_rule(rule)
+        if rule.is_generations:
+            raise ValueError(f"{type(self).__name__} only supports two-state rules, got {rule}")
+        rows, cols = grid.shape
+        self.processes = max(1, min(processes or mp.cpu_count(), rows))
+        self.rows, self.cols = rows, cols
+        bounds = np.linspace(0, rows, self.processes + 1).astype(int)
+        self.bounds = list(zip(bounds[:-1], bounds[1:]))
+
+        self._blocks, self._strips = [], []
+        for top, bottom in self.bounds:
+            shape = (2, bottom - top + 2, cols)
+            block = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+            self._blocks.append(block)
+            self._strips.append(np.ndarray(shape, dtype=np.uint8, buffer=block.buf))
+        self._current = 0
+
+        # Kept on the instance: the workers attach to it by name after start() returns.
+        self._barrier = barrier = _CONTEXT.Barrier(self.processes)
+        names = [block.name for block in self._blocks]
+        shapes = [strip.shape for strip in self._strips]
+        self._connections, self._workers = [], []
+        for index in range(self.processes):
+            parent, child = _CONTEXT.Pipe()
+            worker = _CONTEXT.Process(target=_worker,
+                                args=(index, names, shapes, barrier, child,
+                                      (rule.birth_bits, rule.survive_bits)),
+                                daemon=True)
+            worker.start()
+            self._connections.append(parent)
+            self._workers.append(worker)
+        self._finalizer = weakref.finalize(self, _shutdown, self._workers,
+                                           self._connections, self._blocks)
+        # Wait until every worker is running and attached, so that starting them is
+        # not paid by (and timed as part of) the first advance().
+        for conn in self._connections:
+            conn.recv()
+        super().__init__(grid, rule)
+
+    @property
+    def grid(self):
+        return np.concatenate([strip[self._current, 1:-1] for strip in self._strips])
+
+    @grid.setter
+    def grid(self, value):
+        if value.shape != (self.rows, self.cols):
+            raise ValueError(f"Grid shape {value.shape} does not match the strips ({self.rows}, {self.cols})")
+        for (top, bottom), strip in zip(self.bounds, self._strips):
+            padded = strip[self._current]
+            padded[1:-1] = value[top:bottom]
+            padded[0] = value[(top - 1) % self.rows]
+            padded[-1] = value[bottom % self.rows]
+
+    def step(self):
+        self.advance(1)
+
+    def advance(self, steps):
+        for conn in self._connections:
+            conn.send(("advance", steps))
+        results = {conn.recv() for conn in self._connections}
+        self._current = results.pop()
+
+    def close(self):
+        """
+        Stop the worker processes and free the shared memory.
+        """
+        self._finalizer()
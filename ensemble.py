@@ -0,0 +1,191 @@
+"""
+Game of Life Ensemble Engine
+-------------------------------------------------------
+Steps many independent boards at once for parameter sweeps.
+
+A batch is a 3-D (batch, rows, cols) uint8 array advanced by a single compiled
+call, parallelized over the batch axis. Each board stops on its own as soon as it
+dies out, becomes still, or starts oscillating, so finished boards drop out of the
+work while the others keep running.
+
+Usage:
+    ensemble = Ensemble.random(batch=1000, rows=128, cols=128,
+                               prob_alive=np.linspace(0.05, 0.5, 1000), seed=0)
+    ensemble.run(5000)
+    print(ensemble.summary())
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import numpy as np
+from numba import njit, prange
+from rules import as_rule
+from simulation import pin_threading_layer
+
+pin_threading_layer()
+
+# Per-board status codes.
+RUNNING, EXTINCT, STILL, OSCILLATING = 0, 1, 2, 3
+STATUS_NAMES = {RUNNING: "running", EXTINCT: "extinct", STILL: "still", OSCILLATING: "oscillating"}
+
+@njit(parallel=True, cache=True)
+def advance_batch(boards, buffer, steps, status, generation, period,
+                  zobrist, history, history_generation, table):
+    """
+    Advance every running board of a batch by up to `steps` generations.
+
+    A board stops early when it is extinct, still, or when its Zobrist hash matches
+    one of the previous `history.shape[1]` generations (oscillating; the period is
+    recorded). Final states are always left in `boards`.
+
+    Parameters:
+    - boards (np.ndarray): (batch, rows, cols) uint8 boards, updated in place.
+    - buffer (np.ndarray): Scratch array with the same shape as boards.
+    - steps (int): Maximum number of generations to compute.
+    - status (np.ndarray): Per-board status codes, updated in place.
+    - generation (np.ndarray): Per-board generation counters, updated in place.
+    - period (np.ndarray): Per-board oscillation periods, set when a cycle is found.
+    - zobrist (np.ndarray): (rows, cols) uint64 random keys for board hashing.
+    - history (np.ndarray): (batch, max_period) uint64 ring buffer of recent hashes.
+    - history_generation (np.ndarray): (batch, max_period) generations of those hashes,
+      -1 for empty slots.
+    - table (np.ndarray): Two-state rule lookup table, see rules.Rule.
+    """
+    batch, rows, cols = boards.shape
+    max_period = history.shape[1]
+
+    for b in prange(batch):
+        if status[b] != RUNNING:
+            continue
+        current = boards[b]
+        spare = buffer[b]
+        in_buffer = False
+
+        for _ in range(steps):
+            population = 0
+            changed = False
+            board_hash = np.uint64(0)
+            for x in range(rows):
+                above = current[(x - 1) % rows]
+                row = current[x]
+                below = current[(x + 1) % rows]
+                target = spare[x]
+                for y in range(cols):
+                    west = y - 1 if y > 0 else cols - 1
+                    east = y + 1 if y < cols - 1 else 0
+                    total = (above[west] + above[y] + above[east]
+                             + row[west] + row[east]
+                             + below[west] + below[y] + below[east])
+                    alive = table[row[y], total]
+                    target[y] = alive
+                    if alive:
+                        population += 1
+                        board_hash ^= zobrist[x, y]
+                    if alive != row[y]:
+                        changed = True
+
+            current, spare = spare, current
+            in_buffer = not in_buffer
+            generation[b] += 1
+
+            if population == 0:
+                status[b] = EXTINCT
+                break
+            if not changed:
+                status[b] = STILL
+                period[b] = 1
+                break
+            found = False
+            for k in range(max_period):
+                if history_generation[b, k] >= 0 and history[b, k] == board_hash:
+                    status[b] = OSCILLATING
+                    period[b] = generation[b] - history_generation[b, k]
+                    found = True
+                    break
+            if found:
+                break
+            slot = generation[b] % max_period
+            history[b, slot] = board_hash
+            history_generation[b, slot] = generation[b]
+
+        if in_buffer:
+            boards[b, :, :] = current
+
+class Ensemble:
+    """
+    Batch of independent boards advanced together.
+
+    Parameters:
+    - boards (np.ndarray): (batch, rows, cols) array of 0s and 1s, copied.
+    - max_period (int): Longest oscillation period detected.
+    - seed (int, optional): Seed for the Zobrist hash keys.
+    - rule (Rule or str, optional): Two-state rule without B0, Conway's Life by default.
+    """
+    def __init__(self, boards, max_period=16, seed=0, rule=None):
+        self.rule = as_rule(rule)
+        if self.rule.is_generations or 0 in self.rule.birth:
+            # Extinction and the live-cell hash are only final for such rules.
+            raise ValueError(f"Ensembles need a two-state rule without B0, got {self.rule}")
+        # Always a copy: run() updates the boards in place.
+        self.boards = np.array(boards, dtype=np.uint8, order="C", copy=True)
+        batch, rows, cols = self.boards.shape
+        self._buffer = np.empty_like(self.boards)
+        self.status = np.full(batch, RUNNING, dtype=np.int8)
+        self.generation = np.zeros(batch, dtype=np.int64)
+        self.period = np.zeros(batch, dtype=np.int64)
+
+        rng = np.random.default_rng(seed)
+        self._zobrist = rng.integers(0, 2 ** 64, size=(rows, cols), dtype=np.uint64)
+        self._history = np.zeros((batch, max_period), dtype=np.uint64)
+        self._history_generation = np.full((batch, max_period), -1, dtype=np.int64)
+
+    @classmethod
+    def random(cls, batch, rows, cols, prob_alive=0.2, seed=None, max_period=16, rule=None):
+        """
+        Create a batch of random boards.
+
+        Parameters:
+        - batch (int): Number of boards.
+        - rows (int): Number of rows of each board.
+        - cols (int): Number of columns of each board.
+        - prob_alive (float or np.ndarray): Probability a cell is alive, either one value
+          or one value per board.
+        - seed (int, optional): Seed for the boards and the hash keys.
+        - max_period (int): Longest oscillation period detected.
+        - rule (Rule or str, optional): Two-state rule without B0.
+
+        Returns:
+        - Ensemble: New ensemble.
+        """
+        rng = np.random.default_rng(seed)
+        probabilities = np.broadcast_to(np.asarray(prob_alive, dtype=np.float64), (batch,))
+        boards = rng.random((batch, rows, cols)) < probabilities[:, None, None]
+        return cls(boards, max_period=max_period, seed=seed, rule=rule)
+
+    @property
+    def active(self):
+        """
+        Indices of the boards that are still running.
+        """
+        return np.flatnonzero(self.status == RUNNING)
+
+    def run(self, steps):
+        """
+        Advance every running board by up to `steps` generations in one compiled call.
+
+        Parameters:
+        - steps (int): Maximum number of generations per board.
+        """
+        advance_batch(self.boards, self._buffer, steps, self.status, self.generation,
+                      self.period, self._zobrist, self._history, self._history_generation,
+                      self.rule.table)
+
+    def summary(self):
+        """
+        Count boards per status.
+
+        Returns:
+        - dict: Status name -> number of boards.
+        """
+        return {name: int(np.count_nonzero(self.status == code))
+                for code, name in STATUS_NAMES.items()}
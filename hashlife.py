@@ -0,0 +1,475 @@
+"""
+Game of Life HashLife Engine
+-------------------------------------------------------
+Gosper's HashLife algorithm for fast-forwarding large, structured patterns.
+
+The universe is an unbounded plane stored as a quadtree of canonical nodes: identical
+sub-patterns are shared, and the future of every node is memoized, so patterns with
+repeating structure (guns, breeders, oscillators) can be advanced by 2^k generations
+in a single step. The node table is bounded and garbage collected when it grows past
+`max_nodes`.
+
+Unlike the dense backends, the universe does not wrap around: cells that leave the
+initial window keep travelling and are simply outside the displayed area.
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import numpy as np
+from rules import as_rule
+from simulation import Backend
+
+class Node:
+    """
+    Quadtree node. Level 0 nodes are single cells; a level k node is a 2^k x 2^k
+    square made of four level k-1 quadrants. Nodes are canonical: two nodes with the
+    same contents are the same object, so identity is used for hashing.
+    """
+    __slots__ = ("level", "nw", "ne", "sw", "se", "population")
+
+    def __init__(self, level, nw, ne, sw, se, population):
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.population = population
+
+DEAD = Node(0, None, None, None, None, 0)
+ALIVE = Node(0, None, None, None, None, 1)
+
+class HashLife:
+    """
+    Unbounded Game of Life universe advanced with memoized quadtree results.
+
+    The root node is always centred on the origin; cell (row, col) of a grid loaded
+    with from_grid() sits at plane coordinates (row, col).
+
+    Parameters:
+    - max_nodes (int): Node table size that triggers a garbage collection.
+    - rule (Rule or str, optional): Two-state rule without B0, Conway's Life by default.
+    """
+    def __init__(self, max_nodes=1_000_000, rule=None):
+        self.rule = as_rule(rule)
+        if self.rule.is_generations or 0 in self.rule.birth:
+            raise ValueError(f"HashLife needs a two-state rule without B0, got {self.rule}")
+        self.max_nodes = max_nodes
+        self.generation = 0
+        self._nodes = {}
+        self._results = {}
+        self._empty = [DEAD]
+        self._level2 = {}
+        self._digests = {}
+        self.root = self.empty(3)
+
+    @classmethod
+    def from_grid(cls, grid, max_nodes=1_000_000, rule=None):
+        """
+        Build a universe holding a dense grid at rows [0, rows) and columns [0, cols).
+
+        Parameters:
+        - grid (np.ndarray): Dense grid (2D array of 0s and 1s).
+        - max_nodes (int): Node table size that triggers a garbage collection.
+        - rule (Rule or str, optional): Two-state rule without B0.
+
+        Returns:
+        - HashLife: New universe.
+        """
+        universe = cls(max_nodes, rule)
+        universe.set_grid(grid)
+        return universe
+
+    def join(self, nw, ne, sw, se):
+        """
+        Return the canonical node made of four quadrants.
+        """
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            node = Node(nw.level + 1, nw, ne, sw, se,
+                        nw.population + ne.population + sw.population + se.population)
+            self._nodes[key] = node
+        return node
+
+    def empty(self, level):
+        """
+        Return the canonical empty node of the given level.
+        """
+        while len(self._empty) <= level:
+            smaller = self._empty[-1]
+            self._empty.append(self.join(smaller, smaller, smaller, smaller))
+        return self._empty[level]
+
+    @property
+    def population(self):
+        """
+        Number of live cells in the universe.
+        """
+        return self.root.population
+
+    def set_grid(self, grid):
+        """
+        Replace the universe contents with a dense grid placed at the origin.
+
+        Level-2 (4x4) nodes are built directly from 16-bit block keys computed with
+        NumPy, and the tree is then assembled bottom-up.
+
+        Parameters:
+        - grid (np.ndarray): Dense grid (2D array of 0s and 1s).
+        """
+        rows, cols = grid.shape
+        level = 3
+        while (1 << (level - 1)) < max(rows, cols):
+            level += 1
+        half = 1 << (level - 1)
+
+        quadrant = np.zeros((half, half), dtype=np.int64)
+        quadrant[:rows, :cols] = grid != 0
+        blocks = half // 4
+        weights = 1 << np.arange(16, dtype=np.int64)
+        keys = (quadrant.reshape(blocks, 4, blocks, 4).transpose(0, 2, 1, 3)
+                .reshape(blocks, blocks, 16) @ weights)
+
+        layer = [[self._level2_node(int(key)) for key in key_row] for key_row in keys]
+        while len(layer) > 1:
+            layer = [[self.join(layer[2 * i][2 * j], layer[2 * i][2 * j + 1],
+                                layer[2 * i + 1][2 * j], layer[2 * i + 1][2 * j + 1])
+                      for j in range(len(layer) // 2)]
+                     for i in range(len(layer) // 2)]
+
+        empty = self.empty(level - 1)
+        self.root = self.join(empty, empty, empty, layer[0][0])
+
+    @property
+    def cells(self):
+        """
+        (rows, cols) plane coordinate arrays of the live cells.
+        """
+        rows, cols = [], []
+        half = 1 << (self.root.level - 1)
+        stack = [(self.root, -half, -half)]
+        while stack:
+            node, y, x = stack.pop()
+            if node.population == 0:
+                continue
+            if node.level == 0:
+                rows.append(y)
+                cols.append(x)
+                continue
+            half = 1 << (node.level - 1)
+            stack.extend(((node.nw, y, x), (node.ne, y, x + half),
+                          (node.sw, y + half, x), (node.se, y + half, x + half)))
+        return np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64)
+
+    def set_cells(self, rows, cols):
+        """
+        Replace the universe contents with live cells at plane coordinates.
+
+        Parameters:
+        - rows (np.ndarray): Row coordinates.
+        - cols (np.ndarray): Column coordinates.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        level = 3
+        if rows.size:
+            extent = max(-rows.min(), rows.max() + 1, -cols.min(), cols.max() + 1)
+            while (1 << (level - 1)) < extent:
+                level += 1
+        half = 1 << (level - 1)
+        self.root = self._build(level, rows + half, cols + half)
+
+    def _build(self, level, rows, cols):
+        """
+        Node of the given level whose live cells are at (rows, cols), relative to its
+        top-left corner.
+        """
+        if rows.size == 0:
+            return self.empty(level)
+        if level == 2:
+            return self._level2_node(int(np.bitwise_or.reduce(np.left_shift(1, 4 * rows + cols))))
+        half = 1 << (level - 1)
+        south = rows >= half
+        east = cols >= half
+        quadrants = []
+        for in_south, in_east in ((False, False), (False, True), (True, False), (True, True)):
+            inside = (south == in_south) & (east == in_east)
+            quadrants.append(self._build(level - 1, rows[inside] - half * in_south,
+                                         cols[inside] - half * in_east))
+        return self.join(*quadrants)
+
+    def _level2_node(self, key):
+        """
+        Return the 4x4 node whose cell (i, j) is bit 4 * i + j of key.
+        """
+        node = self._level2.get(key)
+        if node is None:
+            cells = [ALIVE if key >> bit & 1 else DEAD for bit in range(16)]
+            quads = [self.join(cells[i], cells[i + 1], cells[i + 4], cells[i + 5])
+                     for i in (0, 2, 8, 10)]
+            node = self.join(*quads)
+            self._level2[key] = node
+        return node
+
+    def to_grid(self, top, left, rows, cols):
+        """
+        Extract a dense window of the universe.
+
+        Parameters:
+        - top (int): Plane row of the window's first row.
+        - left (int): Plane column of the window's first column.
+        - rows (int): Window height.
+        - cols (int): Window width.
+
+        Returns:
+        - np.ndarray: Dense uint8 array of shape (rows, cols).
+        """
+        grid = np.zeros((rows, cols), dtype=np.uint8)
+        half = 1 << (self.root.level - 1)
+        self._fill(grid, self.root, -half - top, -half - left)
+        return grid
+
+    def _fill(self, grid, node, y, x):
+        """
+        Write the live cells of node, whose top-left corner is at window position
+        (y, x), into grid.
+        """
+        size = 1 << node.level
+        rows, cols = grid.shape
+        if node.population == 0 or y >= rows or x >= cols or y + size <= 0 or x + size <= 0:
+            return
+        if node.level == 1:
+            for dy, dx, cell in ((0, 0, node.nw), (0, 1, node.ne), (1, 0, node.sw), (1, 1, node.se)):
+                if cell.population and 0 <= y + dy < rows and 0 <= x + dx < cols:
+                    grid[y + dy, x + dx] = 1
+            return
+        half = size >> 1
+        self._fill(grid, node.nw, y, x)
+        self._fill(grid, node.ne, y, x + half)
+        self._fill(grid, node.sw, y + half, x)
+        self._fill(grid, node.se, y + half, x + half)
+
+    def _centre(self, node):
+        """
+        Level k-1 node at the centre of a level k node.
+        """
+        return self.join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def _expand(self, node):
+        """
+        Level k+1 node with node at its centre and an empty border.
+        """
+        border = self.empty(node.level - 1)
+        return self.join(self.join(border, border, border, node.nw),
+                         self.join(border, border, node.ne, border),
+                         self.join(border, node.sw, border, border),
+                         self.join(node.se, border, border, border))
+
+    @staticmethod
+    def _is_padded(node):
+        """
+        True if every live cell of node lies in its central half.
+        """
+        return (node.nw.population == node.nw.se.population
+                and node.ne.population == node.ne.sw.population
+                and node.sw.population == node.sw.ne.population
+                and node.se.population == node.se.nw.population)
+
+    def _life_4x4(self, node):
+        """
+        Centre 2x2 of a 4x4 node after one generation.
+        """
+        table = self.rule.table
+        cells = [[node.nw.nw, node.nw.ne, node.ne.nw, node.ne.ne],
+                 [node.nw.sw, node.nw.se, node.ne.sw, node.ne.se],
+                 [node.sw.nw, node.sw.ne, node.se.nw, node.se.ne],
+                 [node.sw.sw, node.sw.se, node.se.sw, node.se.se]]
+        result = []
+        for y in (1, 2):
+            for x in (1, 2):
+                total = sum(cells[y + dy][x + dx].population
+                            for dy in (-1, 0, 1) for dx in (-1, 0, 1)) - cells[y][x].population
+                result.append(ALIVE if table[cells[y][x].population, total] else DEAD)
+        return self.join(*result)
+
+    def _successor(self, node, j):
+        """
+        Centre of a level k node advanced by 2^j generations, j <= k - 2 (memoized).
+
+        Returns:
+        - Node: Level k-1 node.
+        """
+        if node.population == 0:
+            return self.empty(node.level - 1)
+        key = (node, j)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            n00 = nw
+            n01 = self.join(nw.ne, ne.nw, nw.se, ne.sw)
+            n02 = ne
+            n10 = self.join(nw.sw, nw.se, sw.nw, sw.ne)
+            n11 = self.join(nw.se, ne.sw, sw.ne, se.nw)
+            n12 = self.join(ne.sw, ne.se, se.nw, se.ne)
+            n20 = sw
+            n21 = self.join(sw.ne, se.nw, sw.se, se.sw)
+            n22 = se
+            if j == node.level - 2:
+                # Two half-steps of 2^(k-3) generations each.
+                n00, n01, n02, n10, n11, n12, n20, n21, n22 = (
+                    self._successor(n, j - 1)
+                    for n in (n00, n01, n02, n10, n11, n12, n20, n21, n22))
+            else:
+                n00, n01, n02, n10, n11, n12, n20, n21, n22 = (
+                    self._centre(n) for n in (n00, n01, n02, n10, n11, n12, n20, n21, n22))
+            step = min(j, node.level - 3)
+            result = self.join(self._successor(self.join(n00, n01, n10, n11), step),
+                               self._successor(self.join(n01, n02, n11, n12), step),
+                               self._successor(self.join(n10, n11, n20, n21), step),
+                               self._successor(self.join(n11, n12, n21, n22), step))
+
+        self._results[key] = result
+        return result
+
+    def step_pow2(self, j):
+        """
+        Advance the universe by 2^j generations.
+
+        Parameters:
+        - j (int): Base-2 logarithm of the number of generations.
+        """
+        root = self.root
+        while root.level < j + 2 or not self._is_padded(root):
+            root = self._expand(root)
+        root = self._successor(self._expand(root), j)
+        while root.level > 3 and self._is_padded(root):
+            root = self._centre(root)
+        self.root = root
+        self.generation += 1 << j
+        if len(self._nodes) > self.max_nodes:
+            self.collect()
+
+    def advance(self, generations):
+        """
+        Advance the universe by any number of generations, using one 2^j jump per
+        set bit of the count.
+
+        Parameters:
+        - generations (int): Number of generations.
+        """
+        j = 0
+        while generations:
+            if generations & 1:
+                self.step_pow2(j)
+            generations >>= 1
+            j += 1
+
+    def collect(self):
+        """
+        Garbage collect the node table: keep only nodes reachable from the root and
+        drop all memoized results.
+        """
+        reachable = {}
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.level == 0:
+                continue
+            key = (node.nw, node.ne, node.sw, node.se)
+            if key in reachable:
+                continue
+            reachable[key] = node
+            stack.extend(key)
+        self._nodes = reachable
+        self._results = {}
+        self._empty = [DEAD]
+        self._level2 = {}
+        self._digests = {}
+
+    def _digest(self, node):
+        """
+        Hash of a node's contents (memoized). Unlike node identity, it does not change
+        when a garbage collection rebuilds nodes with the same contents.
+        """
+        if node.level == 0:
+            return node.population
+        digest = self._digests.get(node)
+        if digest is None:
+            digest = hash((node.level, self._digest(node.nw), self._digest(node.ne),
+                           self._digest(node.sw), self._digest(node.se)))
+            self._digests[node] = digest
+        return digest
+
+    def fingerprint(self):
+        """
+        64-bit fingerprint of the whole universe.
+
+        The root is first shrunk to the smallest centred node holding every live cell,
+        so the same pattern gives the same fingerprint whatever the padding around it.
+        As the root is centred on the origin, its level fixes its position: equal
+        fingerprints mean the same cells at the same plane coordinates.
+
+        Returns:
+        - int: Fingerprint.
+        """
+        root = self.root
+        while root.level > 3 and self._is_padded(root):
+            root = self._centre(root)
+        return hash((root.level, self._digest(root))) & 0xFFFFFFFFFFFFFFFF
+
+class HashLifeBackend(Backend):
+    """
+    HashLife universe exposed as a backend. `grid` is the window of the unbounded
+    plane covering the initial board; cells outside it keep evolving. Assigning
+    `grid` (e.g. editing a cell) replaces the universe with the window contents.
+
+    Parameters:
+    - grid (np.ndarray): Initial dense grid.
+    - rule (Rule or str, optional): Two-state rule without B0, Conway's Life by default.
+    - max_nodes (int): Node table size that triggers a garbage collection.
+    """
+    supports_birth_on_zero = False
+
+    def __init__(self, grid, rule=None, max_nodes=1_000_000):
+        self.universe = HashLife(max_nodes, rule)
+        super().__init__(grid, rule)
+
+    @property
+    def grid(self):
+        return self.universe.to_grid(0, 0, self.rows, self.cols)
+
+    @grid.setter
+    def grid(self, value):
+        self.rows, self.cols = value.shape
+        self.universe.set_grid(value)
+
+    def snapshot(self):
+        # Nodes are immutable: the root is a snapshot of the whole universe.
+        return self.universe.root
+
+    def live_cells(self):
+        return self.universe.cells
+
+    def set_live_cells(self, rows, cols):
+        self.universe.set_cells(rows, cols)
+
+    def fingerprint(self):
+        # The window misses cells that left it: hash the whole universe instead.
+        return self.universe.fingerprint()
+
+    def expand(self, snapshot):
+        grid = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        half = 1 << (snapshot.level - 1)
+        self.universe._fill(grid, snapshot, -half, -half)
+        return grid
+
+    def step(self):
+        self.universe.advance(1)
+
+    def advance(self, steps):
+        self.universe.advance(steps)
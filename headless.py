@@ -0,0 +1,224 @@
+"""
+Headless Batch Runner for Game of Life
+---------------------------------------
+Runs a simulation from the command line without matplotlib or a display.
+Only the modules needed by the chosen backend are imported (the NumPy backend
+never imports Numba).
+
+Usage:
+    python headless.py --size 1024 --steps 500 --seed 42 --backend numba --output final.npy
+    python headless.py --steps 10000 --record run.golrec --record-every 10
+    python headless.py --steps 1000000 --checkpoint run.ckpt.npz --checkpoint-every 10000
+    python headless.py --steps 1000000 --resume run.ckpt.npz --checkpoint run.ckpt.npz
+    python headless.py --size 2048 --pattern gosperglidergun.rle --steps 1000 --output final.rle
+    python headless.py --size 4096 --steps 100000 --backend numba --metrics life.prom --metrics-every 100
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import argparse
+import os
+import time
+import numpy as np
+from checkpoint import Checkpointer, restore
+from metrics import Metrics
+from patterns import WRITERS, load_pattern, place, save_pattern
+from recorder import CODECS, Recorder
+from rules import NAMED_RULES, as_rule
+from simulation import BACKENDS, Simulation
+from warmup import KERNEL_BACKENDS, precompile
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+
+    Parameters:
+    - argv (list of str, optional): Arguments to parse, defaults to sys.argv[1:].
+
+    Returns:
+    - argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Run a Game of Life simulation without a GUI.")
+    parser.add_argument("--size", type=int, default=512, help="Grid size N for an NxN board.")
+    parser.add_argument("--rows", type=int, help="Number of rows (overrides --size).")
+    parser.add_argument("--cols", type=int, help="Number of columns (overrides --size).")
+    parser.add_argument("--steps", type=int, default=100, help="Number of generations to run.")
+    parser.add_argument("--seed", type=int, help="Seed for the random initial state.")
+    parser.add_argument("--prob-alive", type=float, default=0.2,
+                        help="Probability a cell is initially alive.")
+    parser.add_argument("--rule",
+                        help="Rule in B/S notation (e.g. B36/S23, B2/S/C3) or one of "
+                             f"{', '.join(NAMED_RULES)}. Defaults to the rule named in the "
+                             "--pattern file, or B3/S23.")
+    parser.add_argument("--backend", default="numpy", choices=sorted(BACKENDS),
+                        help="Stepping engine.")
+    parser.add_argument("--backend-option", action="append", default=[], metavar="KEY=VALUE",
+                        help="Extra backend setting, e.g. boundary=dead (repeatable).")
+    parser.add_argument("--on-cycle", choices=["stop", "fast_forward"],
+                        help="Detect repeated boards and stop, or skip whole periods.")
+    parser.add_argument("--pattern", metavar="PATH",
+                        help="Start from a pattern file (.rle, .cells, .lif) instead of a random board.")
+    parser.add_argument("--pattern-offset", metavar="ROW,COL",
+                        help="Grid position of the pattern's top-left corner (default: centred).")
+    parser.add_argument("--output", help="File receiving the final grid: .npy, or a pattern "
+                                         "format (.rle, .cells, .lif).")
+    parser.add_argument("--record", metavar="PATH", help="Stream generations to a recording file.")
+    parser.add_argument("--record-every", type=int, default=1,
+                        help="Record one generation out of N.")
+    parser.add_argument("--keyframe-interval", type=int, default=64,
+                        help="Number of recorded frames between two keyframes.")
+    parser.add_argument("--codec", default="zlib", choices=sorted(CODECS),
+                        help="Compression of the recorded frames.")
+    parser.add_argument("--checkpoint", metavar="PATH",
+                        help="Save periodic checkpoints to this .npz file.")
+    parser.add_argument("--checkpoint-every", type=int, default=10000,
+                        help="Generations between two checkpoints.")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="Export step time, throughput and population to a Prometheus "
+                             "text file.")
+    parser.add_argument("--metrics-every", type=int, default=100,
+                        help="Generations between two metric samples.")
+    parser.add_argument("--resume", metavar="PATH",
+                        help="Resume from a checkpoint (board, rule, backend and generation "
+                             "come from the file) and run --steps more generations.")
+    return parser.parse_args(argv)
+
+def parse_backend_options(pairs):
+    """
+    Convert KEY=VALUE strings into backend keyword arguments.
+    Integer-looking values are converted to int.
+
+    Parameters:
+    - pairs (list of str): Strings of the form KEY=VALUE.
+
+    Returns:
+    - dict: Backend keyword arguments.
+    """
+    options = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise SystemExit(f"Invalid backend option {pair!r}, expected KEY=VALUE")
+        options[key.replace("-", "_")] = int(value) if value.lstrip("-").isdigit() else value
+    return options
+
+def choose_rule(requested, pattern, path):
+    """
+    Rule of a run: --rule if given, otherwise the rule named in the pattern file,
+    otherwise Conway's Life. Warns when --rule differs from the file's rule, or when
+    the file's rule cannot be parsed.
+
+    Parameters:
+    - requested (str or None): Value of --rule.
+    - pattern (Pattern or None): Loaded pattern, if any.
+    - path (str or None): Pattern file, for the messages.
+
+    Returns:
+    - Rule: Rule to run.
+    """
+    rule = as_rule(requested)
+    if pattern is None or pattern.rule is None:
+        return rule
+    try:
+        file_rule = as_rule(pattern.rule)
+    except ValueError:
+        print(f"warning: ignoring the unrecognised rule {pattern.rule!r} of {path}, running {rule}")
+        return rule
+    if requested is None:
+        print(f"rule {file_rule} from {path}")
+        return file_rule
+    if file_rule != rule:
+        print(f"warning: --rule {rule} overrides the rule {file_rule} of {path}")
+    return rule
+
+def main(argv=None):
+    """
+    Run the simulation described by the command line and report timings.
+
+    Parameters:
+    - argv (list of str, optional): Arguments to parse, defaults to sys.argv[1:].
+    """
+    args = parse_args(argv)
+    rows = args.rows or args.size
+    cols = args.cols or args.size
+
+    start = time.perf_counter()
+    if args.resume:
+        sim = restore(args.resume)
+        rows, cols = sim.rows, sim.cols
+        print(f"resumed from {args.resume} at generation {sim.generation}")
+    else:
+        pattern = load_pattern(args.pattern) if args.pattern else None
+        sim = Simulation(rows, cols, random_init=pattern is None, prob_alive=args.prob_alive,
+                         backend=args.backend, seed=args.seed,
+                         backend_options=parse_backend_options(args.backend_option),
+                         rule=choose_rule(args.rule, pattern, args.pattern))
+        if pattern is not None:
+            if args.pattern_offset:
+                top, left = (int(value) for value in args.pattern_offset.split(","))
+            else:
+                top, left = (rows - pattern.shape[0]) // 2, (cols - pattern.shape[1]) // 2
+            sim.grid = place(sim.grid, pattern, top, left)
+    if args.checkpoint:
+        sim.checkpointer = Checkpointer(args.checkpoint, every=args.checkpoint_every)
+    if args.metrics:
+        sim.metrics = Metrics(every=args.metrics_every, prometheus_path=args.metrics)
+    if args.record:
+        sim.recorder = Recorder(args.record, sim.rows, sim.cols, states=sim.rule.states,
+                                every=args.record_every,
+                                keyframe_interval=args.keyframe_interval, codec=args.codec)
+    setup_time = time.perf_counter() - start
+
+    # Compile (or load from Numba's cache) the backend's kernels before timing the run.
+    compile_time = 0.0
+    if sim.backend_name in KERNEL_BACKENDS:
+        report = precompile([sim.backend_name], [sim.rule], ensemble=False, direct=False)
+        compile_time = sum(entry["compile_seconds"] for entry in report)
+
+    start = time.perf_counter()
+    computed = sim.run(args.steps, on_cycle=args.on_cycle)
+    run_time = time.perf_counter() - start
+    if sim.recorder is not None:
+        sim.recorder.close()
+
+    grid = sim.grid
+    print(f"backend={sim.backend_name} rule={sim.rule} grid={rows}x{cols} steps={args.steps} "
+          f"setup={setup_time:.4f}s compile={compile_time:.4f}s run={run_time:.4f}s population={int(np.count_nonzero(grid))} "
+          f"seed={sim.seed}")
+
+    if sim.cycle is not None:
+        print(f"cycle detected: start={sim.cycle.start} period={sim.cycle.period} "
+              f"generations computed={computed} final generation={sim.generation}")
+
+    if sim.recorder is not None:
+        print(f"recorded {sim.recorder.frames} generations to {args.record} "
+              f"({sim.recorder.bytes_written} bytes)")
+
+    if sim.checkpointer is not None:
+        report = sim.checkpointer.report()
+        share = report["total_seconds"] / run_time if run_time else 0.0
+        print(f"checkpoints: {report['count']} saved to {args.checkpoint}, "
+              f"mean={report['mean_seconds']:.4f}s max={report['max_seconds']:.4f}s "
+              f"size={report['last_bytes']} bytes ({share:.1%} of run time)")
+
+    if sim.metrics is not None:
+        sim.metrics.export(sim)
+        summary = sim.metrics.summary()
+        print(f"metrics: {summary['samples']} samples exported to {args.metrics}, "
+              f"{summary['generations_per_second']:,.0f} gen/s in the backend "
+              f"({summary['seconds'] / run_time if run_time else 0.0:.1%} of run time)")
+
+    active_counts = getattr(sim.backend, "active_counts", None)
+    if active_counts:
+        print(f"active blocks: first={active_counts[0]} last={active_counts[-1]} "
+              f"of {sim.backend.total_blocks}")
+
+    if args.output:
+        if os.path.splitext(args.output)[1].lower() in WRITERS:
+            save_pattern(grid, args.output, rule=sim.rule)
+        else:
+            np.save(args.output, grid)
+        print(f"Final grid saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
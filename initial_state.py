@@ -0,0 +1,109 @@
+"""
+Game of Life Initial States
+-------------------------------------------------------
+Fast, reproducible random boards.
+
+Cells are sampled 64 at a time: the alive probability is rounded to PROBABILITY_BITS
+binary digits, and one random uint64 word per digit is folded into the result with
+AND (digit 0) or OR (digit 1), from the lowest set digit up. Each bit of the result
+is then 1 with exactly the rounded probability, at a cost of at most
+PROBABILITY_BITS / 64 random words per cell instead of one float64 per cell.
+prob_alive = 0.5 needs a single word per 64 cells.
+
+The board is split into fixed bands of CHUNK_CELLS cells. Every band gets its own
+np.random.Generator seeded from a child of one SeedSequence, and the bands are
+filled by a thread pool (NumPy releases the GIL while drawing). Band boundaries do
+not depend on the number of workers, so a seed always gives the same board.
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# Binary digits of the alive probability used for sampling (resolution 2**-16).
+PROBABILITY_BITS = 16
+# Cells per independently seeded band.
+CHUNK_CELLS = 1 << 22
+
+def bernoulli_words(rng, words, prob_alive, bits=PROBABILITY_BITS):
+    """
+    Random uint64 words whose bits are independently 1 with probability prob_alive
+    (rounded to `bits` binary digits).
+
+    Parameters:
+    - rng (np.random.Generator): Source of random words.
+    - words (int): Number of words to draw.
+    - prob_alive (float): Probability a bit is 1.
+    - bits (int): Binary digits of the probability.
+
+    Returns:
+    - np.ndarray: uint64 array of length words.
+    """
+    threshold = int(round(min(max(prob_alive, 0.0), 1.0) * (1 << bits)))
+    if threshold >= 1 << bits:
+        return np.full(words, np.iinfo(np.uint64).max, dtype=np.uint64)
+    result = np.zeros(words, dtype=np.uint64)
+    if threshold == 0:
+        return result
+    # Digits below the lowest set one would AND into zeros and can be skipped.
+    lowest = (threshold & -threshold).bit_length() - 1
+    for digit in range(lowest, bits):
+        draw = rng.integers(0, 1 << 64, size=words, dtype=np.uint64)
+        if threshold >> digit & 1:
+            result |= draw
+        else:
+            result &= draw
+    return result
+
+def random_fill(grid, prob_alive=0.2, seed=None, workers=None):
+    """
+    Fill a grid in place with random 0/1 cells, in parallel, independently seeded bands.
+
+    Parameters:
+    - grid (np.ndarray): Writable 2D array (any dtype, e.g. a memmap) to fill.
+    - prob_alive (float): Probability a cell is alive.
+    - seed (int, np.random.SeedSequence or None): Seed of the board; None draws fresh
+      entropy.
+    - workers (int, optional): Number of threads, defaults to the CPU count.
+
+    Returns:
+    - np.random.SeedSequence: Seed sequence used, whose `entropy` reproduces the board.
+    """
+    sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    rows, cols = grid.shape
+    band = max(1, CHUNK_CELLS // max(cols, 1))
+    tops = range(0, rows, band)
+    children = sequence.spawn(len(tops))
+
+    def fill(top, child):
+        bottom = min(top + band, rows)
+        cells = (bottom - top) * cols
+        words = bernoulli_words(np.random.Generator(np.random.PCG64(child)), -(-cells // 64),
+                                prob_alive)
+        bits = np.unpackbits(words.view(np.uint8), count=cells, bitorder="little")
+        grid[top:bottom] = bits.reshape(bottom - top, cols)
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        list(pool.map(fill, tops, children))
+    return sequence
+
+def random_grid(rows, cols, prob_alive=0.2, seed=None, dtype=np.uint8, workers=None):
+    """
+    New random board; see random_fill().
+
+    Parameters:
+    - rows (int): Number of rows.
+    - cols (int): Number of columns.
+    - prob_alive (float): Probability a cell is alive.
+    - seed (int, np.random.SeedSequence or None): Seed of the board.
+    - dtype (np.dtype): dtype of the board, e.g. a backend's `dtype`.
+    - workers (int, optional): Number of threads, defaults to the CPU count.
+
+    Returns:
+    - np.ndarray: Board of shape (rows, cols).
+    """
+    grid = np.empty((rows, cols), dtype=dtype)
+    random_fill(grid, prob_alive, seed, workers)
+    return grid
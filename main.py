@@ -1,129 +1,132 @@
 """
 Game of Life Implementation
 -------------------------------------------------------
-A Python implementation of Conway's Game of Life using NumPy and matplotlib for visualization.
+A Python implementation of Conway's Game of Life (and other Life-like rules) using NumPy and
+matplotlib for visualization.
+The default backend computes each generation with whole-array NumPy operations; the original
+per-cell loop is kept as the "loop" backend for profiling comparisons.
 
 Usage:
 - Run as a standalone script
 - Press SPACE to pause/resume animation
 - Left-click to activate a cell, Right-click to deactivate
 
+matplotlib is only imported when the interactive viewer is opened, so the simulation
+can be stepped from scripts and batch jobs without a display.
+
 Authors: Nathan Ghenassia, Maria Fernanda Camacho
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+from rules import as_rule
+from simulation import Backend, Simulation
 
-class GameOfLife:
+def compute_next_step(grid, rule=None):
     """
-    Class representing the Game of Life simulation.
+    Compute the next generation of the Game of Life grid with whole-array operations.
+
+    Neighbour counts are obtained by adding row- and column-rolled copies of the grid,
+    so the toroidal wrap is handled by np.roll instead of per-cell modulo slicing. The
+    rule is applied without branches: two-state rules shift the rule's bitmasks by the
+    block sum, Generations rules index the rule's [state, neighbours] table.
 
     Parameters:
-    - rows (int): Number of rows in the grid.
-    - cols (int): Number of columns in the grid.
-    - initial_state (2D list or np.ndarray, optional): User-defined initial state.
-    - random_init (bool): If True, initialize with random grid.
-    - prob_alive (float): Probability a cell is initially alive in random mode.
+    - grid (np.ndarray): Current state of the grid (2D array of cell states).
+    - rule (Rule or str, optional): Rule to apply, Conway's Life (B3/S23) by default.
+
+    Returns:
+    - np.ndarray: Updated grid after applying the rule, same dtype as grid.
     """
-    def __init__(self, rows, cols, initial_state=None, random_init=False, prob_alive=0.2):
-        self.rows = rows
-        self.cols = cols
-        self.paused = True
+    rule = as_rule(rule)
+    cells = grid.astype(np.uint8, copy=False)
+    alive = cells if not rule.is_generations else (cells == 1).view(np.uint8)
+    vertical = alive + np.roll(alive, 1, axis=0) + np.roll(alive, -1, axis=0)
+    # 3x3 block sum including the cell itself.
+    total = vertical + np.roll(vertical, 1, axis=1) + np.roll(vertical, -1, axis=1)
+
+    if not rule.is_generations:
+        next_grid = np.right_shift(np.uint16(rule.birth_bits), total) & (alive ^ 1)
+        next_grid |= np.right_shift(np.uint16(rule.survive_bits), total) & alive
+        return next_grid.astype(grid.dtype)
+
+    # Flat index into the table: 9 * state + live neighbours.
+    index = (total - alive).astype(np.uint16)
+    index += 9 * cells.astype(np.uint16)
+    return np.take(rule.table.ravel(), index).astype(grid.dtype, copy=False)
+
+def compute_next_step_loop(grid, rule=None):
+    """
+    Compute the next generation of the Game of Life grid with a per-cell Python loop.
 
-        if initial_state is not None:
-            self.grid = np.array(initial_state, dtype=int)
-        else:
-            self.grid = (
-                np.random.choice([0, 1], size=(rows, cols), p=[1 - prob_alive, prob_alive])
-                if random_init else
-                np.zeros((rows, cols), dtype=int)
-            )
+    Reference implementation, kept to reproduce the profiles in results/.
 
-        self.fig, self.ax = plt.subplots()
-        self.img = self.ax.imshow(self.grid, cmap='gray_r', vmin=0, vmax=1)
-        self.ax.set_title("Space: Pause/Resume | Left click: Alive | Right click: Dead")
+    Parameters:
+    - grid (np.ndarray): Current state of the grid (2D array of cell states).
+    - rule (Rule or str, optional): Rule to apply, Conway's Life (B3/S23) by default.
 
-        self.ani = FuncAnimation(self.fig, self.update, interval=100, blit=False)
-        self.fig.canvas.mpl_connect('button_press_event', self.on_click)
-        self.fig.canvas.mpl_connect('key_press_event', self.on_key)
+    Returns:
+    - np.ndarray: Updated grid after applying the rule.
+    """
+    rule = as_rule(rule)
+    rows, cols = grid.shape
+    new_grid = np.copy(grid)
+    for x in range(rows):
+        neighbour_rows = [(x - 1) % rows, x, (x + 1) % rows]
+        for y in range(cols):
+            neighbour_cols = [(y - 1) % cols, y, (y + 1) % cols]
+            total = np.sum(grid[np.ix_(neighbour_rows, neighbour_cols)] == 1) - (grid[x, y] == 1)
+            new_grid[x, y] = rule.table[grid[x, y], total]
+    return new_grid
+
+class NumpyBackend(Backend):
+    """
+    Dense uint8 grid stepped with the vectorized compute_next_step().
+    """
+    supports_generations = True
 
     def step(self):
-        """
-        Compute the next generation of the Game of Life grid.
+        self.grid = compute_next_step(self.grid, self.rule)
 
-        Parameters:
-        - grid (np.ndarray): Current state of the grid (2D array of 0s and 1s).
+class LoopBackend(Backend):
+    """
+    Dense int grid stepped with the per-cell reference loop compute_next_step_loop().
+    """
+    dtype = int
+    supports_generations = True
 
-        Returns:
-        - np.ndarray: Updated grid after applying Game of Life rules.
-        """
-        new_grid = np.copy(self.grid)
-        for x in range(self.rows):
-            for y in range(self.cols):
-                total = np.sum(
-                    self.grid[(x-1)%self.rows:(x+2)%self.rows,
-                              (y-1)%self.cols:(y+2)%self.cols]
-                ) - self.grid[x, y]
-
-                if self.grid[x, y] == 1:
-                    if total < 2 or total > 3:
-                        new_grid[x, y] = 0
-                elif total == 3:
-                    new_grid[x, y] = 1
-        self.grid = new_grid
-
-    def run(self, steps=None):
+    def step(self):
+        self.grid = compute_next_step_loop(self.grid, self.rule)
+
+class GameOfLife(Simulation):
+    """
+    Class representing the Game of Life simulation.
+
+    Parameters:
+    - rows (int): Number of rows in the grid.
+    - cols (int): Number of columns in the grid.
+    - initial_state (2D list or np.ndarray, optional): User-defined initial state.
+    - random_init (bool): If True, initialize with random grid.
+    - prob_alive (float): Probability a cell is initially alive in random mode.
+    - backend (str): Stepping engine, "numpy" (vectorized) or "loop" (per-cell reference).
+      Any backend registered in simulation.BACKENDS is accepted.
+    - seed (int, optional): Seed for the random initial state.
+    - backend_options (dict, optional): Extra keyword arguments for the backend.
+    - rule (Rule or str, optional): Rule in B/S notation, Conway's Life by default.
+    """
+    def run(self, steps=None, zoom=False):
         """
         Run the simulation.
 
         Parameters:
         - steps (int or None): Number of iterations to run. If None, runs interactively with GUI.
+        - zoom (bool): Use the zoomable level-of-detail viewer, for very large boards.
         """
         if steps is None:
-            plt.show()
+            from viewer import Viewer, ZoomViewer
+            self.viewer = ZoomViewer(self) if zoom else Viewer(self)
+            self.viewer.show()
         else:
-            for _ in range(steps):
-                self.step()
-
-    def update(self, frame):
-        """
-        Called by FuncAnimation for each animation frame.
-        Updates grid state and refreshes plot.
-        """
-        if not self.paused:
-            self.step()
-        self.img.set_data(self.grid)
-        return [self.img]
-
-    def on_click(self, event):
-        """
-        Mouse click event handler.
-        Left-click toggles cell alive, right-click sets it dead.
-        """
-        if event.inaxes != self.ax:
-            return
-        try:
-            x = int(round(event.xdata))
-            y = int(round(event.ydata))
-        except (TypeError, ValueError):
-            return
-
-        if 0 <= x < self.cols and 0 <= y < self.rows:
-            if event.button == 1:
-                self.grid[y, x] = 1
-            elif event.button == 3:
-                self.grid[y, x] = 0
-            self.img.set_data(self.grid)
-            self.fig.canvas.draw_idle()
-
-    def on_key(self, event):
-        """
-        Keyboard event handler. Pressing space toggles pause/resume.
-        """
-        if event.key == ' ':
-            self.paused = not self.paused
-            print("Running simulation..." if not self.paused else "Paused.")
+            super().run(steps)
 
     @staticmethod
     def ask_if_random(question):
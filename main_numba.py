@@ -3,6 +3,8 @@ Game of Life Implementation (with Numba Acceleration)
 -------------------------------------------------------
 A Python implementation of Conway's Game of Life using NumPy and matplotlib for visualization.
 Performance-optimized using Numba's JIT compiler with parallel execution.
+A bit-packed backend stores 64 cells per uint64 word and evaluates the rules with
+bitwise full-adder logic, cutting memory traffic by 8x compared to one uint8 per cell.
 
 Usage:
 - Run as a standalone script
@@ -13,23 +15,27 @@ Authors: Nathan Ghenassia, Maria Fernanda Camacho
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 from numba import njit, prange
+import main
+from rules import as_rule
+from simulation import Backend, pin_threading_layer
 
-@njit(parallel=True)
-def compute_next_step(grid):
+pin_threading_layer()
+
+@njit(parallel=True, cache=True)
+def compute_next_step_into(grid, out, table):
     """
-    Compute the next generation of the Game of Life grid using parallel loops.
+    Compute the next generation of the Game of Life grid into a caller-supplied array.
 
-    Parameters:
-    - grid (np.ndarray): Current state of the grid (2D array of 0s and 1s).
+    No memory is allocated, so two preallocated buffers can be swapped every generation.
 
-    Returns:
-    - np.ndarray: Updated grid after applying Game of Life rules.
+    Parameters:
+    - grid (np.ndarray): Current state of the grid (2D array of cell states).
+    - out (np.ndarray): Array of the same shape receiving the next generation.
+      Must not be the same array as grid.
+    - table (np.ndarray): Rule lookup table indexed by [state, live neighbours], see rules.Rule.
     """
     rows, cols = grid.shape
-    new_grid = np.copy(grid)
 
     for x in prange(rows):
         for y in range(cols):
@@ -40,142 +46,589 @@ def compute_next_step(grid):
                         continue
                     nx = (x + dx) % rows
                     ny = (y + dy) % cols
-                    total += grid[nx, ny]
+                    total += grid[nx, ny] == 1
 
-            if grid[x, y] == 1:
-                if total < 2 or total > 3:
-                    new_grid[x, y] = 0
-            elif total == 3:
-                new_grid[x, y] = 1
+            out[x, y] = table[grid[x, y], total]
 
+def compute_next_step(grid, rule=None):
+    """
+    Compute the next generation of the Game of Life grid using parallel loops.
+
+    Parameters:
+    - grid (np.ndarray): Current state of the grid (2D array of cell states).
+    - rule (Rule or str, optional): Rule to apply, Conway's Life (B3/S23) by default.
+
+    Returns:
+    - np.ndarray: Updated grid after applying the rule.
+    """
+    new_grid = np.empty_like(grid)
+    compute_next_step_into(grid, new_grid, as_rule(rule).table)
     return new_grid
 
-class GameOfLife:
+@njit(cache=True)
+def step_n(grid, n, buffer, table):
     """
-    Class representing the Game of Life simulation.
+    Advance the grid by n generations inside compiled code, alternating between two buffers.
+
+    Both arrays are overwritten; the caller keeps whichever one is returned.
 
     Parameters:
-    - rows (int): Number of rows in the grid.
-    - cols (int): Number of columns in the grid.
-    - initial_state (2D list or np.ndarray, optional): User-defined initial state.
-    - random_init (bool): If True, initialize with random grid.
-    - prob_alive (float): Probability a cell is initially alive in random mode.
+    - grid (np.ndarray): Current state of the grid (2D array of 0s and 1s).
+    - n (int): Number of generations to compute.
+    - buffer (np.ndarray): Scratch array with the same shape and dtype as grid.
+    - table (np.ndarray): Rule lookup table, see rules.Rule.
+
+    Returns:
+    - np.ndarray: grid or buffer, whichever holds generation n.
+    """
+    current, spare = grid, buffer
+    for _ in range(n):
+        compute_next_step_into(current, spare, table)
+        current, spare = spare, current
+    return current
+
+# Boundary modes of the halo-padded kernel.
+TOROIDAL, DEAD, REFLECT = 0, 1, 2
+BOUNDARIES = {"toroidal": TOROIDAL, "dead": DEAD, "reflect": REFLECT}
+
+def pad_grid(grid):
+    """
+    Copy a grid into a new array with a one-cell ghost border on every side.
+
+    Parameters:
+    - grid (np.ndarray): Dense grid (2D array of 0s and 1s).
+
+    Returns:
+    - np.ndarray: Array of shape (rows + 2, cols + 2) with grid in its interior.
+    """
+    rows, cols = grid.shape
+    padded = np.zeros((rows + 2, cols + 2), dtype=grid.dtype)
+    padded[1:-1, 1:-1] = grid
+    return padded
+
+@njit(cache=True)
+def fill_halo(padded, boundary):
+    """
+    Refresh the ghost border of a padded grid for the given boundary mode.
+
+    Rows are filled before columns so the corners pick up the diagonal neighbour.
+
+    Parameters:
+    - padded (np.ndarray): Padded grid, see pad_grid().
+    - boundary (int): TOROIDAL (wrap around), DEAD (cells outside are dead) or
+      REFLECT (cells outside mirror the edge cells).
+    """
+    rows = padded.shape[0] - 2
+    cols = padded.shape[1] - 2
+    if boundary == TOROIDAL:
+        padded[0, 1:cols + 1] = padded[rows, 1:cols + 1]
+        padded[rows + 1, 1:cols + 1] = padded[1, 1:cols + 1]
+        padded[:, 0] = padded[:, cols]
+        padded[:, cols + 1] = padded[:, 1]
+    elif boundary == REFLECT:
+        padded[0, 1:cols + 1] = padded[1, 1:cols + 1]
+        padded[rows + 1, 1:cols + 1] = padded[rows, 1:cols + 1]
+        padded[:, 0] = padded[:, 1]
+        padded[:, cols + 1] = padded[:, cols]
+    else:
+        padded[0, :] = 0
+        padded[rows + 1, :] = 0
+        padded[:, 0] = 0
+        padded[:, cols + 1] = 0
+
+@njit(parallel=True, cache=True)
+def compute_next_step_halo_into(padded, out, table):
+    """
+    Compute the next generation of the interior of a padded grid.
+
+    The ghost border must be up to date (see fill_halo()), so the stencil needs no
+    modulo arithmetic or branches and the inner loop can be vectorized.
+
+    Parameters:
+    - padded (np.ndarray): Current padded grid.
+    - out (np.ndarray): Padded array receiving the next generation in its interior.
+    - table (np.ndarray): Two-state rule lookup table, see rules.Rule.
+    """
+    rows = padded.shape[0] - 2
+    cols = padded.shape[1] - 2
+
+    for x in prange(1, rows + 1):
+        above = padded[x - 1]
+        row = padded[x]
+        below = padded[x + 1]
+        target = out[x]
+        for y in range(1, cols + 1):
+            # 3x3 block sum including the cell itself.
+            total = (above[y - 1] + above[y] + above[y + 1]
+                     + row[y - 1] + row[y] + row[y + 1]
+                     + below[y - 1] + below[y] + below[y + 1])
+            target[y] = table[row[y], total - row[y]]
+
+@njit(cache=True)
+def step_n_halo(padded, n, buffer, boundary, table):
+    """
+    Advance a padded grid by n generations, refreshing the ghost border once per generation.
+
+    Both arrays are overwritten; the caller keeps whichever one is returned.
+
+    Parameters:
+    - padded (np.ndarray): Current padded grid.
+    - n (int): Number of generations to compute.
+    - buffer (np.ndarray): Scratch array with the same shape and dtype as padded.
+    - boundary (int): TOROIDAL, DEAD or REFLECT.
+    - table (np.ndarray): Two-state rule lookup table, see rules.Rule.
+
+    Returns:
+    - np.ndarray: padded or buffer, whichever holds generation n.
+    """
+    current, spare = padded, buffer
+    for _ in range(n):
+        fill_halo(current, boundary)
+        compute_next_step_halo_into(current, spare, table)
+        current, spare = spare, current
+    return current
+
+@njit(parallel=True, cache=True)
+def compute_tiled_into(grid, out, tile_size, depth, table):
+    """
+    Advance the grid by `depth` generations in one memory pass using overlapping-halo
+    temporal blocking.
+
+    Each tile is copied with a halo of `depth` cells into a small local buffer that
+    stays in cache, stepped `depth` times (the valid region shrinks by one cell per
+    generation), and its interior is written to `out`. Tiles run in parallel.
+
+    Parameters:
+    - grid (np.ndarray): Current state of the grid (2D array of 0s and 1s).
+    - out (np.ndarray): Array of the same shape receiving generation +depth.
+      Must not be the same array as grid.
+    - tile_size (int): Edge length of the square tiles.
+    - depth (int): Number of generations computed per pass (time-block depth).
+    - table (np.ndarray): Two-state rule lookup table, see rules.Rule.
+    """
+    rows, cols = grid.shape
+    tiles_down = (rows + tile_size - 1) // tile_size
+    tiles_across = (cols + tile_size - 1) // tile_size
+
+    for t in prange(tiles_down * tiles_across):
+        top = (t // tiles_across) * tile_size
+        left = (t % tiles_across) * tile_size
+        height = min(tile_size, rows - top)
+        width = min(tile_size, cols - left)
+        local_rows = height + 2 * depth
+        local_cols = width + 2 * depth
+
+        current = np.empty((local_rows, local_cols), dtype=grid.dtype)
+        spare = np.empty_like(current)
+        for i in range(local_rows):
+            source = grid[(top - depth + i) % rows]
+            for j in range(local_cols):
+                current[i, j] = source[(left - depth + j) % cols]
+
+        for s in range(depth):
+            for i in range(s + 1, local_rows - s - 1):
+                above = current[i - 1]
+                row = current[i]
+                below = current[i + 1]
+                target = spare[i]
+                for j in range(s + 1, local_cols - s - 1):
+                    total = (above[j - 1] + above[j] + above[j + 1]
+                             + row[j - 1] + row[j] + row[j + 1]
+                             + below[j - 1] + below[j] + below[j + 1])
+                    target[j] = table[row[j], total - row[j]]
+            current, spare = spare, current
+
+        for i in range(height):
+            for j in range(width):
+                out[top + i, left + j] = current[depth + i, depth + j]
+
+@njit(cache=True)
+def step_n_tiled(grid, n, buffer, tile_size, depth, table):
+    """
+    Advance the grid by n generations with temporally blocked passes of `depth`
+    generations (the last pass covers the remainder).
+
+    Both arrays are overwritten; the caller keeps whichever one is returned.
+
+    Parameters:
+    - grid (np.ndarray): Current state of the grid (2D array of 0s and 1s).
+    - n (int): Number of generations to compute.
+    - buffer (np.ndarray): Scratch array with the same shape and dtype as grid.
+    - tile_size (int): Edge length of the square tiles.
+    - depth (int): Generations per memory pass.
+    - table (np.ndarray): Two-state rule lookup table, see rules.Rule.
+
+    Returns:
+    - np.ndarray: grid or buffer, whichever holds generation n.
+    """
+    current, spare = grid, buffer
+    remaining = n
+    while remaining > 0:
+        block = min(depth, remaining)
+        compute_tiled_into(current, spare, tile_size, block, table)
+        current, spare = spare, current
+        remaining -= block
+    return current
+
+WORD_BITS = 64
+
+def pack_grid(grid):
+    """
+    Pack a dense grid into rows of uint64 words, 64 cells per word.
+
+    Cell (x, y) is stored in bit y % 64 of word y // 64 of row x. Padding bits past
+    the last column are always zero.
+
+    Parameters:
+    - grid (np.ndarray): Dense grid (2D array of 0s and 1s).
+
+    Returns:
+    - np.ndarray: Packed grid of shape (rows, ceil(cols / 64)) and dtype uint64.
+    """
+    rows, cols = grid.shape
+    words = -(-cols // WORD_BITS)
+    padded = np.zeros((rows, words * WORD_BITS), dtype=np.uint8)
+    padded[:, :cols] = grid != 0
+    packed = np.packbits(padded, axis=1, bitorder='little')
+    return np.ascontiguousarray(packed).view('<u8').astype(np.uint64, copy=False)
+
+def unpack_grid(packed, cols):
+    """
+    Expand a packed grid back into one uint8 per cell.
+
+    Parameters:
+    - packed (np.ndarray): Packed grid as returned by pack_grid().
+    - cols (int): Number of columns of the dense grid.
+
+    Returns:
+    - np.ndarray: Dense uint8 grid of shape (rows, cols).
     """
-    def __init__(self, rows, cols, initial_state=None, random_init=False, prob_alive=0.2):
-        self.rows = rows
-        self.cols = cols
-        self.paused = True
+    as_bytes = np.ascontiguousarray(packed).astype('<u8', copy=False).view(np.uint8)
+    return np.unpackbits(as_bytes, axis=1, count=cols, bitorder='little')
 
-        if initial_state is not None:
-            self.grid = np.array(initial_state, dtype=np.uint8)
+@njit(inline='always', cache=True)
+def _add3(a, b, c):
+    """
+    Bit-sliced full adder: returns the sum and carry planes of three bit planes.
+    """
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+@njit(inline='always', cache=True)
+def _shift_west(words, w, last, tail):
+    """
+    Word w of the row with every cell replaced by its left neighbour (toroidal).
+    """
+    if w == 0:
+        carry = (words[last] >> np.uint64(tail)) & np.uint64(1)
+    else:
+        carry = words[w - 1] >> np.uint64(63)
+    return (words[w] << np.uint64(1)) | carry
+
+@njit(inline='always', cache=True)
+def _shift_east(words, w, last, tail):
+    """
+    Word w of the row with every cell replaced by its right neighbour (toroidal).
+    """
+    if w == last:
+        carry = (words[0] & np.uint64(1)) << np.uint64(tail)
+    else:
+        carry = words[w + 1] << np.uint64(63)
+    return (words[w] >> np.uint64(1)) | carry
+
+@njit(parallel=True, cache=True)
+def compute_next_step_packed(packed, cols, table):
+    """
+    Compute the next generation of a bit-packed grid using parallel loops.
+
+    The eight neighbour planes of each word are summed with bit-sliced adders into
+    a 4-bit count per cell, so 64 cells are updated by a few dozen word operations.
+    The rule is applied by matching the count planes against every neighbour count
+    that causes a birth or a survival.
+
+    Parameters:
+    - packed (np.ndarray): Current packed grid (rows x words, uint64), see pack_grid().
+    - cols (int): Number of columns of the dense grid.
+    - table (np.ndarray): Two-state rule lookup table, see rules.Rule.
+
+    Returns:
+    - np.ndarray: Updated packed grid.
+    """
+    rows, words = packed.shape
+    last = words - 1
+    tail = (cols - 1) % WORD_BITS
+    last_mask = np.uint64(0xFFFFFFFFFFFFFFFF) >> np.uint64(WORD_BITS - 1 - tail)
+    new_packed = np.empty_like(packed)
+
+    for x in prange(rows):
+        above = packed[(x - 1) % rows]
+        row = packed[x]
+        below = packed[(x + 1) % rows]
+        for w in range(words):
+            sum_above, carry_above = _add3(
+                _shift_west(above, w, last, tail), above[w], _shift_east(above, w, last, tail))
+            sum_below, carry_below = _add3(
+                _shift_west(below, w, last, tail), below[w], _shift_east(below, w, last, tail))
+            west = _shift_west(row, w, last, tail)
+            east = _shift_east(row, w, last, tail)
+            sum_row = west ^ east
+            carry_row = west & east
+
+            ones, carry_ones = _add3(sum_above, sum_below, sum_row)
+            twos_partial, fours_partial = _add3(carry_above, carry_below, carry_row)
+            twos = twos_partial ^ carry_ones
+            fours = fours_partial ^ (twos_partial & carry_ones)
+            eights = fours_partial & twos_partial & carry_ones
+
+            alive = row[w]
+            result = np.uint64(0)
+            for n in range(9):
+                born = table[0, n]
+                stays = table[1, n]
+                if born == 0 and stays == 0:
+                    continue
+                match = ((ones if n & 1 else ~ones) & (twos if n & 2 else ~twos)
+                         & (fours if n & 4 else ~fours) & (eights if n & 8 else ~eights))
+                if born and stays:
+                    result |= match
+                elif born:
+                    result |= match & ~alive
+                else:
+                    result |= match & alive
+            if w == last:
+                result &= last_mask
+            new_packed[x, w] = result
+
+    return new_packed
+
+@njit(inline='always', cache=True)
+def _mix64(value):
+    """
+    SplitMix64 finalizer: spreads every input bit over the 64-bit result.
+    """
+    value = (value ^ (value >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    value = (value ^ (value >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return value ^ (value >> np.uint64(31))
+
+@njit(parallel=True, cache=True)
+def hash_grid(grid, cells_per_word):
+    """
+    64-bit fingerprint of a 2D array of cells or words, read in place (views and
+    non-contiguous arrays included), row by row in parallel.
+
+    Consecutive cells are gathered into little-endian 64-bit words, every word is
+    mixed with its position, and the mixed words are summed.
+
+    Parameters:
+    - grid (np.ndarray): 2D array, e.g. uint8 cells or packed uint64 words.
+    - cells_per_word (int): Elements gathered per word: 8 for uint8, 1 for uint64.
+
+    Returns:
+    - np.uint64: Fingerprint.
+    """
+    rows, cols = grid.shape
+    shift = 64 // cells_per_word
+    row_hashes = np.empty(rows, dtype=np.uint64)
+    for x in prange(rows):
+        row_hash = np.uint64(0)
+        key = np.uint64(x) * np.uint64(0x9E3779B97F4A7C15)
+        if cells_per_word == 1:
+            for w in range(cols):
+                row_hash += _mix64(np.uint64(grid[x, w]) ^ (key + np.uint64(w)))
         else:
-            self.grid = (
-                np.random.choice([0, 1], size=(rows, cols), p=[1 - prob_alive, prob_alive])
-                if random_init else
-                np.zeros((rows, cols), dtype=np.uint8)
-            )
+            for start in range(0, cols, cells_per_word):
+                word = np.uint64(0)
+                for k in range(min(cells_per_word, cols - start)):
+                    word |= np.uint64(grid[x, start + k]) << np.uint64(k * shift)
+                row_hash += _mix64(word ^ (key + np.uint64(start // cells_per_word)))
+        row_hashes[x] = row_hash
+    total = np.uint64(rows)
+    for x in range(rows):
+        total += row_hashes[x]
+    return _mix64(total)
+
+def fingerprint_grid(grid):
+    """
+    Fingerprint of a uint8 or uint64 grid with hash_grid(). Contiguous uint8 rows of
+    a multiple of 8 cells are read as uint64 words directly, which gives the same
+    value faster.
+
+    Parameters:
+    - grid (np.ndarray): 2D array of uint8 cells or uint64 words.
+
+    Returns:
+    - int: Fingerprint.
+    """
+    if grid.dtype.itemsize == 8:
+        return int(hash_grid(grid, 1))
+    if grid.flags.c_contiguous and grid.shape[1] % 8 == 0:
+        return int(hash_grid(grid.view(np.uint64), 1))
+    return int(hash_grid(grid, 8))
+
+class NumbaBackend(Backend):
+    """
+    Dense uint8 grid stepped with the parallel kernel, ping-ponging between two
+    preallocated buffers so no memory is allocated per generation.
+    """
+    supports_generations = True
+
+    @property
+    def grid(self):
+        return self._grid
 
-        self.fig, self.ax = plt.subplots()
-        self.img = self.ax.imshow(self.grid, cmap='gray_r', vmin=0, vmax=1)
-        self.ax.set_title("Space: Pause/Resume | Left click: Alive | Right click: Dead")
+    @grid.setter
+    def grid(self, value):
+        # Steps alternate between the two buffers: keep a copy of a foreign array so
+        # they never write into it. The backend's own grid (edited in place) is kept.
+        if value is not getattr(self, "_grid", None):
+            value = np.array(value)
+        self._grid = value
+        if getattr(self, "_buffer", None) is None or self._buffer.shape != value.shape:
+            self._buffer = np.empty_like(value)
 
-        self.ani = FuncAnimation(self.fig, self.update, interval=100, blit=False)
-        self.fig.canvas.mpl_connect('button_press_event', self.on_click)
-        self.fig.canvas.mpl_connect('key_press_event', self.on_key)
+    def fingerprint(self):
+        return fingerprint_grid(self._grid)
 
     def step(self):
-        """
-        Advance the game state by one iteration using compute_next_state().
-        """
-        self.grid = compute_next_step(self.grid)
-
-    def run(self, steps=None):
-        """
-        Run the simulation.
-
-        Parameters:
-        - steps (int or None): Number of iterations to run. If None, runs interactively with GUI.
-        """
-        if steps is None:
-            plt.show()
-        else:
-            for _ in range(steps):
-                self.step()
-
-    def update(self, frame):
-        """
-        Called by FuncAnimation for each animation frame.
-        Updates grid state and refreshes plot.
-        """
-        if not self.paused:
-            self.step()
-        self.img.set_data(self.grid)
-        return [self.img]
-
-    def on_click(self, event):
-        """
-        Mouse click event handler.
-        Left-click toggles cell alive, right-click sets it dead.
-        """
-        if event.inaxes != self.ax:
-            return
-        try:
-            x = int(round(event.xdata))
-            y = int(round(event.ydata))
-        except (TypeError, ValueError):
-            return
-
-        if 0 <= x < self.cols and 0 <= y < self.rows:
-            if event.button == 1:
-                self.grid[y, x] = 1
-            elif event.button == 3:
-                self.grid[y, x] = 0
-            self.img.set_data(self.grid)
-            self.fig.canvas.draw_idle()
-
-    def on_key(self, event):
-        """
-        Keyboard event handler. Pressing space toggles pause/resume.
-        """
-        if event.key == ' ':
-            self.paused = not self.paused
-            print("Running simulation..." if not self.paused else "Paused.")
-
-    @staticmethod
-    def ask_if_random(question):
-        """
-        Prompt the user to choose random initialization.
-
-        Parameters:
-        - question (str): Prompt text
-
-        Returns:
-        - bool: True if user selects random init.
-        """
-        while True:
-            response = input(question + " (y/n): ").strip().lower()
-            if response in ['y', 'n']:
-                return response == 'y'
-            print("Please respond with 'y' or 'n'.")
-
-    @staticmethod
-    def ask_grid_size():
-        """
-        Prompt the user to select a grid size from a preset list.
-
-        Returns:
-        - int: Chosen grid dimension (NxN)
-        """
-        options = [32, 64, 128, 256, 512, 1024]
-        while True:
-            print(f"Available sizes: {', '.join(map(str, options))}")
-            try:
-                value = int(input("Choose grid size (N for NxN): ").strip())
-                if value in options:
-                    return value
-                print("Please select a valid size.")
-            except ValueError:
-                print("Invalid input. Must be a number.")
+        compute_next_step_into(self._grid, self._buffer, self.rule.table)
+        self._grid, self._buffer = self._buffer, self._grid
+
+    def advance(self, steps):
+        final = step_n(self._grid, steps, self._buffer, self.rule.table)
+        if final is not self._grid:
+            self._grid, self._buffer = self._buffer, self._grid
+
+class HaloBackend(Backend):
+    """
+    Dense uint8 grid with a one-cell ghost border, stepped with the modulo-free
+    halo kernel. `grid` is a view of the interior of the padded array.
+
+    Parameters:
+    - grid (np.ndarray): Initial dense grid.
+    - rule (Rule or str, optional): Two-state rule, Conway's Life by default.
+    - boundary (str): "toroidal", "dead" or "reflect".
+    """
+    def __init__(self, grid, rule=None, boundary="toroidal"):
+        if boundary not in BOUNDARIES:
+            raise ValueError(f"Unknown boundary {boundary!r}, expected one of {sorted(BOUNDARIES)}")
+        self.boundary = BOUNDARIES[boundary]
+        super().__init__(grid, rule)
+
+    @property
+    def grid(self):
+        return self._padded[1:-1, 1:-1]
+
+    @grid.setter
+    def grid(self, value):
+        self._padded = pad_grid(value)
+        self._buffer = np.zeros_like(self._padded)
+
+    def fingerprint(self):
+        # The interior view, read in place: the ghost border is refreshed lazily.
+        return fingerprint_grid(self.grid)
+
+    def step(self):
+        self.advance(1)
+
+    def advance(self, steps):
+        final = step_n_halo(self._padded, steps, self._buffer, self.boundary, self.rule.table)
+        if final is not self._padded:
+            self._padded, self._buffer = self._buffer, self._padded
+
+class TiledBackend(Backend):
+    """
+    Dense uint8 grid stepped with the cache-blocked, temporally tiled kernel.
+    Produces the same generations as compute_next_step().
+
+    Parameters:
+    - grid (np.ndarray): Initial dense grid.
+    - rule (Rule or str, optional): Two-state rule, Conway's Life by default.
+    - tile_size (int): Edge length of the square tiles.
+    - depth (int): Generations advanced per memory pass.
+    """
+    def __init__(self, grid, rule=None, tile_size=128, depth=4):
+        if tile_size < 1 or depth < 1:
+            raise ValueError("tile_size and depth must be >= 1")
+        self.tile_size = tile_size
+        self.depth = depth
+        super().__init__(grid, rule)
+
+    @property
+    def grid(self):
+        return self._grid
+
+    @grid.setter
+    def grid(self, value):
+        # Keep a copy of a foreign array, as NumbaBackend does.
+        if value is not getattr(self, "_grid", None):
+            value = np.array(value)
+        self._grid = value
+        self._buffer = np.empty_like(value)
+
+    def fingerprint(self):
+        return fingerprint_grid(self._grid)
+
+    def step(self):
+        self.advance(1)
+
+    def advance(self, steps):
+        final = step_n_tiled(self._grid, steps, self._buffer, self.tile_size, self.depth,
+                             self.rule.table)
+        if final is not self._grid:
+            self._grid, self._buffer = self._buffer, self._grid
+
+class PackedBackend(Backend):
+    """
+    Bit-packed grid (64 cells per uint64 word) stepped with compute_next_step_packed().
+    The dense `grid` view is unpacked on access and packed again on assignment.
+    """
+    def __init__(self, grid, rule=None):
+        super().__init__(grid, rule)
+
+    @property
+    def grid(self):
+        return unpack_grid(self.packed, self.cols)
+
+    @grid.setter
+    def grid(self, value):
+        self.cols = value.shape[1]
+        self.packed = pack_grid(value)
+
+    def snapshot(self):
+        # Packed words: 8 times less to copy than the dense grid.
+        return self.packed.copy()
+
+    def expand(self, snapshot):
+        return unpack_grid(snapshot, self.cols)
+
+    def fingerprint(self):
+        # Hash the words: unpacking the dense grid costs more than a generation.
+        return fingerprint_grid(self.packed)
+
+    def step(self):
+        self.packed = compute_next_step_packed(self.packed, self.cols, self.rule.table)
+
+class GameOfLife(main.GameOfLife):
+    """
+    Class representing the Game of Life simulation, stepped with Numba kernels.
+
+    Parameters:
+    - rows (int): Number of rows in the grid.
+    - cols (int): Number of columns in the grid.
+    - initial_state (2D list or np.ndarray, optional): User-defined initial state.
+    - random_init (bool): If True, initialize with random grid.
+    - prob_alive (float): Probability a cell is initially alive in random mode.
+    - backend (str): "numba" (one uint8 per cell), "halo" (ghost-border kernel),
+      "tiled" (temporally blocked kernel) or "packed" (64 cells per uint64 word).
+    - seed (int, optional): Seed for the random initial state.
+    - backend_options (dict, optional): Extra keyword arguments for the backend.
+    - rule (Rule or str, optional): Rule in B/S notation, Conway's Life by default.
+    """
+    def __init__(self, rows, cols, initial_state=None, random_init=False, prob_alive=0.2,
+                 backend="numba", seed=None, backend_options=None, rule=None):
+        super().__init__(rows, cols, initial_state=initial_state, random_init=random_init,
+                         prob_alive=prob_alive, backend=backend, seed=seed,
+                         backend_options=backend_options, rule=rule)
 
 if __name__ == "__main__":
     use_random_grid = GameOfLife.ask_if_random("Start with a random grid?")
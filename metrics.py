@@ -0,0 +1,215 @@
+"""
+Game of Life Run Metrics
+-------------------------------------------------------
+Low-overhead instrumentation of a running simulation, without a profiler.
+
+Attach a Metrics object as `simulation.metrics`: the simulation times every call to
+its backend (the Numba kernels included, as a whole) and hands the elapsed time to
+the metrics. Every `every` generations a Sample is taken with the mean step time and
+generations per second over the interval, the live-cell population, the change in
+the number of allocated Python memory blocks and, optionally, the peak memory
+allocated during the interval (tracemalloc, which slows allocations down).
+
+With every=1 each generation is timed individually; larger values let run() keep
+advancing the backend in long fused calls and only pay for a sample (mostly the
+population count) once per interval.
+
+Samples go to an optional callback, to a ring buffer of the last `history` samples,
+and to an optional text file in the Prometheus exposition format (written atomically,
+at most once every `export_seconds`), which node_exporter's textfile collector and
+similar scrapers read.
+
+Usage:
+    sim.metrics = Metrics(every=100, prometheus_path="/var/lib/node_exporter/life.prom")
+    sim.run(100000)
+    print(sim.metrics.history[-1])
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque, namedtuple
+import numpy as np
+
+# One measurement over the generations since the previous sample.
+Sample = namedtuple("Sample", ["generation", "timestamp", "generations", "step_seconds",
+                               "generations_per_second", "population", "allocated_blocks",
+                               "peak_bytes"])
+
+class Metrics:
+    """
+    Step timings, throughput, population and allocations of a simulation.
+
+    Parameters:
+    - every (int): Generations between two samples.
+    - callback (callable, optional): Called with every Sample.
+    - history (int): Number of recent samples kept in `history`.
+    - prometheus_path (str, optional): Text file receiving the metrics in the
+      Prometheus exposition format.
+    - export_seconds (float): Minimum wall time between two writes of that file.
+    - population (bool): Count the live cells at every sample.
+    - trace_allocations (bool): Report the peak memory allocated per interval with
+      tracemalloc (started if needed).
+    - labels (dict, optional): Extra labels of the exported metrics; the backend name
+      is always added.
+    """
+    def __init__(self, every=100, callback=None, history=1024, prometheus_path=None,
+                 export_seconds=5.0, population=True, trace_allocations=False, labels=None):
+        if every < 1:
+            raise ValueError("every must be >= 1")
+        self.every = every
+        self.callback = callback
+        self.history = deque(maxlen=history)
+        self.prometheus_path = prometheus_path
+        self.export_seconds = export_seconds
+        self.population = population
+        self.trace_allocations = trace_allocations
+        self.labels = dict(labels or {})
+        self.total_generations = 0
+        self.total_seconds = 0.0
+        self.samples = 0
+        self._generations = 0
+        self._seconds = 0.0
+        self._blocks = sys.getallocatedblocks()
+        self._exported = None
+        if trace_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._traced = tracemalloc.get_traced_memory()[0]
+
+    def observe(self, simulation, generations, seconds):
+        """
+        Account for generations computed by the backend, and take a sample when the
+        simulation reached a multiple of `every`. Called by Simulation.
+
+        Parameters:
+        - simulation (Simulation): Simulation that was advanced.
+        - generations (int): Generations computed.
+        - seconds (float): Time spent in the backend.
+
+        Returns:
+        - Sample or None: The sample taken, if any.
+        """
+        self._generations += generations
+        self._seconds += seconds
+        self.total_generations += generations
+        self.total_seconds += seconds
+        if simulation.generation % self.every == 0 or self._generations >= self.every:
+            return self.sample(simulation)
+        return None
+
+    def sample(self, simulation):
+        """
+        Take a sample of the generations observed since the previous one and pass it
+        to the outputs.
+
+        Parameters:
+        - simulation (Simulation): Simulation being measured.
+
+        Returns:
+        - Sample: The new sample.
+        """
+        generations, seconds = self._generations, self._seconds
+        population = None
+        if self.population:
+            grid = simulation.grid
+            population = int(np.count_nonzero(grid if simulation.rule.states == 2 else grid == 1))
+        blocks = sys.getallocatedblocks()
+        peak = None
+        if self.trace_allocations:
+            peak = max(tracemalloc.get_traced_memory()[1] - self._traced, 0)
+            tracemalloc.reset_peak()
+            self._traced = tracemalloc.get_traced_memory()[0]
+
+        sample = Sample(
+            generation=simulation.generation,
+            timestamp=time.time(),
+            generations=generations,
+            step_seconds=seconds / generations if generations else 0.0,
+            generations_per_second=generations / seconds if seconds > 0 else 0.0,
+            population=population,
+            allocated_blocks=blocks - self._blocks,
+            peak_bytes=peak,
+        )
+        self._generations, self._seconds, self._blocks = 0, 0.0, blocks
+        self.samples += 1
+        self.history.append(sample)
+        if self.callback is not None:
+            self.callback(sample)
+        if self.prometheus_path is not None:
+            now = time.perf_counter()
+            if self._exported is None or now - self._exported >= self.export_seconds:
+                self.export(simulation)
+                self._exported = now
+        return sample
+
+    def prometheus_text(self, simulation):
+        """
+        Latest sample and totals in the Prometheus text exposition format.
+
+        Parameters:
+        - simulation (Simulation): Simulation being measured.
+
+        Returns:
+        - str: Metric families, one gauge or counter per line.
+        """
+        labels = dict(self.labels, backend=simulation.backend_name)
+        label_text = ",".join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+        last = self.history[-1] if self.history else None
+        values = [
+            ("life_generation", "gauge", "Current generation.", simulation.generation),
+            ("life_generations_total", "counter", "Generations computed.", self.total_generations),
+            ("life_step_seconds_total", "counter", "Time spent computing generations.",
+             self.total_seconds),
+        ]
+        if last is not None:
+            values += [
+                ("life_step_seconds", "gauge", "Mean time per generation over the last interval.",
+                 last.step_seconds),
+                ("life_generations_per_second", "gauge", "Throughput over the last interval.",
+                 last.generations_per_second),
+                ("life_allocated_blocks_delta", "gauge",
+                 "Change in allocated Python memory blocks over the last interval.",
+                 last.allocated_blocks),
+            ]
+            if last.population is not None:
+                values.append(("life_population", "gauge", "Live cells.", last.population))
+            if last.peak_bytes is not None:
+                values.append(("life_peak_allocated_bytes", "gauge",
+                               "Peak memory allocated during the last interval.", last.peak_bytes))
+        lines = []
+        for name, kind, description, value in values:
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} {kind}",
+                      f"{name}{{{label_text}}} {value}"]
+        return "\n".join(lines) + "\n"
+
+    def export(self, simulation):
+        """
+        Atomically rewrite the Prometheus text file.
+
+        Parameters:
+        - simulation (Simulation): Simulation being measured.
+        """
+        temporary = f"{self.prometheus_path}.tmp"
+        with open(temporary, "w") as handle:
+            handle.write(self.prometheus_text(simulation))
+        os.replace(temporary, self.prometheus_path)
+
+    def summary(self):
+        """
+        Totals since the metrics were created.
+
+        Returns:
+        - dict: generations, seconds, generations_per_second and samples.
+        """
+        return {
+            "generations": self.total_generations,
+            "seconds": self.total_seconds,
+            "generations_per_second": (self.total_generations / self.total_seconds
+                                       if self.total_seconds > 0 else 0.0),
+            "samples": self.samples,
+        }
@@ -0,0 +1,199 @@
+"""
+Game of Life Out-of-Core Engine
+-------------------------------------------------------
+Boards stored in memory-mapped .npy files, for grids larger than RAM.
+
+A generation is computed by walking down the file one band of rows at a time: the
+band and the row above and below it are read into a small in-memory buffer, the
+Numba kernel computes the band's next generation, and the result is written to the
+band's place in a second file. Resident memory is bounded by the band size, whatever
+the size of the board; the kernel sees only in-memory arrays.
+
+Every generation is written to a fresh scratch file, which is then atomically
+renamed over the file at `path`: the file at `path` always holds one whole
+generation, even after a crash, and is a valid checkpoint that
+np.load(path, mmap_mode="r") can open, e.g. to resume a run. As a generation's file
+is never written again by stepping, it doubles as the viewer's snapshot.
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import os
+import tempfile
+import weakref
+import numpy as np
+from numba import njit, prange
+from simulation import Backend, pin_threading_layer
+
+pin_threading_layer()
+
+@njit(parallel=True, cache=True)
+def compute_band_into(band, out, table):
+    """
+    Compute the next generation of the interior rows of a band.
+
+    Parameters:
+    - band (np.ndarray): (band_rows + 2, cols) rows with one halo row above and below.
+    - out (np.ndarray): (band_rows, cols) array receiving the next generation.
+    - table (np.ndarray): Rule lookup table indexed by [state, live neighbours], see rules.Rule.
+    """
+    rows = out.shape[0]
+    cols = band.shape[1]
+
+    for x in prange(rows):
+        above = band[x]
+        row = band[x + 1]
+        below = band[x + 2]
+        target = out[x]
+        for y in range(cols):
+            west = y - 1 if y > 0 else cols - 1
+            east = y + 1 if y < cols - 1 else 0
+            total = ((above[west] == 1) + (above[y] == 1) + (above[east] == 1)
+                     + (row[west] == 1) + (row[east] == 1)
+                     + (below[west] == 1) + (below[y] == 1) + (below[east] == 1))
+            target[y] = table[row[y], total]
+
+def _create(path, rows, cols):
+    """
+    Create a zero-filled (sparse) uint8 .npy file and map it read-write.
+    """
+    return np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=(rows, cols))
+
+def _temporary_path():
+    """
+    Path of a new, empty temporary .npy file.
+    """
+    handle, path = tempfile.mkstemp(suffix=".npy", prefix="life-")
+    os.close(handle)
+    return os.path.abspath(path)
+
+# Temporary board files created by allocate() and not yet adopted by a backend:
+# path -> finalizer deleting the file.
+_ALLOCATED = {}
+
+def _remove(*paths):
+    """
+    Delete files, ignoring the ones already gone.
+    """
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def _discard(path):
+    """
+    Delete a temporary file of allocate() that no backend adopted.
+    """
+    _ALLOCATED.pop(path, None)
+    _remove(path)
+
+class MemmapBackend(Backend):
+    """
+    Toroidal uint8 board kept in a memory-mapped file and stepped band by band.
+
+    Call close() to unmap the files. Without an explicit path the board lives in a
+    temporary file (the one from allocate(), if given) that close() (or garbage
+    collection) deletes; a given path is kept.
+
+    Parameters:
+    - grid (np.ndarray): Initial dense grid. A memmap of the file at `path` is adopted
+      without copying, which resumes a run from its file.
+    - rule (Rule or str, optional): Rule to apply, Conway's Life by default.
+    - path (str, optional): .npy file holding the current generation.
+    - band_rows (int): Rows computed per band; bounds the resident memory.
+    """
+    supports_generations = True
+    adopts_storage = True
+
+    def __init__(self, grid, rule=None, path=None, band_rows=256):
+        if band_rows < 1:
+            raise ValueError("band_rows must be >= 1")
+        self.band_rows = band_rows
+        self.rows, self.cols = grid.shape
+        temporary = path is None
+        if temporary:
+            allocated = os.path.abspath(grid.filename) if isinstance(grid, np.memmap) else None
+            if allocated in _ALLOCATED:
+                # Take over the temporary file of allocate(), and its deletion.
+                _ALLOCATED.pop(allocated).detach()
+                path = allocated
+            else:
+                path = _temporary_path()
+        self.path = os.path.abspath(path)
+        self._next_path = self.path + ".next.npy"
+
+        adopt = isinstance(grid, np.memmap) and os.path.abspath(grid.filename) == self.path
+        if adopt:
+            self._grid = np.load(self.path, mmap_mode="r+")
+        else:
+            self._grid = _create(self.path, self.rows, self.cols)
+        self._finalizer = weakref.finalize(self, _remove, self._next_path,
+                                           *([self.path] if temporary else []))
+        super().__init__(self._grid if adopt else grid, rule)
+
+    @classmethod
+    def allocate(cls, rows, cols, path=None, **options):
+        if path is not None:
+            return _create(path, rows, cols)
+        # A temporary file, deleted with the array unless a backend adopts it.
+        path = _temporary_path()
+        grid = _create(path, rows, cols)
+        _ALLOCATED[path] = weakref.finalize(grid, _discard, path)
+        return grid
+
+    @property
+    def grid(self):
+        return self._grid
+
+    @grid.setter
+    def grid(self, value):
+        if np.may_share_memory(value, self._grid):
+            return
+        if value.shape != (self.rows, self.cols):
+            raise ValueError(f"Grid shape {value.shape} does not match the file ({self.rows}, {self.cols})")
+        for top in range(0, self.rows, self.band_rows):
+            self._grid[top:top + self.band_rows] = value[top:top + self.band_rows]
+
+    def _step_into(self, source, target, band, out):
+        """
+        Compute one generation from the source file into the target file.
+        """
+        rows = self.rows
+        for top in range(0, rows, self.band_rows):
+            bottom = min(top + self.band_rows, rows)
+            size = bottom - top
+            band[0] = source[(top - 1) % rows]
+            band[1:size + 1] = source[top:bottom]
+            band[size + 1] = source[bottom % rows]
+            compute_band_into(band[:size + 2], out[:size], self.rule.table)
+            target[top:bottom] = out[:size]
+
+    def step(self):
+        self.advance(1)
+
+    def advance(self, steps):
+        if steps <= 0:
+            return
+        band = np.empty((self.band_rows + 2, self.cols), dtype=np.uint8)
+        out = np.empty((self.band_rows, self.cols), dtype=np.uint8)
+        for _ in range(steps):
+            target = _create(self._next_path, self.rows, self.cols)
+            self._step_into(self._grid, target, band, out)
+            target.flush()
+            # The file at `path` only ever changes from one whole generation to the
+            # next. The previous one stays mapped (e.g. by a snapshot) until dropped.
+            os.replace(self._next_path, self.path)
+            self._grid = target
+
+    def snapshot(self):
+        # Later generations go to new files: the current mapping stays as it is.
+        return self._grid
+
+    def close(self):
+        """
+        Flush and unmap the board, and delete the scratch (and temporary) files.
+        """
+        self._grid.flush()
+        self._grid = None
+        self._finalizer()
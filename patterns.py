@@ -0,0 +1,427 @@
+"""
+Game of Life Pattern Files
+-------------------------------------------------------
+Readers and writers for the standard pattern formats:
+- RLE (.rle): run-length encoded rows, with an optional "rule = ..." header,
+- plaintext (.cells): one character per cell, "." dead and "O" alive,
+- Life 1.06 (.lif, .life): one "x y" coordinate pair per live cell.
+
+Readers return a Pattern holding coordinate arrays of the non-dead cells, built with
+whole-array NumPy operations on runs (RLE), lines (.cells) or the coordinate table
+(Life 1.06) rather than one Python object per cell. Files are read in blocks of
+lines and written row by row, so neither side needs the whole text in memory.
+Patterns can then be expanded into a dense grid, packed into the 64-cells-per-word
+layout of main_numba.PackedBackend, or placed at an offset in a larger grid.
+
+Usage:
+    pattern = load_pattern("gosperglidergun.rle")
+    sim = Simulation(512, 512, rule=pattern.rule)
+    sim.grid = place(sim.grid, pattern, top=100, left=100)
+    save_pattern(sim.grid, "final.rle", rule=sim.rule)
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import os
+import re
+from collections import namedtuple
+from itertools import islice
+import numpy as np
+
+# Lines parsed per block by the readers.
+BLOCK_LINES = 4096
+# Maximum line length of written RLE files, as recommended by the format.
+RLE_LINE_LENGTH = 70
+
+_RLE_HEADER = re.compile(r"x\s*=\s*(?P<x>\d+)\s*,\s*y\s*=\s*(?P<y>\d+)(?:\s*,\s*rule\s*=\s*(?P<rule>\S+))?",
+                         re.I)
+
+Pattern = namedtuple("Pattern", ["rows", "cols", "values", "shape", "rule"])
+Pattern.__doc__ = """
+Pattern read from a file: int64 `rows` and `cols` coordinates of the non-dead cells
+(relative to the pattern's top-left corner), their uint8 states `values`, the
+bounding `shape` (height, width), and the `rule` named in the file (or None).
+"""
+
+def to_grid(pattern, dtype=np.uint8):
+    """
+    Dense grid of a pattern.
+
+    Parameters:
+    - pattern (Pattern): Pattern to expand.
+    - dtype (np.dtype): dtype of the grid.
+
+    Returns:
+    - np.ndarray: Array of shape pattern.shape.
+    """
+    grid = np.zeros(pattern.shape, dtype=dtype)
+    grid[pattern.rows, pattern.cols] = pattern.values
+    return grid
+
+def to_packed(pattern):
+    """
+    Bit-packed grid of a two-state pattern, in the layout of main_numba.pack_grid
+    (cell (x, y) in bit y % 64 of word y // 64 of row x).
+
+    Parameters:
+    - pattern (Pattern): Pattern to pack.
+
+    Returns:
+    - np.ndarray: uint64 array of shape (height, ceil(width / 64)).
+    """
+    height, width = pattern.shape
+    packed = np.zeros((height, -(-width // 64)), dtype=np.uint64)
+    bits = np.left_shift(np.uint64(1), (pattern.cols & 63).astype(np.uint64))
+    np.bitwise_or.at(packed, (pattern.rows, pattern.cols >> 6), bits)
+    return packed
+
+def place(grid, pattern, top=0, left=0, wrap=False):
+    """
+    Write a pattern into a grid in place, with its top-left corner at (top, left).
+    Dead cells of the pattern leave the grid untouched.
+
+    Parameters:
+    - grid (np.ndarray): Target grid.
+    - pattern (Pattern): Pattern to place.
+    - top (int): Grid row of the pattern's first row.
+    - left (int): Grid column of the pattern's first column.
+    - wrap (bool): Wrap cells past the edges around the torus instead of raising.
+
+    Returns:
+    - np.ndarray: The grid, for chaining (e.g. sim.grid = place(sim.grid, ...)).
+    """
+    rows = pattern.rows + top
+    cols = pattern.cols + left
+    grid_rows, grid_cols = grid.shape
+    if wrap:
+        rows %= grid_rows
+        cols %= grid_cols
+    elif rows.size and (rows.min() < 0 or cols.min() < 0
+                        or rows.max() >= grid_rows or cols.max() >= grid_cols):
+        raise ValueError(f"Pattern of shape {pattern.shape} at ({top}, {left}) does not fit "
+                         f"in a {grid_rows}x{grid_cols} grid")
+    grid[rows, cols] = pattern.values
+    return grid
+
+def from_grid(grid, rule=None):
+    """
+    Pattern of the non-dead cells of a grid, keeping the grid's full shape.
+
+    Parameters:
+    - grid (np.ndarray): Dense grid.
+    - rule (Rule or str, optional): Rule to store with the pattern.
+
+    Returns:
+    - Pattern: Pattern with shape grid.shape.
+    """
+    cells = np.asarray(grid)
+    rows, cols = np.nonzero(cells)
+    return Pattern(rows.astype(np.int64), cols.astype(np.int64),
+                   cells[rows, cols].astype(np.uint8), cells.shape,
+                   None if rule is None else str(rule))
+
+def _trim(rows, cols, values, rule):
+    """
+    Pattern of cells shifted so that their bounding box starts at (0, 0).
+    """
+    if rows.size == 0:
+        return Pattern(rows, cols, values, (0, 0), rule)
+    top, left = rows.min(), cols.min()
+    shape = (int(rows.max() - top + 1), int(cols.max() - left + 1))
+    return Pattern(rows - top, cols - left, values, shape, rule)
+
+def _blocks(handle):
+    """
+    Yield the lines of a file in lists of at most BLOCK_LINES lines.
+    """
+    while True:
+        block = list(islice(handle, BLOCK_LINES))
+        if not block:
+            return
+        yield block
+
+def _rle_tokens(text):
+    """
+    Split RLE body text into run counts and tag characters without a per-token loop:
+    the digits in front of every tag are accumulated one decimal place at a time.
+
+    Returns:
+    - tuple: (int64 run counts, uint8 tag character codes).
+    """
+    codes = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    codes = codes[codes > ord(" ")]
+    is_digit = (codes >= ord("0")) & (codes <= ord("9"))
+    tags = np.flatnonzero(~is_digit)
+    counts = np.zeros(tags.size, dtype=np.int64)
+    pending = np.ones(tags.size, dtype=np.bool_)
+    scale = 1
+    for distance in range(1, 20):
+        position = tags - distance
+        pending &= position >= 0
+        pending[pending] = is_digit[position[pending]]
+        if not pending.any():
+            break
+        counts[pending] += (codes[position[pending]] - ord("0")).astype(np.int64) * scale
+        scale *= 10
+    counts[counts == 0] = 1
+    return counts, codes[tags]
+
+def _rle_state(codes):
+    """
+    Cell states of RLE tags: b and . are dead, o is alive, A..X are Generations states 1..24.
+    """
+    states = np.where((codes >= ord("A")) & (codes <= ord("X")), codes - ord("A") + 1, 0)
+    states[codes == ord("o")] = 1
+    return states.astype(np.uint8)
+
+def read_rle(handle):
+    """
+    Read an RLE pattern from an open text file.
+
+    Runs are decoded block by block: the run lengths, positions and row breaks of a
+    block are computed with cumulative sums, and the cells of every live run are
+    expanded with np.repeat.
+
+    Parameters:
+    - handle (file): Text file positioned at the start of the pattern.
+
+    Returns:
+    - Pattern: Parsed pattern.
+    """
+    rule = None
+    width = height = None
+    y = x = 0
+    carry = ""
+    found_rows, found_cols, found_values = [], [], []
+
+    for block in _blocks(handle):
+        body = []
+        for line in block:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            if width is None:
+                header = _RLE_HEADER.match(stripped)
+                if header is None:
+                    raise ValueError("RLE file is missing its 'x = ..., y = ...' header")
+                width, height = int(header.group("x")), int(header.group("y"))
+                rule = header.group("rule")
+                continue
+            body.append(stripped)
+        text = carry + "".join(body)
+        end = text.find("!")
+        if end >= 0:
+            text = text[:end]
+        # A run count split from its tag by the end of the block waits for the next one.
+        digits = len(text) - len(text.rstrip("0123456789"))
+        carry, text = (text[len(text) - digits:], text[:len(text) - digits]) if digits else ("", text)
+
+        counts, symbols = _rle_tokens(text)
+        if counts.size:
+            row_break = symbols == ord("$")
+            cells = np.where(row_break, 0, counts)
+
+            # Row of every token, and column where its run starts.
+            breaks = np.where(row_break, counts, 0)
+            token_rows = y + np.cumsum(breaks) - breaks
+            position = x + np.cumsum(cells)
+            line_start = np.maximum.accumulate(np.where(row_break, position, 0))
+            starts = position - cells - line_start
+
+            states = _rle_state(symbols)
+            live = (states > 0) & ~row_break
+            run_lengths = counts[live]
+            offsets = np.arange(run_lengths.sum()) - np.repeat(np.cumsum(run_lengths) - run_lengths,
+                                                              run_lengths)
+            found_rows.append(np.repeat(token_rows[live], run_lengths))
+            found_cols.append(np.repeat(starts[live], run_lengths) + offsets)
+            found_values.append(np.repeat(states[live], run_lengths))
+
+            y = int(token_rows[-1] + breaks[-1])
+            x = int(position[-1] - line_start[-1])
+        if end >= 0:
+            break
+
+    if width is None:
+        raise ValueError("RLE file is missing its 'x = ..., y = ...' header")
+    rows, cols, values = _concatenate(found_rows, found_cols, found_values)
+    return Pattern(rows, cols, values, (height, width), rule)
+
+def read_cells(handle):
+    """
+    Read a plaintext (.cells) pattern from an open text file. Lines starting with
+    "!" are comments; "." is a dead cell and any other character a live one.
+
+    Parameters:
+    - handle (file): Text file.
+
+    Returns:
+    - Pattern: Parsed pattern (the rule is always None).
+    """
+    y = 0
+    width = 0
+    found_rows, found_cols = [], []
+    for block in _blocks(handle):
+        lines = [line.rstrip("\r\n") for line in block if not line.startswith("!")]
+        if not lines:
+            continue
+        block_width = max(len(line) for line in lines)
+        width = max(width, block_width)
+        # One fixed-width byte row per line, padded with dead cells.
+        text = "".join(line.ljust(block_width, ".") for line in lines)
+        cells = np.frombuffer(text.encode("ascii"), dtype=np.uint8).reshape(len(lines), block_width)
+        rows, cols = np.nonzero((cells != ord(".")) & (cells != ord(" ")))
+        found_rows.append(rows + y)
+        found_cols.append(cols)
+        y += len(lines)
+    rows, cols, _ = _concatenate(found_rows, found_cols, [])
+    return Pattern(rows, cols, np.ones(rows.size, dtype=np.uint8), (y, width), None)
+
+def read_life106(handle):
+    """
+    Read a Life 1.06 pattern (one "x y" pair per live cell) from an open text file.
+    Coordinates may be negative; the pattern is shifted to start at (0, 0).
+
+    Parameters:
+    - handle (file): Text file.
+
+    Returns:
+    - Pattern: Parsed pattern (the rule is always None).
+    """
+    found_rows, found_cols = [], []
+    for block in _blocks(handle):
+        lines = [line for line in block if line.strip() and not line.startswith("#")]
+        if not lines:
+            continue
+        pairs = np.loadtxt(lines, dtype=np.int64, ndmin=2)
+        found_cols.append(pairs[:, 0])
+        found_rows.append(pairs[:, 1])
+    rows, cols, _ = _concatenate(found_rows, found_cols, [])
+    return _trim(rows, cols, np.ones(rows.size, dtype=np.uint8), None)
+
+def _concatenate(rows, cols, values):
+    """
+    Join per-block coordinate arrays, with empty int64/uint8 arrays when nothing was found.
+    """
+    join = lambda parts, dtype: np.concatenate(parts).astype(dtype, copy=False) if parts else np.empty(0, dtype)
+    return join(rows, np.int64), join(cols, np.int64), join(values, np.uint8)
+
+def _rle_runs(row, multistate):
+    """
+    (tags, lengths) of the runs of one grid row, without the trailing dead run.
+    """
+    nonzero = np.flatnonzero(row)
+    if nonzero.size == 0:
+        return [], []
+    row = row[:nonzero[-1] + 1]
+    boundaries = np.flatnonzero(np.diff(row)) + 1
+    starts = np.concatenate(([0], boundaries))
+    lengths = np.diff(np.concatenate((starts, [row.size])))
+    states = row[starts]
+    tags = [("." if state == 0 else chr(ord("A") + state - 1)) if multistate
+            else ("b" if state == 0 else "o") for state in states.tolist()]
+    return tags, lengths.tolist()
+
+def write_rle(grid, handle, rule=None):
+    """
+    Write a grid as RLE, one grid row at a time. Grids with Generations states use the
+    A..X tags, two-state grids b and o.
+
+    Parameters:
+    - grid (np.ndarray): Dense grid.
+    - handle (file): Text file open for writing.
+    - rule (Rule or str, optional): Rule written in the header.
+    """
+    cells = np.asarray(grid)
+    height, width = cells.shape
+    header = f"x = {width}, y = {height}"
+    handle.write(header + (f", rule = {rule}\n" if rule is not None else "\n"))
+
+    multistate = cells.max(initial=0) > 1
+    line = ""
+    pending_breaks = 0
+
+    def emit(token):
+        nonlocal line
+        if len(line) + len(token) > RLE_LINE_LENGTH:
+            handle.write(line + "\n")
+            line = ""
+        line += token
+
+    for y in range(height):
+        tags, lengths = _rle_runs(cells[y], multistate)
+        if tags:
+            if pending_breaks:
+                emit(f"{pending_breaks if pending_breaks > 1 else ''}$")
+                pending_breaks = 0
+            for tag, length in zip(tags, lengths):
+                emit(f"{length if length > 1 else ''}{tag}")
+        pending_breaks += 1
+    emit("!")
+    handle.write(line + "\n")
+
+def write_cells(grid, handle):
+    """
+    Write a two-state grid as plaintext (.cells), one grid row at a time.
+
+    Parameters:
+    - grid (np.ndarray): Dense grid.
+    - handle (file): Text file open for writing.
+    """
+    cells = np.asarray(grid)
+    alphabet = np.frombuffer(b".O", dtype=np.uint8)
+    for row in cells:
+        handle.write(alphabet[(row != 0).astype(np.uint8)].tobytes().decode("ascii") + "\n")
+
+def write_life106(grid, handle):
+    """
+    Write the live cells of a grid as Life 1.06 ("x y" per line, x the column).
+
+    Parameters:
+    - grid (np.ndarray): Dense grid.
+    - handle (file): Text file open for writing.
+    """
+    handle.write("#Life 1.06\n")
+    cells = np.asarray(grid)
+    for top in range(0, cells.shape[0], BLOCK_LINES):
+        rows, cols = np.nonzero(cells[top:top + BLOCK_LINES])
+        if rows.size:
+            np.savetxt(handle, np.column_stack((cols, rows + top)), fmt="%d")
+
+READERS = {".rle": read_rle, ".cells": read_cells, ".lif": read_life106, ".life": read_life106}
+WRITERS = {".rle": write_rle, ".cells": write_cells, ".lif": write_life106, ".life": write_life106}
+
+def load_pattern(path):
+    """
+    Read a pattern file, choosing the format from its extension (.rle, .cells, .lif, .life).
+
+    Parameters:
+    - path (str): Pattern file.
+
+    Returns:
+    - Pattern: Parsed pattern.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in READERS:
+        raise ValueError(f"Unknown pattern format {extension!r}, expected one of {sorted(READERS)}")
+    with open(path, encoding="ascii", errors="replace") as handle:
+        return READERS[extension](handle)
+
+def save_pattern(grid, path, rule=None):
+    """
+    Write a grid (e.g. GameOfLife.grid) to a pattern file, choosing the format from the
+    extension. Only RLE stores the rule.
+
+    Parameters:
+    - grid (np.ndarray): Dense grid.
+    - path (str): Pattern file (.rle, .cells, .lif, .life).
+    - rule (Rule or str, optional): Rule written in RLE headers.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in WRITERS:
+        raise ValueError(f"Unknown pattern format {extension!r}, expected one of {sorted(WRITERS)}")
+    with open(path, "w", encoding="ascii") as handle:
+        if extension == ".rle":
+            write_rle(grid, handle, rule)
+        else:
+            WRITERS[extension](grid, handle)
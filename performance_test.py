@@ -60,10 +60,10 @@ class PerformanceTester:
         """
         game = self.module.GameOfLife(rows=grid_size, cols=grid_size, random_init=True, prob_alive=0.2)
         game.step()  # Warm-up
-        start = time.time()
+        start = time.perf_counter()
         for _ in range(self.steps):
             game.step()
-        end = time.time()
+        end = time.perf_counter()
         return (end - start) / self.steps
 
     def _theoretical_curves(self, sizes):
@@ -0,0 +1,270 @@
+"""
+Game of Life Recorder
+-------------------------------------------------------
+Streams generations of a run to disk and reads them back.
+
+A recording is an append-only file of frames. Every `keyframe_interval` frames a
+keyframe stores the whole board; the frames in between store the XOR with the
+previous frame, which is mostly zeros and compresses very well. Two-state boards
+are bit-packed (8 cells per byte) before compression; Generations boards keep one
+byte per cell. Every frame is compressed on its own (zlib or lzma) so any keyframe
+can be decoded without the frames before it.
+
+Keyframe positions are appended to a small index file next to the recording, so a
+generation is found by seeking to the nearest keyframe and replaying at most
+`keyframe_interval - 1` deltas. Memory use is bounded by a couple of frames.
+
+Usage:
+    with Recorder("run.golrec", rows, cols, states=sim.rule.states, every=10) as recorder:
+        sim.recorder = recorder
+        sim.run(10000)
+
+    with Recording("run.golrec") as recording:
+        grid = recording.read(5000)
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import bisect
+import lzma
+import os
+import struct
+import zlib
+import numpy as np
+
+MAGIC = b"GOLREC1\0"
+# rows, cols, bits per cell (1 or 8), codec id.
+HEADER = struct.Struct("<IIBB")
+# Frame kind (b"K" keyframe, b"D" delta), generation, compressed payload size.
+FRAME = struct.Struct("<cqI")
+# Index entry: generation and file offset of a keyframe.
+INDEX_ENTRY = np.dtype([("generation", "<i8"), ("offset", "<i8")])
+
+CODECS = {
+    "zlib": (0, lambda data, level: zlib.compress(data, 6 if level is None else level),
+             zlib.decompress),
+    "lzma": (1, lambda data, level: lzma.compress(data, preset=6 if level is None else level,
+                                                  check=lzma.CHECK_NONE),
+             lzma.decompress),
+}
+CODEC_NAMES = {codec_id: name for name, (codec_id, _, _) in CODECS.items()}
+
+def index_path(path):
+    """
+    Path of the keyframe index belonging to a recording.
+    """
+    return os.fspath(path) + ".idx"
+
+class Recorder:
+    """
+    Append-only writer of a recording.
+
+    Parameters:
+    - path (str): Recording file, created or overwritten.
+    - rows (int): Number of rows of the board.
+    - cols (int): Number of columns of the board.
+    - states (int): Number of cell states of the rule (2 for Life-like rules). Two-state
+      recordings are bit-packed and reject boards with other states.
+    - every (int): Record one generation out of `every` when driven by a Simulation.
+    - keyframe_interval (int): Number of frames between two keyframes.
+    - codec (str): "zlib" (fast) or "lzma" (smaller).
+    - level (int, optional): Compression level of the codec.
+    """
+    def __init__(self, path, rows, cols, states=2, every=1, keyframe_interval=64,
+                 codec="zlib", level=None):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec {codec!r}, expected one of {sorted(CODECS)}")
+        if every < 1 or keyframe_interval < 1:
+            raise ValueError("every and keyframe_interval must be >= 1")
+        self.path = path
+        self.rows, self.cols = rows, cols
+        self.packed = states == 2
+        self.every = every
+        self.keyframe_interval = keyframe_interval
+        self.level = level
+        codec_id, self._compress, _ = CODECS[codec]
+
+        self.frames = 0
+        self.last_generation = None
+        self.bytes_written = 0
+        self._previous = None
+        self._file = open(path, "wb")
+        self._index = open(index_path(path), "wb")
+        self._write(MAGIC + HEADER.pack(rows, cols, 1 if self.packed else 8, codec_id))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _write(self, data):
+        self._file.write(data)
+        self.bytes_written += len(data)
+
+    def _encode(self, grid):
+        """
+        Raw bytes of a board: bit-packed for two-state boards, one byte per cell otherwise.
+        """
+        cells = np.asarray(grid)
+        if cells.shape != (self.rows, self.cols):
+            raise ValueError(f"Grid shape {cells.shape} does not match the recording "
+                             f"({self.rows}, {self.cols})")
+        cells = cells.astype(np.uint8, copy=False)
+        if not self.packed:
+            return np.ascontiguousarray(cells).ravel()
+        if cells.size and cells.max() > 1:
+            # Bit-packing would turn every dying state into a live cell.
+            raise ValueError(f"Cell state {int(cells.max())} in a two-state recording; create "
+                             f"the Recorder with states=rule.states for Generations rules")
+        return np.packbits(cells)
+
+    def record(self, generation, grid):
+        """
+        Append one generation. Generations must be recorded in increasing order but
+        need not be consecutive.
+
+        Parameters:
+        - generation (int): Generation number of grid.
+        - grid (np.ndarray): Dense board of that generation.
+        """
+        if self.last_generation is not None and generation <= self.last_generation:
+            raise ValueError(f"Generation {generation} recorded after {self.last_generation}")
+        current = self._encode(grid)
+        keyframe = self.frames % self.keyframe_interval == 0
+        payload = self._compress((current if keyframe else current ^ self._previous).tobytes(),
+                                 self.level)
+
+        if keyframe:
+            # Flush first so the index never points past the end of the recording.
+            self._file.flush()
+            entry = np.array([(generation, self._file.tell())], dtype=INDEX_ENTRY)
+            self._index.write(entry.tobytes())
+            self._index.flush()
+        self._write(FRAME.pack(b"K" if keyframe else b"D", generation, len(payload)))
+        self._write(payload)
+
+        self._previous = current
+        self.frames += 1
+        self.last_generation = generation
+
+    def close(self):
+        """
+        Flush and close the recording.
+        """
+        if not self._file.closed:
+            self._file.close()
+            self._index.close()
+
+class Recording:
+    """
+    Random-access reader of a recording.
+
+    If the index file is missing (e.g. the writer crashed before flushing it), the
+    keyframes are found by scanning the frame headers once.
+
+    Parameters:
+    - path (str): Recording file.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        if self._file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a Game of Life recording")
+        self.rows, self.cols, bits, codec_id = HEADER.unpack(self._file.read(HEADER.size))
+        self.packed = bits == 1
+        self.codec = CODEC_NAMES[codec_id]
+        self._decompress = CODECS[self.codec][2]
+        self._frames_start = self._file.tell()
+
+        try:
+            index = np.fromfile(index_path(path), dtype=INDEX_ENTRY)
+        except FileNotFoundError:
+            index = self._scan_keyframes()
+        self._key_generations = index["generation"].tolist()
+        self._key_offsets = index["offset"].tolist()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Close the recording file.
+        """
+        self._file.close()
+
+    def _frames(self, offset):
+        """
+        Yield (kind, generation, payload offset, payload size) from a frame offset to
+        the end of the file, skipping payloads. A truncated last frame is ignored.
+        """
+        size = os.fstat(self._file.fileno()).st_size
+        while offset + FRAME.size <= size:
+            self._file.seek(offset)
+            kind, generation, length = FRAME.unpack(self._file.read(FRAME.size))
+            if offset + FRAME.size + length > size:
+                return
+            yield kind, generation, offset + FRAME.size, length
+            offset += FRAME.size + length
+
+    def _scan_keyframes(self):
+        entries = [(generation, payload - FRAME.size)
+                   for kind, generation, payload, _ in self._frames(self._frames_start)
+                   if kind == b"K"]
+        return np.array(entries, dtype=INDEX_ENTRY)
+
+    @property
+    def generations(self):
+        """
+        Recorded generation numbers, in order (reads every frame header).
+        """
+        return [generation for _, generation, _, _ in self._frames(self._frames_start)]
+
+    def _payload(self, offset, length):
+        self._file.seek(offset)
+        data = self._decompress(self._file.read(length))
+        return np.frombuffer(data, dtype=np.uint8)
+
+    def _decode(self, cells):
+        if self.packed:
+            cells = np.unpackbits(cells, count=self.rows * self.cols)
+        return cells.reshape(self.rows, self.cols).copy()
+
+    def _replay(self, offset):
+        """
+        Yield (generation, encoded board) from the keyframe at offset onwards.
+        """
+        current = None
+        for kind, generation, payload, length in self._frames(offset):
+            data = self._payload(payload, length)
+            current = data if kind == b"K" else current ^ data
+            yield generation, current
+
+    def read(self, generation):
+        """
+        Board of a recorded generation.
+
+        Parameters:
+        - generation (int): Generation number.
+
+        Returns:
+        - np.ndarray: uint8 board of shape (rows, cols).
+        """
+        position = bisect.bisect_right(self._key_generations, generation) - 1
+        if position >= 0:
+            for recorded, cells in self._replay(self._key_offsets[position]):
+                if recorded == generation:
+                    return self._decode(cells)
+                if recorded > generation:
+                    break
+        raise KeyError(f"Generation {generation} is not in the recording")
+
+    def __iter__(self):
+        """
+        Yield (generation, board) for every recorded generation, in order.
+        """
+        for generation, cells in self._replay(self._frames_start):
+            yield generation, self._decode(cells)
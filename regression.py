@@ -0,0 +1,293 @@
+"""
+Game of Life Performance Regression Tracking
+-------------------------------------------------------
+Versioned benchmark baselines and a comparison that fails on slowdowns.
+
+A baseline is a benchmark.py JSON file (results with their raw samples, machine
+metadata and measurement settings) stored under baselines/ with a format version
+and a name (by default the date and short git commit). compare checks every
+(backend, size, density, threads) case of a baseline against a new run: a case is
+a regression when its median time per generation is more than --threshold slower
+AND a one-sided Mann-Whitney U test on the repeat samples gives p < --alpha, so
+noise between repeats is not reported as a slowdown. The command exits with status
+1 when any case regressed, which lets it gate a deployment, and with status 2 when
+the runs have too few repeats for the test to ever reach --alpha (at least 5 per
+run for the default 0.01), instead of passing silently.
+
+Usage:
+    python benchmark.py --backends numpy numba --sizes 64 256 1024 --json bench.json
+    python regression.py save bench.json
+    python regression.py compare baselines/2026-10-17-fe2b95f.json            # re-measures
+    python regression.py compare baselines/2026-10-17-fe2b95f.json bench.json
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+import numpy as np
+from benchmark import Case, machine_metadata, measure, write_json
+
+BASELINE_VERSION = 1
+BASELINE_DIR = "baselines"
+
+# Machine metadata that must match for timings to be comparable.
+MACHINE_KEYS = ["cpu", "cpu_count", "numba_threads", "numpy", "numba"]
+
+def load_results(path):
+    """
+    Read a benchmark.py JSON file or a baseline.
+
+    Parameters:
+    - path (str): JSON file.
+
+    Returns:
+    - dict: With "machine", "settings" and "results" keys.
+    """
+    with open(path) as handle:
+        data = json.load(handle)
+    version = data.get("baseline_version", BASELINE_VERSION)
+    if version != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version {version}")
+    data.setdefault("machine", {})
+    data.setdefault("settings", {})
+    return data
+
+def save_baseline(path, name=None, directory=BASELINE_DIR):
+    """
+    Store benchmark results as a named, versioned baseline.
+
+    Parameters:
+    - path (str): benchmark.py JSON file.
+    - name (str, optional): Baseline name, defaults to the date and short commit.
+    - directory (str): Directory holding the baselines.
+
+    Returns:
+    - str: Path of the baseline file.
+    """
+    data = load_results(path)
+    if name is None:
+        commit = (data["machine"].get("commit") or "nocommit")[:7]
+        name = f"{time.strftime('%Y-%m-%d')}-{commit}"
+    data["baseline_version"] = BASELINE_VERSION
+    data["name"] = name
+    os.makedirs(directory, exist_ok=True)
+    target = os.path.join(directory, f"{name}.json")
+    with open(target, "w") as handle:
+        json.dump(data, handle, indent=2)
+    return target
+
+def mann_whitney_greater(current, baseline):
+    """
+    One-sided Mann-Whitney U test that `current` samples tend to be larger than
+    `baseline` samples (normal approximation with tie and continuity corrections).
+
+    Parameters:
+    - current (sequence of float): Samples of the new run.
+    - baseline (sequence of float): Samples of the baseline.
+
+    Returns:
+    - float: p-value.
+    """
+    n1, n2 = len(current), len(baseline)
+    values = np.concatenate([current, baseline])
+    order = np.argsort(values, kind="mergesort")
+    ranks = np.empty(len(values))
+    ranks[order] = np.arange(1, len(values) + 1)
+    # Average the ranks of tied values.
+    unique, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    ranks = (np.bincount(inverse, weights=ranks) / counts)[inverse]
+
+    u = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    ties = (counts ** 3 - counts).sum()
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def minimum_p_value(n1, n2):
+    """
+    Smallest p-value mann_whitney_greater() can return for the given sample counts,
+    reached when every current sample is larger than every baseline sample.
+
+    Parameters:
+    - n1 (int): Number of current samples.
+    - n2 (int): Number of baseline samples.
+
+    Returns:
+    - float: Minimum p-value.
+    """
+    return mann_whitney_greater(np.arange(n1) + n2, np.arange(n2))
+
+def required_repeats(alpha):
+    """
+    Smallest number of repeats per run with which the test can reach p < alpha.
+    """
+    repeats = 2
+    while minimum_p_value(repeats, repeats) >= alpha:
+        repeats += 1
+    return repeats
+
+def _key(result):
+    return Case(result["backend"], result["size"], result["density"], result["threads"])
+
+def compare(baseline, current, threshold=0.05, alpha=0.01):
+    """
+    Compare the cases of two benchmark runs.
+
+    Raises ValueError if a case has too few repeats for the test to ever reach p <
+    alpha: its slowdowns could never be reported (e.g. 4 repeats against 4 give p >=
+    0.014 at best).
+
+    Parameters:
+    - baseline (dict): Baseline, see load_results().
+    - current (dict): New run.
+    - threshold (float): Relative slowdown of the median tolerated (0.05 = 5%).
+    - alpha (float): Significance level of the Mann-Whitney test.
+
+    Returns:
+    - list of dict: Per baseline case: case, baseline and current medians, ratio,
+      p_value and status ("regression", "improvement", "unchanged" or "missing").
+    """
+    measured = {_key(result): result for result in current["results"]}
+    rows = []
+    for old in baseline["results"]:
+        case = _key(old)
+        new = measured.get(case)
+        if new is None:
+            rows.append({"case": case, "baseline": old["median_seconds"], "current": None,
+                         "ratio": None, "p_value": None, "status": "missing"})
+            continue
+        best = minimum_p_value(len(new["samples"]), len(old["samples"]))
+        if best >= alpha:
+            raise ValueError(
+                f"{case}: {len(new['samples'])} current and {len(old['samples'])} baseline "
+                f"repeats cannot reach p < {alpha} (minimum p = {best:.4f}); use at least "
+                f"{required_repeats(alpha)} repeats")
+        ratio = new["median_seconds"] / old["median_seconds"]
+        slower = mann_whitney_greater(new["samples"], old["samples"])
+        faster = mann_whitney_greater(old["samples"], new["samples"])
+        if ratio > 1 + threshold and slower < alpha:
+            status, p_value = "regression", slower
+        elif ratio < 1 / (1 + threshold) and faster < alpha:
+            status, p_value = "improvement", faster
+        else:
+            status, p_value = "unchanged", min(slower, faster)
+        rows.append({"case": case, "baseline": old["median_seconds"],
+                     "current": new["median_seconds"], "ratio": ratio,
+                     "p_value": p_value, "status": status})
+    return rows
+
+def remeasure(baseline):
+    """
+    Measure the cases of a baseline again, with its settings and steps per repeat.
+
+    Parameters:
+    - baseline (dict): Baseline, see load_results().
+
+    Returns:
+    - dict: New run in the format of load_results().
+    """
+    settings = dict(baseline["settings"])
+    results = []
+    for old in baseline["results"]:
+        settings["steps"] = old["steps"]
+        settings["repeats"] = old["repeats"]
+        results.append(measure(_key(old), **settings))
+    return {"machine": machine_metadata(), "settings": baseline["settings"], "results": results}
+
+def machine_differences(baseline, current):
+    """
+    Machine metadata that differs between two runs.
+
+    Returns:
+    - list of str: One "key: baseline -> current" entry per difference.
+    """
+    return [f"{key}: {baseline['machine'].get(key)} -> {current['machine'].get(key)}"
+            for key in MACHINE_KEYS
+            if baseline["machine"].get(key) != current["machine"].get(key)]
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+
+    Parameters:
+    - argv (list of str, optional): Arguments to parse, defaults to sys.argv[1:].
+
+    Returns:
+    - argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Track benchmark baselines and regressions.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    save = commands.add_parser("save", help="Store benchmark results as a baseline.")
+    save.add_argument("results", help="JSON file written by benchmark.py --json.")
+    save.add_argument("--name", help="Baseline name (default: date and short commit).")
+    save.add_argument("--directory", default=BASELINE_DIR, help="Directory of the baselines.")
+    check = commands.add_parser("compare", help="Compare a run against a baseline.")
+    check.add_argument("baseline", help="Baseline JSON file.")
+    check.add_argument("current", nargs="?",
+                       help="benchmark.py JSON file to check (default: measure the baseline's "
+                            "cases now).")
+    check.add_argument("--threshold", type=float, default=0.05,
+                       help="Relative slowdown of the median tolerated.")
+    check.add_argument("--alpha", type=float, default=0.01,
+                       help="Significance level of the slowdown test.")
+    check.add_argument("--json", metavar="PATH", help="Save the new measurements (when no current file is given).")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Run the command given on the command line.
+
+    Parameters:
+    - argv (list of str, optional): Arguments to parse, defaults to sys.argv[1:].
+
+    Returns:
+    - int: Exit status, 1 if the comparison found a regression, 2 if the runs have too
+      few repeats to detect one.
+    """
+    args = parse_args(argv)
+    if args.command == "save":
+        print(f"baseline saved to {save_baseline(args.results, args.name, args.directory)}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if args.current:
+        current = load_results(args.current)
+    else:
+        current = remeasure(baseline)
+        if args.json:
+            write_json(current["results"], args.json, current["settings"])
+    for difference in machine_differences(baseline, current):
+        print(f"warning: machine differs from the baseline ({difference})")
+
+    try:
+        rows = compare(baseline, current, args.threshold, args.alpha)
+    except ValueError as error:
+        print(f"error: {error}")
+        return 2
+    print(f"{'backend':>9} {'size':>6} {'density':>7} {'threads':>7} {'baseline ms':>12} "
+          f"{'current ms':>11} {'ratio':>7} {'p':>8}  status")
+    for row in rows:
+        backend, size, density, threads = row["case"]
+        threads = "-" if threads is None else threads
+        if row["current"] is None:
+            print(f"{backend:>9} {size:>6} {density:>7.2f} {threads:>7} "
+                  f"{row['baseline'] * 1e3:>12.4f} {'-':>11} {'-':>7} {'-':>8}  missing")
+            continue
+        print(f"{backend:>9} {size:>6} {density:>7.2f} {threads:>7} "
+              f"{row['baseline'] * 1e3:>12.4f} {row['current'] * 1e3:>11.4f} "
+              f"{row['ratio']:>7.3f} {row['p_value']:>8.4f}  {row['status']}")
+    regressions = sum(row["status"] == "regression" for row in rows)
+    print(f"{regressions} regression(s) in {len(rows)} case(s)")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+Game of Life Rules
+-------------------------------------------------------
+Life-like rules in B/S notation ("B3/S23", "B36/S23", "B2/S", ...) and Generations
+rules with extra dying states ("B2/S/C3", Brian's Brain).
+
+Every rule is compiled into a lookup table indexed by [cell state, live neighbours]
+giving the next state, which the kernels apply without branching. Tables are passed
+to the kernels as arguments, so one compiled kernel runs every rule at the same speed.
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import re
+from functools import lru_cache
+import numpy as np
+
+NAMED_RULES = {
+    "life": "B3/S23",
+    "conway": "B3/S23",
+    "highlife": "B36/S23",
+    "seeds": "B2/S",
+    "daynight": "B3678/S34678",
+    "brians-brain": "B2/S/C3",
+}
+
+_BS_PATTERN = re.compile(r"^B(?P<birth>[0-8]*)/S(?P<survive>[0-8]*)(?:/C?(?P<states>\d+))?$", re.I)
+_SB_PATTERN = re.compile(r"^(?P<survive>[0-8]*)/(?P<birth>[0-8]*)(?:/(?P<states>\d+))?$")
+
+class Rule:
+    """
+    Life-like or Generations rule.
+
+    Parameters:
+    - birth (iterable of int): Neighbour counts that make a dead cell alive.
+    - survive (iterable of int): Neighbour counts that keep a live cell alive.
+    - states (int): Number of cell states. 2 for Life-like rules; more for Generations
+      rules, where a live cell that does not survive goes through states 2..states-1
+      before dying.
+    """
+    def __init__(self, birth, survive, states=2):
+        self.birth = frozenset(birth)
+        self.survive = frozenset(survive)
+        self.states = states
+        if not self.birth | self.survive <= set(range(9)):
+            raise ValueError("Neighbour counts must be between 0 and 8")
+        if not 2 <= states <= 255:
+            raise ValueError("A rule must have between 2 and 255 states")
+
+        table = np.zeros((states, 9), dtype=np.uint8)
+        for n in range(9):
+            table[0, n] = 1 if n in self.birth else 0
+            table[1, n] = 1 if n in self.survive else 2 % states
+        for state in range(2, states):
+            table[state, :] = (state + 1) % states
+        table.flags.writeable = False
+        self.table = table
+
+        # The two-state part of the table packed into bitmasks indexed by the 3x3 block
+        # sum (neighbours plus the cell itself), for kernels that compute that sum.
+        self.birth_bits = sum(1 << n for n in self.birth)
+        self.survive_bits = sum(1 << (n + 1) for n in self.survive)
+
+    def __str__(self):
+        text = f"B{''.join(map(str, sorted(self.birth)))}/S{''.join(map(str, sorted(self.survive)))}"
+        return text if self.states == 2 else f"{text}/C{self.states}"
+
+    def __repr__(self):
+        return f"Rule({str(self)!r})"
+
+    def __eq__(self, other):
+        return isinstance(other, Rule) and str(self) == str(other)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    @property
+    def is_generations(self):
+        """
+        True for rules with more than two states.
+        """
+        return self.states > 2
+
+@lru_cache(maxsize=None)
+def parse_rule(text):
+    """
+    Parse a rule string. Accepts B/S notation ("B36/S23"), S/B notation ("23/36"),
+    Generations rules ("B2/S/C3" or "/2/3") and the names in NAMED_RULES.
+    Parsed rules are cached, so the same string always returns the same Rule.
+
+    Parameters:
+    - text (str): Rule description.
+
+    Returns:
+    - Rule: Parsed rule.
+    """
+    cleaned = NAMED_RULES.get(text.strip().lower(), text.strip())
+    match = _BS_PATTERN.match(cleaned) or _SB_PATTERN.match(cleaned)
+    if match is None:
+        raise ValueError(f"Invalid rule {text!r}, expected B/S notation such as 'B3/S23'")
+    states = int(match.group("states") or 2)
+    return Rule(map(int, match.group("birth")), map(int, match.group("survive")), states)
+
+def as_rule(rule):
+    """
+    Normalize a rule argument: None means Conway's Life, strings are parsed.
+
+    Parameters:
+    - rule (Rule, str or None): Rule or rule description.
+
+    Returns:
+    - Rule: Rule object.
+    """
+    if rule is None:
+        return CONWAY
+    if isinstance(rule, Rule):
+        return rule
+    return parse_rule(rule)
+
+CONWAY = parse_rule("B3/S23")
@@ -5,7 +5,8 @@ Benchmarking script for strong and weak scaling of the Numba-accelerated
 Game of Life simulation. Uses matplotlib to visualize performance metrics.
 
 This script imports the compute_next_step function from `main_numba.py`
-and evaluates runtime across multiple threads.
+and evaluates runtime across multiple threads, or uses the ProcessBackend from
+`distributed.py` to evaluate runtime across multiple worker processes.
 
 Authors: Nathan Ghenassia, Maria Fernanda Camacho
 """
@@ -16,10 +17,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 from numba import set_num_threads
 from main_numba import compute_next_step
+from distributed import ProcessBackend
+from initial_state import random_grid
 
 def measure_runtime(grid: np.ndarray, steps: int) -> float:
     """
-    Measures total execution time for a number of Game of Life steps.
+    Measures total execution time for a number of Game of Life steps. One untimed
+    step is run first so that the JIT compile is not measured.
 
     Parameters:
     - grid (np.ndarray): Initial state of the Game of Life grid.
@@ -28,18 +32,62 @@ def measure_runtime(grid: np.ndarray, steps: int) -> float:
     Returns:
     - float: Total execution time in seconds.
     """
-    start = time.time()
+    compute_next_step(grid)
+    start = time.perf_counter()
     for _ in range(steps):
         grid = compute_next_step(grid)
-    return time.time() - start
+    return time.perf_counter() - start
+
+def measure_process_runtime(grid: np.ndarray, steps: int, processes: int) -> float:
+    """
+    Measures total execution time for a number of Game of Life steps run by
+    worker processes. Process startup is not included: the backend only returns
+    once its workers are ready.
+
+    Parameters:
+    - grid (np.ndarray): Initial state of the Game of Life grid.
+    - steps (int): Number of iterations to simulate.
+    - processes (int): Number of worker processes.
+
+    Returns:
+    - float: Total execution time in seconds.
+    """
+    backend = ProcessBackend(grid, processes=processes)
+    try:
+        start = time.perf_counter()
+        backend.advance(steps)
+        return time.perf_counter() - start
+    finally:
+        backend.close()
 
 
 class ScalingTest:
     """
     Class encapsulating strong and weak scaling tests.
+
+    Parameters:
+    - unit (str): "threads" (Numba thread pool) or "processes" (worker processes).
     """
-    def __init__(self):
+    def __init__(self, unit: str = "threads"):
         self.results = []
+        self.unit = unit
+
+    def _measure(self, grid: np.ndarray, steps: int, workers: int) -> float:
+        """
+        Measure runtime with the given number of threads or processes.
+
+        Parameters:
+        - grid (np.ndarray): Initial state of the Game of Life grid.
+        - steps (int): Number of iterations to simulate.
+        - workers (int): Number of threads or processes.
+
+        Returns:
+        - float: Total execution time in seconds.
+        """
+        if self.unit == "processes":
+            return measure_process_runtime(grid, steps, workers)
+        set_num_threads(workers)
+        return measure_runtime(grid, steps)
 
     def strong_scaling_test(self):
         """
@@ -47,15 +95,14 @@ class ScalingTest:
         """
         size = self._prompt_choice("Enter fixed grid size 32, 64, 128, 256, 512, 1024:", [32, 64, 128, 256, 512, 1024])
         steps = self._prompt_int("Number of iterations to run:")
-        min_threads = self._prompt_int("Minimum number of threads:")
-        max_threads = self._prompt_int("Maximum number of threads:")
+        min_threads = self._prompt_int(f"Minimum number of {self.unit}:")
+        max_threads = self._prompt_int(f"Maximum number of {self.unit}:")
 
-        base_grid = np.random.choice([0, 1], size=(size, size), p=[0.85, 0.15]).astype(np.uint8)
+        base_grid = random_grid(size, size, prob_alive=0.15, seed=0)
         self.results.clear()
 
         for threads in range(min_threads, max_threads + 1):
-            set_num_threads(threads)
-            runtime = measure_runtime(base_grid.copy(), steps)
+            runtime = self._measure(base_grid.copy(), steps, threads)
             self.results.append((threads, runtime))
 
         self._plot_scaling_results(kind="strong")
@@ -66,17 +113,16 @@ class ScalingTest:
         """
         workload_per_thread = self._prompt_int("Enter workload per thread (e.g., 10000):")
         steps = self._prompt_int("Number of iterations to run:")
-        min_threads = self._prompt_int("Minimum number of threads:")
-        max_threads = self._prompt_int("Maximum number of threads:")
+        min_threads = self._prompt_int(f"Minimum number of {self.unit}:")
+        max_threads = self._prompt_int(f"Maximum number of {self.unit}:")
 
         self.results.clear()
 
         for threads in range(min_threads, max_threads + 1):
-            set_num_threads(threads)
             total_cells = threads * workload_per_thread
             size = int(np.sqrt(total_cells))
-            grid = np.random.choice([0, 1], size=(size, size), p=[0.85, 0.15]).astype(np.uint8)
-            runtime = measure_runtime(grid, steps)
+            grid = random_grid(size, size, prob_alive=0.15, seed=threads)
+            runtime = self._measure(grid, steps, threads)
             self.results.append((threads, runtime))
 
         self._plot_scaling_results(kind="weak")
@@ -90,6 +136,8 @@ class ScalingTest:
         """
         threads_list, runtimes = zip(*self.results)
         base_time = runtimes[0]
+        label = self.unit.capitalize()
+        suffix = "" if self.unit == "threads" else f"_{self.unit}"
 
         if kind == "strong":
             speedups = [base_time / t for t in runtimes]
@@ -100,16 +148,16 @@ class ScalingTest:
             plt.subplot(1, 2, 1)
             plt.plot(threads_list, speedups, marker='o')
             plt.title("Strong Scaling: Speedup")
-            plt.xlabel("Threads")
+            plt.xlabel(label)
             plt.ylabel("Speedup")
 
             plt.subplot(1, 2, 2)
             plt.plot(threads_list, efficiencies, marker='o')
             plt.title("Strong Scaling: Efficiency")
-            plt.xlabel("Threads")
+            plt.xlabel(label)
             plt.ylabel("Efficiency")
 
-            self._save_figure("strong_scaling.png")
+            self._save_figure(f"strong_scaling{suffix}.png")
 
         elif kind == "weak":
             efficiencies = [base_time / t for t in runtimes]
@@ -119,16 +167,16 @@ class ScalingTest:
             plt.subplot(1, 2, 1)
             plt.plot(threads_list, runtimes, marker='o')
             plt.title("Weak Scaling: Runtime")
-            plt.xlabel("Threads")
+            plt.xlabel(label)
             plt.ylabel("Execution Time (s)")
 
             plt.subplot(1, 2, 2)
             plt.plot(threads_list, efficiencies, marker='o')
             plt.title("Weak Scaling: Efficiency")
-            plt.xlabel("Threads")
+            plt.xlabel(label)
             plt.ylabel("Efficiency")
 
-            self._save_figure("weak_scaling.png")
+            self._save_figure(f"weak_scaling{suffix}.png")
 
         plt.tight_layout()
         plt.show()
@@ -166,7 +214,8 @@ class ScalingTest:
 
 
 if __name__ == "__main__":
-    test = ScalingTest()
+    unit = input("Scale over: (1) Threads, (2) Processes: ").strip()
+    test = ScalingTest(unit="processes" if unit == "2" else "threads")
     mode = input("Choose mode: (1) Strong Scaling, (2) Weak Scaling: ").strip()
     if mode == '1':
         test.strong_scaling_test()
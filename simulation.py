@@ -0,0 +1,401 @@
+"""
+Game of Life Simulation Core
+-------------------------------------------------------
+Display-independent simulation state for Conway's Game of Life and other Life-like rules.
+
+This module only depends on NumPy. Stepping engines ("backends") live next to their
+kernels in main.py and main_numba.py and are imported lazily, so selecting the NumPy
+backend never imports Numba and nothing here imports matplotlib.
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import importlib
+import os
+import time
+import numpy as np
+from cycles import CycleDetector, fingerprint
+from initial_state import random_fill
+from rules import as_rule
+
+# Backend name -> "module:class". Modules are only imported when the backend is used.
+BACKENDS = {
+    "numpy": "main:NumpyBackend",
+    "loop": "main:LoopBackend",
+    "numba": "main_numba:NumbaBackend",
+    "halo": "main_numba:HaloBackend",
+    "tiled": "main_numba:TiledBackend",
+    "packed": "main_numba:PackedBackend",
+    "active": "active_region:ActiveRegionBackend",
+    "hashlife": "hashlife:HashLifeBackend",
+    "sparse": "sparse:SparseBackend",
+    "processes": "distributed:ProcessBackend",
+    "memmap": "outofcore:MemmapBackend",
+    "auto": "autotune:AutoBackend",
+}
+
+# Numba threading layers in order of preference. Numba tries TBB first by default, but
+# a process that ran parallel kernels from a thread other than the main one (as the
+# viewer's SimulationThread does) never exits under TBB; OpenMP and the workqueue do.
+THREADING_LAYER_PRIORITY = ["omp", "workqueue", "tbb"]
+
+def pin_threading_layer():
+    """
+    Make Numba pick its threading layer from THREADING_LAYER_PRIORITY, unless one was
+    chosen with the NUMBA_THREADING_LAYER or NUMBA_THREADING_LAYER_PRIORITY
+    environment variables. The layer is fixed by the first parallel kernel launch, so
+    the modules defining parallel kernels call this when they are imported.
+    """
+    if "NUMBA_THREADING_LAYER" in os.environ or "NUMBA_THREADING_LAYER_PRIORITY" in os.environ:
+        return
+    import numba
+    numba.config.THREADING_LAYER_PRIORITY = THREADING_LAYER_PRIORITY
+
+def load_backend(name):
+    """
+    Import and return the backend class registered under the given name.
+
+    Parameters:
+    - name (str): Backend name, one of BACKENDS.
+
+    Returns:
+    - type: Backend class.
+    """
+    try:
+        module_name, class_name = BACKENDS[name].split(":")
+    except KeyError:
+        raise ValueError(f"Unknown backend {name!r}, expected one of {sorted(BACKENDS)}") from None
+    return getattr(importlib.import_module(module_name), class_name)
+
+class Backend:
+    """
+    Base class for stepping engines.
+
+    A backend owns the board state. `grid` is a dense 2D array view of the current
+    generation and may be reassigned to replace the state; `step()` advances it by
+    one generation. Dense backends simply keep `grid` as an attribute.
+
+    Parameters:
+    - grid (np.ndarray): Initial dense grid (2D array of cell states).
+    - rule (Rule, str or None): Rule to apply, Conway's Life by default.
+    """
+    dtype = np.uint8
+    supports_generations = False
+    supports_birth_on_zero = True
+    # True if the backend takes over the storage it is given (e.g. its own board file)
+    # and must not receive a copy.
+    adopts_storage = False
+
+    @classmethod
+    def allocate(cls, rows, cols, **options):
+        """
+        Zero-filled grid for the initial state, filled in place before the backend is
+        created. Backends that keep the board outside RAM return their own storage.
+
+        Parameters:
+        - rows (int): Number of rows.
+        - cols (int): Number of columns.
+        - options: The backend's keyword arguments.
+
+        Returns:
+        - np.ndarray: Writable (rows, cols) array of the backend's dtype.
+        """
+        return np.zeros((rows, cols), dtype=cls.dtype)
+
+    def __init__(self, grid, rule=None):
+        self.rule = as_rule(rule)
+        if self.rule.is_generations and not self.supports_generations:
+            raise ValueError(f"{type(self).__name__} only supports two-state rules, got {self.rule}")
+        if 0 in self.rule.birth and not self.supports_birth_on_zero:
+            raise ValueError(f"{type(self).__name__} cannot run B0 rules on an unbounded plane")
+        self.grid = np.ascontiguousarray(grid, dtype=self.dtype)
+
+    def snapshot(self):
+        """
+        Copy of the current generation, in the backend's own representation, that
+        later steps do not modify. It is taken between steps and should be cheap;
+        expand() turns it into a dense grid, in any thread.
+
+        Returns:
+        - object: Snapshot for expand().
+        """
+        return np.array(self.grid)
+
+    def expand(self, snapshot):
+        """
+        Dense grid of a snapshot taken by snapshot().
+
+        Parameters:
+        - snapshot (object): Result of snapshot().
+
+        Returns:
+        - np.ndarray: 2D array of cell states.
+        """
+        return snapshot
+
+    def live_cells(self):
+        """
+        Plane coordinates of every live cell, for backends whose universe extends
+        beyond `grid` (e.g. checkpoints of an unbounded plane). Cell (row, col) of
+        `grid` is at plane coordinates (row, col).
+
+        Returns:
+        - tuple or None: (rows, cols) int64 coordinate arrays, or None if `grid` holds
+          the whole board.
+        """
+        return None
+
+    def set_live_cells(self, rows, cols):
+        """
+        Replace the universe with live cells at plane coordinates, see live_cells().
+
+        Parameters:
+        - rows (np.ndarray): Row coordinates.
+        - cols (np.ndarray): Column coordinates.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no cells outside its grid")
+
+    def take_changes(self):
+        """
+        Blocks of cells that changed since the previous call, for backends that track
+        them while stepping.
+
+        Returns:
+        - tuple or None: (block_size, boolean mask of blocks), or None if unknown.
+        """
+        return None
+
+    def fingerprint(self):
+        """
+        64-bit fingerprint of the current generation, used for cycle detection. Equal
+        boards give equal fingerprints within a backend. Backends whose `grid` is
+        built on access should hash their own storage instead.
+
+        Returns:
+        - int: Fingerprint.
+        """
+        return fingerprint(self.grid)
+
+    def step(self):
+        """
+        Advance the board by one generation.
+        """
+        raise NotImplementedError
+
+    def advance(self, steps):
+        """
+        Advance the board by several generations. Backends with a multi-generation
+        kernel override this to avoid a Python round trip per generation.
+
+        Parameters:
+        - steps (int): Number of generations.
+        """
+        for _ in range(steps):
+            self.step()
+
+class Simulation:
+    """
+    Game of Life state and stepping, without any display.
+
+    Parameters:
+    - rows (int): Number of rows in the grid.
+    - cols (int): Number of columns in the grid.
+    - initial_state (2D list or np.ndarray, optional): User-defined initial state.
+    - random_init (bool): If True, initialize with random grid.
+    - prob_alive (float): Probability a cell is initially alive in random mode.
+    - backend (str): Stepping engine, one of BACKENDS.
+    - seed (int, optional): Seed for the random initial state; the same seed always
+      gives the same board. Without one, the entropy drawn is kept in `self.seed`.
+    - backend_options (dict, optional): Extra keyword arguments for the backend
+      (e.g. {"boundary": "dead"} for the halo backend).
+    - rule (Rule or str, optional): Rule in B/S notation, e.g. "B36/S23". Defaults to
+      Conway's Life (B3/S23).
+    """
+    def __init__(self, rows, cols, initial_state=None, random_init=False, prob_alive=0.2,
+                 backend="numpy", seed=None, backend_options=None, rule=None):
+        backend_class = load_backend(backend)
+        self.rows = rows
+        self.cols = cols
+        self.backend_name = backend
+        self.backend_options = backend_options = dict(backend_options or {})
+        self.generation = 0
+        self.cycle = None
+        self.cycle_detector = CycleDetector()
+        # The seed sequence drives the initial board and the run's random generator,
+        # whose state is saved in checkpoints. `seed` records the entropy actually used.
+        sequence = np.random.SeedSequence(seed)
+        self.seed = sequence.entropy
+        self.rng = np.random.default_rng(sequence)
+        # Optional recorder.Recorder receiving every `recorder.every`-th generation.
+        self.recorder = None
+        # Optional checkpoint.Checkpointer saving every `checkpointer.every`-th generation.
+        self.checkpointer = None
+        # Optional metrics.Metrics timing the backend and sampling every `metrics.every`-th
+        # generation.
+        self.metrics = None
+
+        if initial_state is not None:
+            # Backends step in place, so they get a copy of the caller's board. Backends
+            # adopting their storage get memmaps as they are, so a board file can be
+            # handed over without a copy.
+            if backend_class.adopts_storage:
+                grid = np.asanyarray(initial_state, dtype=backend_class.dtype)
+            else:
+                grid = np.array(initial_state, dtype=backend_class.dtype)
+            self.rows, self.cols = grid.shape
+        else:
+            grid = backend_class.allocate(rows, cols, **backend_options)
+            if random_init:
+                random_fill(grid, prob_alive, sequence)
+
+        self.backend = backend_class(grid, rule=rule, **backend_options)
+
+    @property
+    def rule(self):
+        """
+        Rule applied by the backend.
+        """
+        return self.backend.rule
+
+    @property
+    def grid(self):
+        """
+        Dense 2D array of the current generation.
+        """
+        return self.backend.grid
+
+    @grid.setter
+    def grid(self, value):
+        if self.backend.adopts_storage:
+            self.backend.grid = np.ascontiguousarray(value, dtype=self.backend.dtype)
+        else:
+            # A copy, so later steps never write into the caller's array.
+            self.backend.grid = np.array(value, dtype=self.backend.dtype)
+        self._forget_cycle()
+
+    def _forget_cycle(self):
+        """
+        Drop cycle information after the board was edited.
+        """
+        self.cycle = None
+        self.cycle_detector.reset()
+
+    def set_cell(self, row, col, value):
+        """
+        Set a single cell to alive (1) or dead (0), or to any state of a Generations rule.
+
+        Parameters:
+        - row (int): Row index.
+        - col (int): Column index.
+        - value (int): New cell state.
+        """
+        grid = self.backend.grid
+        grid[row, col] = value
+        self.backend.grid = grid
+        self._forget_cycle()
+
+    def _record(self):
+        """
+        Pass the current generation to the recorder if one is attached and wants it.
+        """
+        recorder = self.recorder
+        if (recorder is not None and self.generation % recorder.every == 0
+                and recorder.last_generation != self.generation):
+            recorder.record(self.generation, self.grid)
+
+    def _checkpoint(self):
+        """
+        Save a checkpoint if a checkpointer is attached and the generation is due.
+        """
+        checkpointer = self.checkpointer
+        if (checkpointer is not None and self.generation % checkpointer.every == 0
+                and checkpointer.last_generation != self.generation):
+            checkpointer.save(self)
+
+    def _advance(self, steps):
+        """
+        Advance the backend and the generation counter, and report the time spent in
+        the backend to the metrics if attached.
+        """
+        start = time.perf_counter()
+        if steps == 1:
+            self.backend.step()
+        else:
+            self.backend.advance(steps)
+        elapsed = time.perf_counter() - start
+        self.generation += steps
+        if self.metrics is not None:
+            self.metrics.observe(self, steps, elapsed)
+
+    def _next_stop(self, target):
+        """
+        Generations to advance before the target or the next generation to record,
+        checkpoint or sample, whichever comes first.
+        """
+        chunk = target - self.generation
+        for hook in (self.recorder, self.checkpointer, self.metrics):
+            if hook is not None:
+                chunk = min(chunk, hook.every - self.generation % hook.every)
+        return chunk
+
+    def step(self):
+        """
+        Advance the game state by one iteration.
+        """
+        self._advance(1)
+        self._record()
+        self._checkpoint()
+
+    def run(self, steps, on_cycle=None):
+        """
+        Advance the simulation by a number of iterations.
+
+        Parameters:
+        - steps (int): Number of iterations to run.
+        - on_cycle (str or None): Cycle handling. None runs every step without checks.
+          "stop" fingerprints every generation and returns early once the board repeats
+          an earlier state. "fast_forward" does the same, then skips whole periods and
+          computes only the remaining steps mod the period. Once found, the cycle is
+          stored in self.cycle (start generation and period).
+
+        If a recorder is attached, the starting generation and every generation
+        computed that is a multiple of `recorder.every` are recorded; generations
+        skipped by fast-forwarding are not. An attached checkpointer likewise saves
+        every multiple of `checkpointer.every` reached, and attached metrics sample
+        every multiple of `metrics.every`.
+
+        Returns:
+        - int: Number of generations actually computed.
+        """
+        if on_cycle not in (None, "stop", "fast_forward"):
+            raise ValueError(f"Unknown on_cycle {on_cycle!r}, expected None, 'stop' or 'fast_forward'")
+        self._record()
+        if on_cycle is None:
+            target = self.generation + steps
+            while self.generation < target:
+                # Advance in one call, or in chunks ending at the generations to record,
+                # checkpoint or sample.
+                chunk = self._next_stop(target)
+                self._advance(chunk)
+                self._record()
+                self._checkpoint()
+            return steps
+
+        target = self.generation + steps
+        computed = 0
+        detector = self.cycle_detector
+        if self.cycle is None:
+            self.cycle = detector.observe_fingerprint(self.generation, self.backend.fingerprint())
+        while self.cycle is None and self.generation < target:
+            self.step()
+            computed += 1
+            self.cycle = detector.observe_fingerprint(self.generation, self.backend.fingerprint())
+
+        if self.cycle is not None and on_cycle == "fast_forward":
+            remaining = (target - self.generation) % self.cycle.period
+            self.generation = target - remaining
+            self._advance(remaining)
+            computed += remaining
+            self._record()
+            self._checkpoint()
+        return computed
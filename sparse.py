@@ -0,0 +1,203 @@
+"""
+Game of Life Sparse Engine
+-------------------------------------------------------
+Unbounded Game of Life that stores only the coordinates of live cells.
+
+Each live cell (row, col) is packed into one int64 key and the keys are kept in a
+sorted array. A generation shifts every key by the eight neighbour offsets, counts
+the occurrences with np.unique, and keeps the cells with the right counts, so memory
+and time scale with the population rather than with the board area.
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import numpy as np
+from cycles import fingerprint
+from rules import as_rule
+from simulation import Backend
+
+# Keys are ((row + BIAS) << COL_BITS) | (col + BIAS); coordinates must stay in [-BIAS, BIAS).
+COL_BITS = 31
+BIAS = 1 << 30
+NEIGHBOUR_OFFSETS = np.array([(dr << COL_BITS) + dc
+                              for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                              if dr or dc], dtype=np.int64)
+
+def encode(rows, cols):
+    """
+    Pack coordinate arrays into int64 keys.
+
+    Parameters:
+    - rows (np.ndarray): Row coordinates.
+    - cols (np.ndarray): Column coordinates.
+
+    Returns:
+    - np.ndarray: int64 keys.
+    """
+    return ((np.asarray(rows, dtype=np.int64) + BIAS) << COL_BITS) | (np.asarray(cols, dtype=np.int64) + BIAS)
+
+def decode(keys):
+    """
+    Unpack int64 keys into row and column coordinate arrays.
+
+    Parameters:
+    - keys (np.ndarray): int64 keys.
+
+    Returns:
+    - tuple: (rows, cols) int64 arrays.
+    """
+    return (keys >> COL_BITS) - BIAS, (keys & ((1 << COL_BITS) - 1)) - BIAS
+
+class SparseLife:
+    """
+    Unbounded universe holding the sorted keys of its live cells.
+
+    Parameters:
+    - keys (np.ndarray, optional): Sorted, unique int64 keys of the live cells.
+    - rule (Rule or str, optional): Two-state rule without B0, Conway's Life by default.
+    """
+    def __init__(self, keys=None, rule=None):
+        self.rule = as_rule(rule)
+        if self.rule.is_generations or 0 in self.rule.birth:
+            raise ValueError(f"The sparse engine needs a two-state rule without B0, got {self.rule}")
+        self.generation = 0
+        self.keys = np.empty(0, dtype=np.int64) if keys is None else keys
+        self._update_bounding_box()
+
+    @classmethod
+    def from_grid(cls, grid, top=0, left=0, rule=None):
+        """
+        Build a universe from the live cells of a dense grid.
+
+        Parameters:
+        - grid (np.ndarray): Dense grid (2D array of 0s and 1s).
+        - top (int): Plane row of the grid's first row.
+        - left (int): Plane column of the grid's first column.
+        - rule (Rule or str, optional): Two-state rule without B0.
+
+        Returns:
+        - SparseLife: New universe.
+        """
+        rows, cols = np.nonzero(grid)
+        return cls(encode(rows + top, cols + left), rule)
+
+    @property
+    def population(self):
+        """
+        Number of live cells.
+        """
+        return self.keys.size
+
+    @property
+    def cells(self):
+        """
+        (rows, cols) coordinate arrays of the live cells.
+        """
+        return decode(self.keys)
+
+    def _update_bounding_box(self):
+        """
+        Recompute bounding_box: (top, left, bottom, right) with exclusive bottom/right,
+        or None when the universe is empty.
+        """
+        if self.keys.size == 0:
+            self.bounding_box = None
+            return
+        rows, cols = decode(self.keys)
+        # Keys are sorted by row first, so the row extent comes from the ends.
+        self.bounding_box = (int(rows[0]), int(cols.min()), int(rows[-1]) + 1, int(cols.max()) + 1)
+
+    def step(self):
+        """
+        Advance the universe by one generation.
+        """
+        if self.keys.size == 0:
+            self.generation += 1
+            return
+        neighbours = (self.keys[:, None] + NEIGHBOUR_OFFSETS[None, :]).ravel()
+        candidates, counts = np.unique(neighbours, return_counts=True)
+
+        index = np.searchsorted(self.keys, candidates)
+        alive = np.zeros(candidates.size, dtype=np.bool_)
+        in_range = index < self.keys.size
+        alive[in_range] = self.keys[index[in_range]] == candidates[in_range]
+
+        # Dead cells without live neighbours never appear as candidates: fine without B0.
+        keys = candidates[self.rule.table[alive.view(np.uint8), counts].astype(np.bool_)]
+        if 0 in self.rule.survive:
+            # Isolated live cells are not candidates either, and survive under S0.
+            isolated = self.keys[~np.isin(self.keys, candidates, assume_unique=True)]
+            keys = np.union1d(keys, isolated)
+        self.keys = keys
+        self.generation += 1
+        self._update_bounding_box()
+
+    def to_grid(self, top, left, rows, cols):
+        """
+        Extract a dense window of the universe.
+
+        Parameters:
+        - top (int): Plane row of the window's first row.
+        - left (int): Plane column of the window's first column.
+        - rows (int): Window height.
+        - cols (int): Window width.
+
+        Returns:
+        - np.ndarray: Dense uint8 array of shape (rows, cols).
+        """
+        grid = np.zeros((rows, cols), dtype=np.uint8)
+        cell_rows, cell_cols = decode(self.keys)
+        cell_rows = cell_rows - top
+        cell_cols = cell_cols - left
+        inside = (cell_rows >= 0) & (cell_rows < rows) & (cell_cols >= 0) & (cell_cols < cols)
+        grid[cell_rows[inside], cell_cols[inside]] = 1
+        return grid
+
+class SparseBackend(Backend):
+    """
+    Sparse universe exposed as a backend. `grid` is the window of the unbounded
+    plane covering the initial board; assigning it replaces the universe with the
+    window contents.
+
+    Parameters:
+    - grid (np.ndarray): Initial dense grid.
+    - rule (Rule or str, optional): Two-state rule without B0, Conway's Life by default.
+    """
+    supports_birth_on_zero = False
+
+    def __init__(self, grid, rule=None):
+        self.universe = SparseLife(rule=rule)
+        super().__init__(grid, rule)
+
+    @property
+    def grid(self):
+        return self.universe.to_grid(0, 0, self.rows, self.cols)
+
+    @grid.setter
+    def grid(self, value):
+        self.rows, self.cols = value.shape
+        generation = self.universe.generation
+        self.universe = SparseLife.from_grid(value, rule=self.rule)
+        self.universe.generation = generation
+
+    def snapshot(self):
+        # step() replaces the key array instead of modifying it.
+        return self.universe.keys
+
+    def live_cells(self):
+        return self.universe.cells
+
+    def set_live_cells(self, rows, cols):
+        generation = self.universe.generation
+        self.universe = SparseLife(np.unique(encode(rows, cols)), self.rule)
+        self.universe.generation = generation
+
+    def fingerprint(self):
+        # The window misses cells that left it: hash the sorted keys of every live cell.
+        return fingerprint(self.universe.keys)
+
+    def expand(self, snapshot):
+        return SparseLife(snapshot, self.rule).to_grid(0, 0, self.rows, self.cols)
+
+    def step(self):
+        self.universe.step()
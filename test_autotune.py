@@ -0,0 +1,66 @@
+"""
+Game of Life Backend Autotuning Tests
+-------------------------------------------------------
+Checks the auto backend against the per-cell reference, that tuning results are
+cached per set of candidate backends, and that tuning and stepping leave the Numba
+thread count of the caller as it was.
+
+Usage:
+    python -m pytest -q test_autotune.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import os
+import subprocess
+import sys
+import numpy as np
+import pytest
+from autotune import AutoBackend, load_cache, lookup, save_cache, tuning_key
+from test_backends import RULES, check_against_reference
+
+@pytest.fixture(autouse=True)
+def tuning_cache(tmp_path, monkeypatch):
+    # The auto backend must not read or write the user's tuning cache.
+    path = str(tmp_path / "tuning.json")
+    monkeypatch.setenv("LIFE_TUNING_CACHE", path)
+    return path
+
+@pytest.mark.parametrize("rule", RULES)
+def test_auto_matches_reference(rule):
+    check_against_reference("auto", rule, (40, 72), {"candidates": ["numpy"]})
+
+def test_cache_is_keyed_by_candidates(tuning_cache):
+    assert tuning_key(64, 64, 0.2, "B3/S23", ["halo", "numpy"]) == tuning_key(64, 64, 0.2, "B3/S23", ["numpy", "halo"])
+    assert tuning_key(64, 64, 0.2, "B3/S23", ["numpy"]) != tuning_key(64, 64, 0.2, "B3/S23", ["numpy", "halo"])
+    # A cached winner among numpy and halo is not used when only numpy is allowed.
+    save_cache({tuning_key(32, 32, 0.2, "B3/S23", ["numpy", "halo"]):
+                {"backend": "halo", "threads": 1, "cells_per_second": 1.0}}, tuning_cache)
+    grid = (np.random.default_rng(0).random((32, 32)) < 0.2).astype(np.uint8)
+    assert AutoBackend(grid, candidates=["numpy", "halo"]).backend_name == "halo"
+    backend = AutoBackend(grid, candidates=["numpy"])
+    assert backend.backend_name == "numpy"
+    assert len(load_cache(tuning_cache)) == 2
+    assert lookup(32, 32, 0.2, "B3/S23", candidates=["numpy"]) == backend.tuning
+
+# Tunes and steps with a pool of 4 Numba threads, from a caller using 3.
+THREADS_SCRIPT = """
+import numba, numpy as np
+from autotune import AutoBackend, tune
+from benchmark import set_threads
+set_threads(3)
+assert numba.threading_layer() != "tbb"
+result = tune(32, 32, 0.2, "B3/S23", candidates=["numba"], repeats=1, min_time=0.001)
+assert [entry["threads"] for entry in result["measurements"]] == [1, 2, 4], result
+assert numba.get_num_threads() == 3, numba.get_num_threads()
+backend = AutoBackend(np.zeros((32, 32), dtype=np.uint8), candidates=["numba"])
+backend.advance(2)
+assert numba.get_num_threads() == 3, numba.get_num_threads()
+"""
+
+def test_thread_count_is_restored():
+    env = dict(os.environ, NUMBA_NUM_THREADS="4")
+    result = subprocess.run([sys.executable, "-c", THREADS_SCRIPT], env=env,
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stderr
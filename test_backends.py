@@ -0,0 +1,112 @@
+"""
+Game of Life Backend Tests
+-------------------------------------------------------
+Checks the in-memory dense backends against the per-cell reference
+compute_next_step_loop() over a few rules, board shapes and boundaries. The helpers
+here are shared by the other test_*.py files.
+
+Usage:
+    python -m pytest -q test_backends.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import functools
+import numpy as np
+import pytest
+from main import compute_next_step_loop
+from rules import as_rule
+from simulation import Simulation, load_backend
+
+# Dense backends, with options giving several tiles or blocks on small boards.
+DENSE_BACKENDS = {
+    "numpy": {},
+    "numba": {},
+    "halo": {},
+    "tiled": {"tile_size": 8, "depth": 3},
+    "packed": {},
+    "active": {"block_size": 8},
+}
+RULES = ["B3/S23", "B36/S23", "B3/S023", "B2/S/C3"]
+# A packed row shorter than one word, and one ending in a partial word.
+SHAPES = [(13, 29), (40, 72)]
+STEPS = 5
+
+def random_board(shape, rule, seed=0):
+    """
+    Seeded random board with every state of the rule.
+    """
+    states = as_rule(rule).states
+    return np.random.default_rng(seed).integers(0, states, shape).astype(np.uint8)
+
+@functools.lru_cache(maxsize=None)
+def reference(rule, shape):
+    """
+    Boards of the first STEPS generations computed by compute_next_step_loop().
+    """
+    grid = random_board(shape, rule).astype(int)
+    generations = [grid]
+    for _ in range(STEPS):
+        grid = compute_next_step_loop(grid, rule)
+        generations.append(grid)
+    return generations
+
+def supports(backend, rule):
+    """
+    Whether a backend can run a rule.
+    """
+    rule = as_rule(rule)
+    backend_class = load_backend(backend)
+    return ((backend_class.supports_generations or not rule.is_generations)
+            and (backend_class.supports_birth_on_zero or 0 not in rule.birth))
+
+def close_backend(simulation):
+    """
+    Release the files, processes or shared memory of a simulation's backend.
+    """
+    close = getattr(simulation.backend, "close", None)
+    if close is not None:
+        close()
+
+def check_against_reference(backend, rule, shape, options=None):
+    """
+    Run a backend for STEPS generations, through step() once and then the fused
+    advance() path, and compare both boards with reference().
+    """
+    if not supports(backend, rule):
+        pytest.skip(f"{backend} does not support {rule}")
+    expected = reference(rule, shape)
+    sim = Simulation(0, 0, initial_state=random_board(shape, rule), backend=backend,
+                     backend_options=options, rule=rule)
+    try:
+        sim.step()
+        np.testing.assert_array_equal(sim.grid, expected[1])
+        sim.run(STEPS - 1)
+        np.testing.assert_array_equal(sim.grid, expected[STEPS])
+    finally:
+        close_backend(sim)
+
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("rule", RULES)
+@pytest.mark.parametrize("backend", sorted(DENSE_BACKENDS))
+def test_dense_backend_matches_reference(backend, rule, shape):
+    check_against_reference(backend, rule, shape, DENSE_BACKENDS[backend])
+
+def padded_reference(grid, rule, mode, steps):
+    """
+    Reference generations of a bounded board: every generation the board is padded
+    with one ring of dead ("constant") or mirrored ("edge") cells.
+    """
+    for _ in range(steps):
+        padded = np.pad(grid, 1, mode=mode)
+        grid = compute_next_step_loop(padded, rule)[1:-1, 1:-1]
+    return grid
+
+@pytest.mark.parametrize("boundary, mode", [("dead", "constant"), ("reflect", "edge")])
+@pytest.mark.parametrize("rule", ["B3/S23", "B36/S23"])
+def test_halo_boundaries(boundary, mode, rule):
+    grid = random_board((21, 34), rule, seed=1)
+    sim = Simulation(0, 0, initial_state=grid, backend="halo", rule=rule,
+                     backend_options={"boundary": boundary})
+    sim.run(STEPS)
+    np.testing.assert_array_equal(sim.grid, padded_reference(grid.astype(int), rule, mode, STEPS))
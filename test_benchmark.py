@@ -0,0 +1,53 @@
+"""
+Game of Life Benchmark Suite Tests
+-------------------------------------------------------
+Checks the statistics, the measurement of one case, and the JSON and CSV outputs of
+the benchmark suite on tiny boards.
+
+Usage:
+    python -m pytest -q test_benchmark.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import csv
+import json
+import pytest
+from benchmark import FIELDS, Case, main, measure, summarize
+
+def test_summarize():
+    stats = summarize([5.0, 1.0, 4.0, 2.0, 3.0])
+    assert stats == {"median_seconds": 3.0, "q1_seconds": 2.0, "q3_seconds": 4.0,
+                     "iqr_seconds": 2.0, "min_seconds": 1.0, "mean_seconds": 3.0}
+
+def test_measure_fixed_steps():
+    result = measure(Case("numpy", 32, 0.3, None), steps=4, repeats=3, warmup=1)
+    assert result["steps"] == 4 and result["repeats"] == 3
+    assert len(result["samples"]) == 3
+    assert result["warmup_seconds"] > 0
+    assert result["min_seconds"] <= result["median_seconds"]
+    assert result["cells_per_second"] == pytest.approx(32 * 32 / result["median_seconds"])
+    assert set(FIELDS) <= set(result)
+
+def test_measure_calibrates_steps():
+    result = measure(Case("numpy", 16, 0.3, None), repeats=1, warmup=0, min_time=0.005)
+    steps = result["steps"]
+    assert steps >= 1 and steps & (steps - 1) == 0
+    assert result["warmup_seconds"] == 0.0
+
+def test_main_writes_json_and_csv(tmp_path):
+    json_path, csv_path = str(tmp_path / "bench.json"), str(tmp_path / "bench.csv")
+    results = main(["--backends", "numpy", "--sizes", "16", "24", "--steps", "2",
+                    "--repeats", "2", "--warmup", "1", "--json", json_path, "--csv", csv_path])
+    assert [result["size"] for result in results] == [16, 24]
+
+    with open(json_path) as handle:
+        saved = json.load(handle)
+    assert saved["settings"]["steps"] == 2
+    assert "cpu_count" in saved["machine"]
+    assert [result["samples"] for result in saved["results"]] == [result["samples"] for result in results]
+
+    with open(csv_path, newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert list(rows[0]) == FIELDS
+    assert [row["size"] for row in rows] == ["16", "24"]
@@ -0,0 +1,91 @@
+"""
+Game of Life Checkpoint Tests
+-------------------------------------------------------
+Round-trips simulations through checkpoints: dense and memory-mapped boards, cells
+of an unbounded plane outside the window, and checkpoints written by np.savez().
+
+Usage:
+    python -m pytest -q test_checkpoint.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import json
+import numpy as np
+import pytest
+import checkpoint
+from checkpoint import restore, save_checkpoint
+from simulation import Simulation
+
+@pytest.mark.parametrize("rule", ["B3/S23", "B2/S/C3"])
+def test_checkpoint_round_trip(tmp_path, rule):
+    path = str(tmp_path / "run.ckpt.npz")
+    sim = Simulation(30, 45, random_init=True, seed=4, rule=rule)
+    sim.run(7)
+    sim.rng.random()
+    save_checkpoint(sim, path)
+
+    resumed = restore(path)
+    assert resumed.generation == sim.generation
+    assert resumed.seed == sim.seed
+    assert str(resumed.rule) == str(sim.rule)
+    np.testing.assert_array_equal(resumed.grid, sim.grid)
+    assert resumed.rng.random() == sim.rng.random()
+    sim.run(5)
+    resumed.run(5)
+    np.testing.assert_array_equal(resumed.grid, sim.grid)
+
+@pytest.mark.parametrize("backend", ["hashlife", "sparse"])
+def test_unbounded_cells_outside_the_window(tmp_path, backend):
+    path = str(tmp_path / "run.ckpt.npz")
+    # A glider that has left its 16x16 window by generation 60.
+    grid = np.zeros((16, 16), dtype=np.uint8)
+    grid[0, 1] = grid[1, 2] = grid[2, 0:3] = 1
+    sim = Simulation(0, 0, initial_state=grid, backend=backend)
+    sim.run(60)
+    assert not sim.grid.any()
+    save_checkpoint(sim, path)
+
+    resumed = restore(path)
+    assert resumed.backend.fingerprint() == sim.backend.fingerprint()
+    sim.run(40)
+    resumed.run(40)
+    assert resumed.backend.fingerprint() == sim.backend.fingerprint()
+    assert resumed.backend.universe.population == 5
+    # Resuming on a dense backend keeps the window.
+    dense = restore(path, backend="numpy")
+    assert dense.grid.shape == (16, 16) and not dense.grid.any()
+
+@pytest.mark.parametrize("rule", ["B3/S23", "B2/S/C3"])
+def test_memmap_checkpoint_in_bands(tmp_path, monkeypatch, rule):
+    # Bands of 8 rows: the 45x13 board is packed in several bands, the last one partial.
+    monkeypatch.setattr(checkpoint, "BAND_CELLS", 8 * 13)
+    path = str(tmp_path / "run.ckpt.npz")
+    sim = Simulation(45, 13, random_init=True, seed=6, backend="memmap", rule=rule,
+                     backend_options={"path": str(tmp_path / "board.npy"), "band_rows": 4})
+    sim.run(3)
+    save_checkpoint(sim, path)
+    with np.load(path) as data:
+        cells = data["cells"]
+    if rule == "B3/S23":
+        np.testing.assert_array_equal(cells, np.packbits(sim.grid))
+    else:
+        np.testing.assert_array_equal(cells, np.ravel(sim.grid))
+
+    resumed = restore(path, backend_options={"path": str(tmp_path / "resumed.npy")})
+    np.testing.assert_array_equal(resumed.grid, sim.grid)
+    np.testing.assert_array_equal(np.load(str(tmp_path / "resumed.npy")), sim.grid)
+    sim.backend.close()
+    resumed.backend.close()
+
+def test_restore_savez_checkpoint(tmp_path):
+    # Checkpoints written by earlier versions with np.savez() and without seed or live cells.
+    path = str(tmp_path / "old.ckpt.npz")
+    sim = Simulation(20, 30, random_init=True, seed=8)
+    header = {"version": 1, "rows": 20, "cols": 30, "generation": 9, "rule": "B3/S23",
+              "backend": "numpy", "backend_options": {},
+              "rng_state": sim.rng.bit_generator.state, "packed": True}
+    np.savez(path, header=np.array(json.dumps(header)), cells=np.packbits(sim.grid))
+    resumed = restore(path)
+    assert resumed.generation == 9
+    np.testing.assert_array_equal(resumed.grid, sim.grid)
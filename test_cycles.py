@@ -0,0 +1,91 @@
+"""
+Game of Life Cycle Detection Tests
+-------------------------------------------------------
+Checks cycle detection and fast-forwarding on every backend, and that the unbounded
+engines fingerprint the whole plane rather than the displayed window.
+
+Usage:
+    python -m pytest -q test_cycles.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import numpy as np
+import pytest
+from cycles import CycleDetector
+from hashlife import HashLife
+from main import compute_next_step_loop
+from simulation import Simulation
+from test_backends import DENSE_BACKENDS, close_backend
+
+BACKENDS = dict(DENSE_BACKENDS, memmap={"band_rows": 5}, processes={"processes": 2},
+                auto={"candidates": ["numpy"]}, hashlife={}, sparse={})
+
+@pytest.fixture(autouse=True)
+def tuning_cache(tmp_path, monkeypatch):
+    # The auto backend must not read or write the user's tuning cache.
+    monkeypatch.setenv("LIFE_TUNING_CACHE", str(tmp_path / "tuning.json"))
+
+def glider(rows, cols):
+    """
+    Board with a glider in its top-left corner, heading down and right.
+    """
+    grid = np.zeros((rows, cols), dtype=np.uint8)
+    grid[0, 1] = grid[1, 2] = grid[2, 0:3] = 1
+    return grid
+
+def test_detector_finds_start_and_period():
+    detector = CycleDetector()
+    values = [5, 6, 7, 8, 7, 8]
+    cycles = [detector.observe_fingerprint(generation, value)
+              for generation, value in enumerate(values)]
+    assert cycles[:4] == [None] * 4
+    assert tuple(cycles[4]) == (2, 2)
+
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+def test_cycle_detection(backend):
+    # A blinker (period 2) next to a block: fast-forwarding ends on the blinker's phase.
+    grid = np.zeros((16, 24), dtype=np.uint8)
+    grid[4, 3:6] = 1
+    grid[10:12, 15:17] = 1
+    sim = Simulation(0, 0, initial_state=grid, backend=backend,
+                     backend_options=BACKENDS[backend])
+    try:
+        sim.run(1001, on_cycle="fast_forward")
+        assert tuple(sim.cycle) == (0, 2)
+        assert sim.generation == 1001
+        np.testing.assert_array_equal(sim.grid, compute_next_step_loop(grid))
+    finally:
+        close_backend(sim)
+
+@pytest.mark.parametrize("backend", ["hashlife", "sparse"])
+def test_glider_leaving_the_window_is_not_a_cycle(backend):
+    # After about 50 generations the 16x16 window is empty, but the glider still moves.
+    sim = Simulation(0, 0, initial_state=glider(16, 16), backend=backend)
+    sim.run(200, on_cycle="stop")
+    assert sim.cycle is None
+    assert sim.generation == sim.backend.universe.generation == 200
+
+    sim.run(10000, on_cycle="fast_forward")
+    assert sim.cycle is None
+    assert sim.generation == sim.backend.universe.generation == 10200
+    assert sim.backend.universe.population == 5
+
+@pytest.mark.parametrize("backend", ["hashlife", "sparse"])
+def test_unbounded_fingerprint_sees_the_whole_plane(backend):
+    # Two boards equal in the window but not outside it.
+    sim = Simulation(0, 0, initial_state=glider(16, 16), backend=backend)
+    sim.run(100)
+    empty = Simulation(0, 0, initial_state=np.zeros((16, 16), dtype=np.uint8), backend=backend)
+    np.testing.assert_array_equal(sim.grid, empty.grid)
+    assert sim.backend.fingerprint() != empty.backend.fingerprint()
+
+def test_hashlife_fingerprint_ignores_padding_and_collection():
+    grid = glider(16, 16)
+    universe = HashLife.from_grid(grid)
+    value = universe.fingerprint()
+    universe.root = universe._expand(universe._expand(universe.root))
+    assert universe.fingerprint() == value
+    universe.collect()
+    assert universe.fingerprint() == value
+    assert HashLife.from_grid(np.roll(grid, 1, axis=1)).fingerprint() != value
@@ -0,0 +1,28 @@
+"""
+Game of Life Multi-Process Engine Tests
+-------------------------------------------------------
+Checks the multi-process backend against the per-cell reference, with strips of
+unequal heights, and that close() stops its workers.
+
+Usage:
+    python -m pytest -q test_distributed.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import pytest
+from simulation import Simulation
+from test_backends import RULES, SHAPES, check_against_reference
+
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("rule", RULES)
+@pytest.mark.parametrize("processes", [2, 3])
+def test_processes_match_reference(processes, rule, shape):
+    check_against_reference("processes", rule, shape, {"processes": processes})
+
+def test_close_stops_workers():
+    sim = Simulation(12, 20, random_init=True, seed=1, backend="processes",
+                     backend_options={"processes": 2})
+    workers = sim.backend._workers
+    sim.backend.close()
+    assert not any(worker.is_alive() for worker in workers)
@@ -0,0 +1,59 @@
+"""
+Game of Life Ensemble Tests
+-------------------------------------------------------
+Checks every board of an ensemble against the same board run on its own with the
+per-cell reference compute_next_step_loop(): final board, status and period.
+
+Usage:
+    python -m pytest -q test_ensemble.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import numpy as np
+import pytest
+from ensemble import EXTINCT, OSCILLATING, RUNNING, STILL, Ensemble
+from main import compute_next_step_loop
+
+def run_alone(board, steps, max_period, rule):
+    """
+    Run one board with compute_next_step_loop() until it dies, stops changing or
+    repeats one of its previous max_period generations (generation 0 excluded).
+
+    Returns:
+    - tuple: (final board, status, period)
+    """
+    history = {}
+    for generation in range(1, steps + 1):
+        previous, board = board, compute_next_step_loop(board, rule)
+        if not board.any():
+            return board, EXTINCT, 0
+        if np.array_equal(board, previous):
+            return board, STILL, 1
+        for earlier in range(max(1, generation - max_period), generation):
+            if np.array_equal(history[earlier], board):
+                return board, OSCILLATING, generation - earlier
+        history[generation] = board
+    return board, RUNNING, 0
+
+@pytest.mark.parametrize("rule", ["B3/S23", "B36/S23"])
+def test_ensemble_matches_boards_run_alone(rule):
+    rng = np.random.default_rng(7)
+    boards = (rng.random((16, 10, 12)) < rng.uniform(0.1, 0.5, (16, 1, 1))).astype(np.uint8)
+    boards[0] = 0
+    boards[1] = 0
+    boards[1, 4, 4:7] = 1
+    original = boards.copy()
+    ensemble = Ensemble(boards, max_period=8, rule=rule)
+    # Two calls, so the hash history carries over from one run() to the next.
+    ensemble.run(20)
+    ensemble.run(20)
+
+    np.testing.assert_array_equal(boards, original)
+    for index, board in enumerate(original):
+        expected, status, period = run_alone(board.astype(int), 40, 8, rule)
+        np.testing.assert_array_equal(ensemble.boards[index], expected)
+        assert ensemble.status[index] == status
+        assert ensemble.period[index] == period
+    assert ensemble.status[0] == EXTINCT
+    assert ensemble.status[1] == OSCILLATING and ensemble.period[1] == 2
@@ -0,0 +1,41 @@
+"""
+Game of Life Initial State Tests
+-------------------------------------------------------
+Checks that random boards depend only on their seed (not on the number of worker
+threads) and that their density matches the requested probability.
+
+Usage:
+    python -m pytest -q test_initial_state.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import numpy as np
+import pytest
+import initial_state
+from initial_state import bernoulli_words, random_fill, random_grid
+
+def test_random_grid_is_reproducible(monkeypatch):
+    # Small bands, so the board is filled by several independently seeded bands.
+    monkeypatch.setattr(initial_state, "CHUNK_CELLS", 1000)
+    grid = random_grid(100, 90, 0.3, seed=12, workers=1)
+    np.testing.assert_array_equal(random_grid(100, 90, 0.3, seed=12, workers=4), grid)
+    assert not np.array_equal(random_grid(100, 90, 0.3, seed=13), grid)
+    assert set(np.unique(grid)) <= {0, 1}
+
+def test_random_fill_returns_the_seed_of_the_board():
+    grid = np.empty((64, 64), dtype=np.uint8)
+    sequence = random_fill(grid, 0.5)
+    np.testing.assert_array_equal(random_grid(64, 64, 0.5, seed=sequence.entropy), grid)
+
+@pytest.mark.parametrize("prob_alive", [0.0, 0.05, 0.2, 0.5, 0.7, 1.0])
+def test_density(prob_alive):
+    grid = random_grid(512, 512, prob_alive, seed=1)
+    # Five standard deviations of the mean of 512 * 512 Bernoulli cells.
+    tolerance = 5 * np.sqrt(prob_alive * (1 - prob_alive) / grid.size)
+    assert abs(grid.mean() - prob_alive) <= tolerance
+
+def test_bernoulli_words_every_bit_has_the_probability():
+    words = bernoulli_words(np.random.default_rng(3), 1 << 14, 0.25)
+    bits = np.unpackbits(words.view(np.uint8)).reshape(-1, 64)
+    assert np.all(np.abs(bits.mean(axis=0) - 0.25) < 5 * np.sqrt(0.25 * 0.75 / bits.shape[0]))
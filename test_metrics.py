@@ -0,0 +1,56 @@
+"""
+Game of Life Run Metrics Tests
+-------------------------------------------------------
+Checks when samples are taken during a run, what they hold, and the Prometheus
+text file.
+
+Usage:
+    python -m pytest -q test_metrics.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import numpy as np
+import pytest
+from metrics import Metrics
+from simulation import Simulation
+
+@pytest.mark.parametrize("rule", ["B3/S23", "B2/S/C3"])
+def test_samples_every_interval(rule):
+    sim = Simulation(32, 32, random_init=True, seed=3, rule=rule)
+    received = []
+    sim.metrics = Metrics(every=10, callback=received.append)
+    sim.run(35)
+    assert [sample.generation for sample in received] == [10, 20, 30]
+    assert received == list(sim.metrics.history)
+    last = received[-1]
+    assert last.generations == 10
+    assert last.step_seconds > 0
+    assert last.generations_per_second == pytest.approx(1 / last.step_seconds)
+    # The population is the number of live cells; dying Generations states do not count.
+    sim.run(5)
+    assert sim.metrics.history[-1].population == np.count_nonzero(sim.grid == 1)
+
+    summary = sim.metrics.summary()
+    assert summary["generations"] == 40
+    assert summary["samples"] == 4
+
+def test_history_is_bounded():
+    sim = Simulation(16, 16, random_init=True, seed=3)
+    sim.metrics = Metrics(every=1, history=5, population=False)
+    sim.run(12)
+    assert [sample.generation for sample in sim.metrics.history] == list(range(8, 13))
+    assert sim.metrics.history[-1].population is None
+
+def test_prometheus_file(tmp_path):
+    path = tmp_path / "life.prom"
+    sim = Simulation(16, 16, random_init=True, seed=3)
+    sim.metrics = Metrics(every=4, prometheus_path=str(path), export_seconds=0.0,
+                          labels={"run": "test"})
+    sim.run(8)
+    text = path.read_text()
+    assert '# TYPE life_generations_total counter' in text
+    assert 'life_generation{backend="numpy",run="test"} 8' in text
+    population = sim.metrics.history[-1].population
+    assert f'life_population{{backend="numpy",run="test"}} {population}' in text
+    assert not (tmp_path / "life.prom.tmp").exists()
@@ -0,0 +1,48 @@
+"""
+Game of Life Out-of-Core Engine Tests
+-------------------------------------------------------
+Checks the memory-mapped backend against the per-cell reference with several bands,
+that its file always holds the current generation, and that temporary files are
+deleted.
+
+Usage:
+    python -m pytest -q test_outofcore.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import os
+import numpy as np
+import pytest
+from outofcore import MemmapBackend
+from simulation import Simulation
+from test_backends import RULES, SHAPES, check_against_reference
+
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("rule", RULES)
+def test_memmap_matches_reference(rule, shape):
+    check_against_reference("memmap", rule, shape, {"band_rows": 5})
+
+def test_file_holds_the_current_generation(tmp_path):
+    path = str(tmp_path / "board.npy")
+    sim = Simulation(30, 40, random_init=True, seed=3, backend="memmap",
+                     backend_options={"path": path, "band_rows": 7})
+    sim.run(4)
+    np.testing.assert_array_equal(np.load(path), sim.grid)
+    sim.backend.close()
+    # A given path is kept, and resuming from it adopts the file.
+    resumed = Simulation(0, 0, initial_state=np.load(path, mmap_mode="r+"), backend="memmap",
+                         backend_options={"path": path})
+    assert resumed.backend.path == os.path.abspath(path)
+    resumed.backend.close()
+    assert sorted(os.listdir(tmp_path)) == ["board.npy"]
+
+def test_temporary_files_are_deleted():
+    grid = MemmapBackend.allocate(20, 20)
+    sim = Simulation(0, 0, initial_state=grid, backend="memmap")
+    path = sim.backend.path
+    assert path == os.path.abspath(grid.filename)
+    sim.run(2)
+    sim.backend.close()
+    assert not os.path.exists(path)
+    assert not os.path.exists(path + ".next.npy")
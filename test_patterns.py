@@ -0,0 +1,53 @@
+"""
+Game of Life Pattern File Tests
+-------------------------------------------------------
+Round-trips boards through the RLE, plaintext and Life 1.06 formats, and checks how
+the headless runner picks the rule of a pattern file.
+
+Usage:
+    python -m pytest -q test_patterns.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import io
+import numpy as np
+import pytest
+from headless import choose_rule
+from patterns import load_pattern, place, read_rle, save_pattern, to_grid, write_rle
+from rules import as_rule
+from test_backends import random_board
+
+@pytest.mark.parametrize("rule", ["B3/S23", "B2/S/C3"])
+def test_rle_round_trip(rule):
+    grid = random_board((19, 37), rule, seed=3)
+    # Non-dead corners, so the pattern's bounding box is the whole grid.
+    grid[0, 0] = grid[-1, -1] = 1
+    handle = io.StringIO()
+    write_rle(grid, handle, rule=rule)
+    handle.seek(0)
+    pattern = read_rle(handle)
+    assert pattern.shape == grid.shape
+    assert str(as_rule(pattern.rule)) == str(as_rule(rule))
+    np.testing.assert_array_equal(to_grid(pattern), grid)
+
+@pytest.mark.parametrize("extension", [".cells", ".lif"])
+def test_plaintext_and_life106_round_trip(tmp_path, extension):
+    grid = random_board((11, 23), "B3/S23", seed=4)
+    grid[0, 0] = grid[-1, -1] = 1
+    path = str(tmp_path / f"board{extension}")
+    save_pattern(grid, path)
+    pattern = load_pattern(path)
+    assert pattern.rule is None
+    np.testing.assert_array_equal(to_grid(pattern), grid)
+
+def test_place_with_wrap():
+    pattern = read_rle(io.StringIO("x = 3, y = 1\n3o!\n"))
+    grid = place(np.zeros((4, 5), dtype=np.uint8), pattern, top=3, left=3, wrap=True)
+    assert sorted(zip(*np.nonzero(grid))) == [(3, 0), (3, 3), (3, 4)]
+
+def test_choose_rule():
+    pattern = read_rle(io.StringIO("x = 3, y = 1, rule = B36/S23\n3o!\n"))
+    assert str(choose_rule(None, pattern, "p.rle")) == str(as_rule("B36/S23"))
+    assert str(choose_rule("B3/S23", pattern, "p.rle")) == str(as_rule("B3/S23"))
+    assert str(choose_rule(None, None, None)) == str(as_rule("B3/S23"))
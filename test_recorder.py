@@ -0,0 +1,38 @@
+"""
+Game of Life Recorder Tests
+-------------------------------------------------------
+Round-trips runs through the on-disk recording format, with key frames and deltas,
+for two-state and Generations rules.
+
+Usage:
+    python -m pytest -q test_recorder.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import numpy as np
+import pytest
+from recorder import Recorder, Recording
+from simulation import Simulation
+from test_backends import random_board
+
+@pytest.mark.parametrize("rule", ["B3/S23", "B2/S/C3"])
+def test_recording_round_trip(tmp_path, rule):
+    path = str(tmp_path / "run.golrec")
+    sim = Simulation(24, 40, random_init=True, seed=5, rule=rule)
+    expected = {}
+    with Recorder(path, sim.rows, sim.cols, states=sim.rule.states, keyframe_interval=3) as recorder:
+        for _ in range(8):
+            expected[sim.generation] = np.array(sim.grid)
+            recorder.record(sim.generation, sim.grid)
+            sim.step()
+    with Recording(path) as recording:
+        for generation, grid in expected.items():
+            np.testing.assert_array_equal(recording.read(generation), grid)
+
+def test_two_state_recording_rejects_generations_states(tmp_path):
+    grid = random_board((8, 8), "B2/S/C3")
+    grid[0, 0] = 2
+    with Recorder(str(tmp_path / "run.golrec"), 8, 8) as recorder:
+        with pytest.raises(ValueError):
+            recorder.record(0, grid)
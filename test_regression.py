@@ -0,0 +1,70 @@
+"""
+Game of Life Regression Tracking Tests
+-------------------------------------------------------
+Checks the Mann-Whitney test, the number of repeats it needs, and the status of every
+case of a comparison between two benchmark runs.
+
+Usage:
+    python -m pytest -q test_regression.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import json
+import numpy as np
+import pytest
+from regression import (compare, load_results, main, mann_whitney_greater, minimum_p_value,
+                        required_repeats, save_baseline)
+
+def result(backend, samples):
+    """
+    Benchmark result of one case with the given per-generation samples.
+    """
+    return {"backend": backend, "size": 64, "density": 0.2, "threads": None,
+            "median_seconds": float(np.median(samples)), "samples": list(samples)}
+
+def run(*results):
+    return {"machine": {}, "settings": {}, "results": list(results)}
+
+def test_mann_whitney_greater():
+    # U = 25 of 25: z = (25 - 12.5 - 0.5) / sqrt(25 * 11 / 12).
+    assert mann_whitney_greater([6, 7, 8, 9, 10], [1, 2, 3, 4, 5]) == pytest.approx(0.00609, abs=1e-5)
+    assert mann_whitney_greater([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]) > 0.99
+    # Every value tied: no evidence either way.
+    assert mann_whitney_greater([1.0] * 4, [1.0] * 4) == 1.0
+
+def test_required_repeats():
+    assert minimum_p_value(4, 4) >= 0.01
+    assert minimum_p_value(5, 5) < 0.01
+    assert required_repeats(0.01) == 5
+    assert required_repeats(0.05) < 5
+
+def test_compare_statuses():
+    samples = np.linspace(1.0, 1.1, 7)
+    baseline = run(result("numpy", samples), result("numba", samples),
+                   result("halo", samples), result("packed", samples))
+    current = run(result("numpy", samples * 1.5), result("numba", samples * 0.5),
+                  result("halo", samples[::-1] * 1.01))
+    statuses = {row["case"].backend: row["status"] for row in compare(baseline, current)}
+    assert statuses == {"numpy": "regression", "numba": "improvement",
+                        "halo": "unchanged", "packed": "missing"}
+
+def test_compare_rejects_too_few_repeats():
+    samples = np.linspace(1.0, 1.1, 4)
+    with pytest.raises(ValueError, match="use at least 5 repeats"):
+        compare(run(result("numpy", samples)), run(result("numpy", samples * 2)))
+
+def test_main_exit_status(tmp_path):
+    samples = np.linspace(1.0, 1.1, 7)
+    paths = {}
+    for name, data in [("baseline", run(result("numpy", samples))),
+                       ("slower", run(result("numpy", samples * 1.5))),
+                       ("short", run(result("numpy", samples[:3])))]:
+        paths[name] = str(tmp_path / f"{name}.json")
+        with open(paths[name], "w") as handle:
+            json.dump(data, handle)
+    baseline = save_baseline(paths["baseline"], name="base", directory=str(tmp_path / "baselines"))
+    assert load_results(baseline)["name"] == "base"
+    assert main(["compare", baseline, paths["baseline"]]) == 0
+    assert main(["compare", baseline, paths["slower"]]) == 1
+    assert main(["compare", baseline, paths["short"]]) == 2
@@ -0,0 +1,45 @@
+"""
+Game of Life Sparse Engine Tests
+-------------------------------------------------------
+Checks the sparse engine against the per-cell reference and against HashLife on the
+unbounded plane, and round-trips boards through the key array.
+
+Usage:
+    python -m pytest -q test_sparse.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import numpy as np
+import pytest
+from hashlife import HashLife
+from simulation import Simulation
+from sparse import SparseLife
+from test_hashlife import centred_soup, unbounded_reference
+
+@pytest.mark.parametrize("rule", ["B3/S23", "B36/S23", "B3/S023"])
+def test_sparse_matches_reference(rule):
+    grid = centred_soup()
+    sim = Simulation(0, 0, initial_state=grid, backend="sparse", rule=rule)
+    sim.step()
+    sim.run(7)
+    np.testing.assert_array_equal(sim.grid, unbounded_reference(grid, rule, 8))
+
+def test_sparse_round_trip():
+    grid = centred_soup()
+    universe = SparseLife.from_grid(grid, top=5, left=-3)
+    assert universe.population == np.count_nonzero(grid)
+    np.testing.assert_array_equal(universe.to_grid(5, -3, *grid.shape), grid)
+
+def test_sparse_matches_hashlife_outside_the_window():
+    # A glider leaves its 8x8 window: both engines keep it on the plane.
+    grid = np.zeros((8, 8), dtype=np.uint8)
+    grid[0, 1] = grid[1, 2] = grid[2, 0:3] = 1
+    sparse = SparseLife.from_grid(grid)
+    hashlife = HashLife.from_grid(grid)
+    for _ in range(60):
+        sparse.step()
+    hashlife.advance(60)
+    assert sparse.population == hashlife.population == 5
+    np.testing.assert_array_equal(sparse.to_grid(0, 0, 32, 32), hashlife.to_grid(0, 0, 32, 32))
+    assert not sparse.to_grid(0, 0, 8, 8).any()
@@ -0,0 +1,101 @@
+"""
+Game of Life Viewer Tests
+-------------------------------------------------------
+Checks that a process stepping a simulation in the viewer's background thread exits,
+and that the zoom viewer's density pyramid matches a full recount after updates
+from board comparisons and from the blocks a backend reports as changed. The viewer
+is imported with the non-interactive Agg backend of matplotlib, so no window is
+opened.
+
+Usage:
+    python -m pytest -q test_viewer.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import os
+import subprocess
+import sys
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+import pytest
+from simulation import Simulation
+from viewer import TILE_LEVEL, DensityPyramid
+
+# Steps a simulation in a SimulationThread, then stops it and returns.
+THREAD_SCRIPT = """
+import sys, time
+from simulation import Simulation
+from viewer import SimulationThread
+sim = Simulation(64, 64, random_init=True, seed=1, backend=sys.argv[1])
+thread = SimulationThread(sim, lambda *frame: None)
+thread.start()
+thread.toggle_pause()
+while sim.generation < 3:
+    time.sleep(0.01)
+thread.stop()
+thread.join()
+"""
+
+@pytest.mark.parametrize("backend", ["numba", "packed"])
+def test_process_using_simulation_thread_exits(backend):
+    # Under Numba's TBB threading layer this process never exited.
+    env = dict(os.environ, MPLBACKEND="Agg")
+    env.pop("NUMBA_THREADING_LAYER", None)
+    env.pop("NUMBA_THREADING_LAYER_PRIORITY", None)
+    result = subprocess.run([sys.executable, "-c", THREAD_SCRIPT, backend], env=env,
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+
+def recount(pyramid, grid):
+    """
+    Live-cell counts of every pyramid level, computed from scratch.
+    """
+    size = 1 << pyramid.levels
+    padded = np.zeros((-(-grid.shape[0] // size) * size, -(-grid.shape[1] // size) * size), dtype=np.int64)
+    padded[:grid.shape[0], :grid.shape[1]] = grid == 1
+    return [None] + [padded.reshape(padded.shape[0] >> k, 1 << k, padded.shape[1] >> k, 1 << k)
+                     .sum(axis=(1, 3)) for k in range(1, pyramid.levels + 1)]
+
+def assert_counts(pyramid, grid):
+    for level, expected in enumerate(recount(pyramid, grid)[1:], start=1):
+        np.testing.assert_array_equal(pyramid.counts[level], expected, err_msg=f"level {level}")
+
+def test_pyramid_by_comparison():
+    sim = Simulation(300, 200, random_init=True, prob_alive=0.3, seed=2)
+    pyramid = DensityPyramid(sim.grid, min_size=4)
+    assert pyramid.levels > TILE_LEVEL
+    assert_counts(pyramid, sim.grid)
+    sim.run(3)
+    assert pyramid.update(sim.grid) > 0
+    assert_counts(pyramid, sim.grid)
+    # An unchanged board recounts nothing; a single edit recounts a single tile.
+    assert pyramid.update(sim.grid) == 0
+    sim.set_cell(250, 10, 1 - sim.grid[250, 10])
+    assert pyramid.update(sim.grid) == 1
+    assert_counts(pyramid, sim.grid)
+
+@pytest.mark.parametrize("block_size", [8, 64])
+def test_pyramid_from_changed_blocks(block_size):
+    # A glider on an empty board: few tiles change, and the backend reports which.
+    grid = np.zeros((256, 320), dtype=np.uint8)
+    grid[100, 101] = grid[101, 102] = grid[102, 100:103] = 1
+    sim = Simulation(0, 0, initial_state=grid, backend="active",
+                     backend_options={"block_size": block_size})
+    pyramid = DensityPyramid(sim.grid, min_size=4)
+    sim.backend.take_changes()
+    for _ in range(5):
+        sim.run(7)
+        changes = sim.backend.take_changes()
+        assert 0 < pyramid.update(sim.grid, changes) <= 4
+        assert_counts(pyramid, sim.grid)
+
+def test_pyramid_window_densities():
+    grid = np.zeros((128, 128), dtype=np.uint8)
+    grid[:64, :64] = 1
+    pyramid = DensityPyramid(grid, min_size=4)
+    densities, bounds = pyramid.window(5, 10, 40, 70, 100)
+    assert bounds == (0, 32, 96, 128)
+    np.testing.assert_array_equal(densities, [[1.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
@@ -0,0 +1,47 @@
+"""
+Game of Life Kernel Warm-up Tests
+-------------------------------------------------------
+Checks the warm-up report, and that a second process loads the kernels compiled by
+a first one from the on-disk cache instead of compiling them again.
+
+Usage:
+    python -m pytest -q test_warmup.py
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import json
+import os
+import subprocess
+import sys
+from warmup import precompile
+
+def test_report():
+    report = precompile(["numpy", "numba", "packed"], ["B3/S23", "B2/S/C3"], direct=False)
+    # numpy has no kernels, packed runs two-state rules only.
+    assert [(entry["name"], entry["rule"]) for entry in report] == [
+        ("numba", "B3/S23"), ("numba", "B2/S/C3"), ("packed", "B3/S23"), ("ensemble", "B3/S23")]
+    for entry in report:
+        assert entry["compile_seconds"] >= 0
+        assert entry["step_seconds"] > 0
+
+# Warms up the numba backend and prints the cache hits and misses.
+WARMUP_SCRIPT = """
+import json
+from warmup import precompile
+entry, = precompile(["numba"], ["B3/S23"], ensemble=False, direct=False)
+print(json.dumps([entry["cache_hits"], entry["cache_misses"]]))
+"""
+
+def test_second_process_loads_from_cache(tmp_path):
+    env = dict(os.environ, NUMBA_CACHE_DIR=str(tmp_path))
+    counts = []
+    for _ in range(2):
+        result = subprocess.run([sys.executable, "-c", WARMUP_SCRIPT], env=env,
+                                cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, timeout=600)
+        assert result.returncode == 0, result.stderr
+        counts.append(json.loads(result.stdout.splitlines()[-1]))
+    (first_hits, first_misses), (second_hits, second_misses) = counts
+    assert first_misses > 0 and first_hits == 0
+    assert second_misses == 0 and second_hits == first_misses
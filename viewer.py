@@ -0,0 +1,668 @@
+"""
+Game of Life Viewer
+-------------------------------------------------------
+Interactive matplotlib front-end for a Simulation.
+
+The simulation and the display run independently (producer/consumer): a background
+thread steps the simulation as fast as it can and, whenever the display asks for a
+frame, publishes a snapshot of the backend's storage between two batches. A second
+thread turns the newest snapshot into a frame downsampled to the on-screen size of
+the image by max or mean pooling, dropping stale ones. The animation timer only
+copies that small frame into the image, and redraws it with blitting. Frames per
+second and generations per second are shown in the window title.
+
+As Numba kernels then run outside the main thread, the Numba modules make Numba
+prefer the OpenMP or workqueue threading layer over TBB, under which such a process
+never exits (see simulation.pin_threading_layer()).
+
+ZoomViewer is a level-of-detail mode for very large boards. It keeps a density
+pyramid (live-cell counts per 2x2, 4x4, 8x8, ... block), refreshes in the rendering
+thread only the tiles that changed since the previous frame (known from the backend
+when it tracks changed blocks, as the active backend does), and renders just the
+visible window from the coarsest level that still gives about one block per screen
+pixel.
+
+Usage:
+- Press SPACE to pause/resume animation
+- Left-click to activate a cell, Right-click to deactivate
+- ZoomViewer: scroll to zoom around the cursor, arrow keys to pan, R to reset the view
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import queue
+import threading
+import time
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation
+
+# Target wall time of one batch of generations in the simulation thread.
+BATCH_SECONDS = 0.01
+# Edge length (as a power of two) of the tiles a DensityPyramid refreshes.
+TILE_LEVEL = 5
+
+def downsample(image, factor_rows, factor_cols, mode="max"):
+    """
+    Reduce an image by pooling blocks of factor_rows x factor_cols pixels. Partial
+    blocks at the bottom and right edges are padded with zeros.
+
+    Parameters:
+    - image (np.ndarray): 2D array.
+    - factor_rows (int): Block height.
+    - factor_cols (int): Block width.
+    - mode (str): "max" keeps isolated live cells visible, "mean" shows the density.
+
+    Returns:
+    - np.ndarray: Array of shape (ceil(rows / factor_rows), ceil(cols / factor_cols)).
+    """
+    if factor_rows == 1 and factor_cols == 1:
+        return np.array(image)
+    rows, cols = image.shape
+    out_rows, out_cols = -(-rows // factor_rows), -(-cols // factor_cols)
+    padded = np.zeros((out_rows * factor_rows, out_cols * factor_cols), dtype=image.dtype)
+    padded[:rows, :cols] = image
+    blocks = padded.reshape(out_rows, factor_rows, out_cols, factor_cols)
+    return blocks.max(axis=(1, 3)) if mode == "max" else blocks.mean(axis=(1, 3))
+
+def merge_changes(first, second):
+    """
+    Changes over two consecutive intervals, see Backend.take_changes().
+
+    Returns:
+    - tuple or None: (block_size, mask), or None if either is unknown.
+    """
+    if first is None or second is None or first[0] != second[0]:
+        return None
+    return first[0], first[1] | second[1]
+
+def pool_pairs(blocks, dtype):
+    """
+    Sum 2x2 blocks over the last two axes of an array with even sizes along them.
+
+    Parameters:
+    - blocks (np.ndarray): Array of counts.
+    - dtype (np.dtype): Type of the sums, wide enough for them.
+
+    Returns:
+    - np.ndarray: Array half as large along the last two axes.
+    """
+    blocks = blocks.astype(dtype, copy=False)
+    return (blocks[..., 0::2, 0::2] + blocks[..., 1::2, 0::2]
+            + blocks[..., 0::2, 1::2] + blocks[..., 1::2, 1::2])
+
+class DensityPyramid:
+    """
+    Live-cell counts of a board per block of 2^k x 2^k cells, for k = 1..levels.
+
+    update() recounts only the tiles (of 2^TILE_LEVEL cells) that changed since the
+    previous update. Which tiles changed comes from the backend when it tracks it
+    (see Backend.take_changes()); otherwise the board is compared with a snapshot of
+    the live cells, in buffers allocated once. The levels above the tile size are
+    small and are rebuilt from the tile level.
+
+    Parameters:
+    - grid (np.ndarray): Initial board.
+    - min_size (int): The top level is the first one with at most min_size blocks
+      along both axes.
+    """
+    def __init__(self, grid, min_size=256):
+        self.rows, self.cols = grid.shape
+        levels = 1
+        while max(self.rows, self.cols) > min_size << levels:
+            levels += 1
+        self.levels = max(levels, TILE_LEVEL)
+        size = 1 << self.levels
+        tile = 1 << TILE_LEVEL
+        # Snapshot of the live cells, padded to whole top-level blocks.
+        self._snapshot = np.zeros((-(-self.rows // size) * size, -(-self.cols // size) * size),
+                                  dtype=np.bool_)
+        self.tiles = (self._snapshot.shape[0] // tile, self._snapshot.shape[1] // tile)
+        # Buffers of the comparison, the padding of _changed stays False.
+        self._live = np.zeros((self.rows, self.cols), dtype=np.bool_)
+        self._changed = np.zeros(self._snapshot.shape, dtype=np.bool_)
+        self.counts = [None] + [np.zeros((self._snapshot.shape[0] >> k, self._snapshot.shape[1] >> k),
+                                         dtype=np.uint32) for k in range(1, self.levels + 1)]
+        self.update(grid, full=True)
+
+    def _tiles_from_blocks(self, block_size, blocks):
+        """
+        Tiles overlapping the changed blocks of a backend.
+
+        Parameters:
+        - block_size (int): Edge length of the blocks.
+        - blocks (np.ndarray): Boolean mask of the changed blocks.
+
+        Returns:
+        - np.ndarray or None: Boolean mask of the tiles, or None if the blocks do not
+          line up with the tiles.
+        """
+        tile = 1 << TILE_LEVEL
+        dirty = np.zeros(self.tiles, dtype=np.bool_)
+        if block_size % tile == 0:
+            factor = block_size // tile
+            expanded = np.repeat(np.repeat(blocks, factor, axis=0), factor, axis=1)
+            rows, cols = min(expanded.shape[0], self.tiles[0]), min(expanded.shape[1], self.tiles[1])
+            dirty[:rows, :cols] = expanded[:rows, :cols]
+        elif tile % block_size == 0:
+            factor = tile // block_size
+            padded = np.zeros((self.tiles[0] * factor, self.tiles[1] * factor), dtype=np.bool_)
+            padded[:blocks.shape[0], :blocks.shape[1]] = blocks
+            dirty = padded.reshape(self.tiles[0], factor, self.tiles[1], factor).any(axis=(1, 3))
+        else:
+            return None
+        return dirty
+
+    def update(self, grid, changes=None, full=False):
+        """
+        Bring the pyramid up to date with a board.
+
+        Parameters:
+        - grid (np.ndarray): Current board.
+        - changes (tuple, optional): (block_size, mask) of the blocks changed since the
+          previous update, as returned by Backend.take_changes(); the board is
+          compared with the snapshot if None.
+        - full (bool): Recount every tile.
+
+        Returns:
+        - int: Number of tiles recounted.
+        """
+        tile = 1 << TILE_LEVEL
+        grid = np.asarray(grid)
+        view = self._snapshot[:self.rows, :self.cols]
+        dirty = None
+        if full:
+            dirty = np.ones(self.tiles, dtype=np.bool_)
+        elif changes is not None:
+            dirty = self._tiles_from_blocks(*changes)
+        if dirty is None:
+            np.equal(grid, 1, out=self._live)
+            np.not_equal(view, self._live, out=self._changed[:self.rows, :self.cols])
+            dirty = self._changed.reshape(self.tiles[0], tile, self.tiles[1], tile).any(axis=(1, 3))
+            tile_rows, tile_cols = np.nonzero(dirty)
+            if tile_rows.size:
+                np.copyto(view, self._live)
+        else:
+            tile_rows, tile_cols = np.nonzero(dirty)
+            # When most tiles changed, whole-board passes beat working tile by tile.
+            if tile_rows.size * 8 > dirty.size:
+                np.equal(grid, 1, out=view)
+            else:
+                for top, left in zip(tile_rows * tile, tile_cols * tile):
+                    cells = grid[top:top + tile, left:left + tile]
+                    np.equal(cells, 1, out=view[top:top + tile, left:left + tile])
+        if tile_rows.size == 0:
+            return 0
+
+        if tile_rows.size * 8 > dirty.size:
+            blocks = self._snapshot.view(np.uint8)
+            for k in range(1, TILE_LEVEL + 1):
+                blocks = pool_pairs(blocks, np.uint8 if k <= 3 else np.uint16)
+                self.counts[k][...] = blocks
+        else:
+            tiled = self._snapshot.view(np.uint8).reshape(self.tiles[0], tile, self.tiles[1], tile)
+            blocks = tiled[tile_rows, :, tile_cols, :]
+            for k in range(1, TILE_LEVEL + 1):
+                blocks = pool_pairs(blocks, np.uint8 if k <= 3 else np.uint16)
+                side = tile >> k
+                target = self.counts[k].reshape(self.tiles[0], side, self.tiles[1], side)
+                target[tile_rows, :, tile_cols, :] = blocks
+        for k in range(TILE_LEVEL + 1, self.levels + 1):
+            below = self.counts[k - 1]
+            self.counts[k] = below.reshape(below.shape[0] // 2, 2, below.shape[1] // 2, 2).sum(axis=(1, 3))
+        return tile_rows.size
+
+    def window(self, level, top, left, bottom, right):
+        """
+        Densities (0..1) of the level-k blocks covering a window of cells.
+
+        Parameters:
+        - level (int): Pyramid level, 1..levels.
+        - top, left, bottom, right (int): Window in cells (bottom and right exclusive).
+
+        Returns:
+        - tuple: (densities, (top, left, bottom, right) of the blocks in cells).
+        """
+        block_top, block_left = top >> level, left >> level
+        block_bottom = -(-bottom // (1 << level))
+        block_right = -(-right // (1 << level))
+        counts = self.counts[level][block_top:block_bottom, block_left:block_right]
+        return (counts / float(1 << 2 * level),
+                (block_top << level, block_left << level, block_bottom << level, block_right << level))
+
+class SimulationThread(threading.Thread):
+    """
+    Background producer stepping a simulation and publishing snapshots on request.
+
+    All access to the simulation goes through this thread: cell edits are queued and
+    applied between batches of generations, so the UI never touches the board while
+    it is being stepped. A published snapshot is only a copy of the backend's own
+    storage (e.g. the packed words); turning it into a frame is left to a
+    FrameRenderer, so the simulation never waits on drawing.
+
+    Parameters:
+    - simulation (Simulation): Simulation to advance.
+    - publish (callable): Called in this thread with (snapshot, changes, generation)
+      when a frame was requested, see Backend.snapshot() and Backend.take_changes().
+    """
+    def __init__(self, simulation, publish):
+        super().__init__(daemon=True)
+        self.simulation = simulation
+        self.publish = publish
+        self.paused = True
+        self.generations_per_second = 0.0
+        self._edits = queue.Queue()
+        self._frame_wanted = threading.Event()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+
+    def request_frame(self):
+        """
+        Ask for a new snapshot; it is published after the current batch.
+        """
+        self._frame_wanted.set()
+        self._wake.set()
+
+    def set_cell(self, row, col, value):
+        """
+        Queue a cell edit, applied by the simulation thread.
+        """
+        self._edits.put((row, col, value))
+        self.request_frame()
+
+    def toggle_pause(self):
+        """
+        Pause or resume stepping.
+        """
+        self.paused = not self.paused
+        self._wake.set()
+
+    def stop(self):
+        """
+        Ask the thread to finish after the current batch.
+        """
+        self._stopping.set()
+        self._wake.set()
+
+    def run(self):
+        batch = 1
+        window_start, window_generation = time.perf_counter(), self.simulation.generation
+        while not self._stopping.is_set():
+            while not self._edits.empty():
+                self.simulation.set_cell(*self._edits.get())
+
+            if self.paused:
+                self._wake.wait(0.05)
+                self._wake.clear()
+            else:
+                start = time.perf_counter()
+                self.simulation.run(batch)
+                elapsed = time.perf_counter() - start
+                # Grow or shrink the batch so that one batch takes about BATCH_SECONDS.
+                batch = max(1, min(batch * 2, int(batch * BATCH_SECONDS / max(elapsed, 1e-9))))
+
+            now = time.perf_counter()
+            if now - window_start >= 0.5:
+                done = self.simulation.generation - window_generation
+                self.generations_per_second = done / (now - window_start)
+                window_start, window_generation = now, self.simulation.generation
+
+            if self._frame_wanted.is_set():
+                self._frame_wanted.clear()
+                backend = self.simulation.backend
+                self.publish(backend.snapshot(), backend.take_changes(),
+                             self.simulation.generation)
+
+class FrameRenderer(threading.Thread):
+    """
+    Background consumer turning snapshots into frames at screen resolution.
+
+    Only the newest snapshot is kept: one arriving before the previous was rendered
+    replaces it, and a frame not yet shown is replaced by the next one.
+
+    Parameters:
+    - expand (callable): Turns a snapshot into a dense grid, see Backend.expand().
+    - render (callable): Turns a dense grid and the changes since the previous
+      snapshot into a frame.
+    """
+    def __init__(self, expand, render):
+        super().__init__(daemon=True)
+        self.expand = expand
+        self.render = render
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._pending = None
+        self._frame = None
+
+    def submit(self, snapshot, changes, generation):
+        """
+        Hand over a snapshot to render, dropping an older one still waiting (its
+        changes are merged into the new ones).
+        """
+        with self._lock:
+            if self._pending is not None:
+                changes = merge_changes(self._pending[1], changes)
+            self._pending = (snapshot, changes, generation)
+        self._wake.set()
+
+    def latest_frame(self):
+        """
+        Take the most recent unseen frame.
+
+        Returns:
+        - tuple or None: (frame, generation), or None if no new frame was rendered.
+        """
+        with self._lock:
+            frame, self._frame = self._frame, None
+        return frame
+
+    def stop(self):
+        """
+        Ask the thread to finish after the current frame.
+        """
+        self._stopping.set()
+        self._wake.set()
+
+    def run(self):
+        while not self._stopping.is_set():
+            self._wake.wait(0.05)
+            self._wake.clear()
+            with self._lock:
+                job, self._pending = self._pending, None
+            if job is None:
+                continue
+            snapshot, changes, generation = job
+            frame = self.render(self.expand(snapshot), changes)
+            with self._lock:
+                self._frame = (frame, generation)
+
+class Viewer:
+    """
+    Animated, editable display of a simulation stepped in a background thread.
+
+    Parameters:
+    - simulation (Simulation): Simulation to display and advance.
+    - pooling (str): "max" or "mean" pooling when the board is larger than the image.
+    - interval (int): Milliseconds between two display refreshes.
+    """
+    def __init__(self, simulation, pooling="max", interval=30):
+        self.simulation = simulation
+        self.pooling = pooling
+        self.rows, self.cols = simulation.grid.shape
+        self.factors = (1, 1)
+
+        self.fig, self.ax = plt.subplots()
+        # Placeholder image: frames at screen resolution come from the renderer.
+        self.img = self.ax.imshow(np.zeros((1, 1)), cmap='gray_r',
+                                  vmin=0, vmax=simulation.rule.states - 1,
+                                  interpolation='nearest', animated=True)
+        self.ax.set_xlim(-0.5, self.cols - 0.5)
+        self.ax.set_ylim(self.rows - 0.5, -0.5)
+        self.ax.set_title("Space: Pause/Resume | Left click: Alive | Right click: Dead")
+        self._fit_to_screen()
+
+        self.renderer = FrameRenderer(simulation.backend.expand, self._render)
+        self.producer = SimulationThread(simulation, self.renderer.submit)
+        self.fps = 0.0
+        self._frames, self._fps_start = 0, time.perf_counter()
+        self._requested = True
+
+        self.ani = FuncAnimation(self.fig, self.update, interval=interval, blit=True,
+                                 cache_frame_data=False)
+        self.fig.canvas.mpl_connect('button_press_event', self.on_click)
+        self.fig.canvas.mpl_connect('key_press_event', self.on_key)
+        self.fig.canvas.mpl_connect('resize_event', lambda event: self._fit_to_screen())
+        self.fig.canvas.mpl_connect('close_event', lambda event: self.stop())
+        self.renderer.start()
+        self.producer.start()
+        self.producer.request_frame()
+
+    @property
+    def paused(self):
+        return self.producer.paused
+
+    def _display(self, grid):
+        """
+        Image values for a grid: live cells darkest, dying states of Generations rules
+        fading towards the dead background.
+        """
+        states = self.simulation.rule.states
+        return grid if states == 2 else (states - grid.astype(int)) % states
+
+    def _fit_to_screen(self):
+        """
+        Choose pooling factors giving about one frame pixel per screen pixel, and
+        stretch the image over the pooled board so axes coordinates stay in cells.
+        """
+        extent = self.ax.get_window_extent()
+        factor_rows = max(1, int(np.ceil(self.rows / max(extent.height, 1))))
+        factor_cols = max(1, int(np.ceil(self.cols / max(extent.width, 1))))
+        self.factors = (factor_rows, factor_cols)
+        height = -(-self.rows // factor_rows) * factor_rows
+        width = -(-self.cols // factor_cols) * factor_cols
+        self.img.set_extent((-0.5, width - 0.5, height - 0.5, -0.5))
+        self.fig.canvas.draw_idle()
+
+    def _render(self, grid, changes=None):
+        """
+        Frame of a grid at screen resolution (runs in the rendering thread).
+        """
+        return downsample(self._display(grid), *self.factors, mode=self.pooling)
+
+    def show(self):
+        """
+        Open the window and block until it is closed.
+        """
+        plt.show()
+        self.stop()
+
+    def stop(self):
+        """
+        Stop the simulation and rendering threads.
+        """
+        self.producer.stop()
+        self.renderer.stop()
+
+    def update(self, frame):
+        """
+        Called by FuncAnimation for each animation frame.
+        Shows the latest rendered frame and, once it arrived, asks for the next one,
+        so at most one snapshot is in flight.
+        """
+        latest = self.renderer.latest_frame()
+        if latest is not None:
+            self._show_frame(latest[0])
+            self._frames += 1
+            self._requested = False
+        if not self._requested:
+            self._requested = True
+            self.producer.request_frame()
+
+        now = time.perf_counter()
+        if now - self._fps_start >= 0.5:
+            self.fps = self._frames / (now - self._fps_start)
+            self._frames, self._fps_start = 0, now
+            manager = self.fig.canvas.manager
+            if manager is not None:
+                manager.set_window_title(
+                    f"Game of Life | generation {self.simulation.generation} | "
+                    f"{self.fps:.0f} FPS | {self.producer.generations_per_second:,.0f} gen/s")
+        return [self.img]
+
+    def _show_frame(self, image):
+        """
+        Copy a published frame into the image.
+        """
+        if image.shape != self.img.get_array().shape:
+            # The pooling factors changed (window resized): the extent was updated
+            # by _fit_to_screen() and a full redraw follows.
+            self.fig.canvas.draw_idle()
+        self.img.set_data(image)
+
+    def on_click(self, event):
+        """
+        Mouse click event handler.
+        Left-click toggles cell alive, right-click sets it dead.
+        """
+        if event.inaxes != self.ax:
+            return
+        try:
+            x = int(round(event.xdata))
+            y = int(round(event.ydata))
+        except (TypeError, ValueError):
+            return
+
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            if event.button == 1:
+                self.producer.set_cell(y, x, 1)
+            elif event.button == 3:
+                self.producer.set_cell(y, x, 0)
+
+    def on_key(self, event):
+        """
+        Keyboard event handler. Pressing space toggles pause/resume.
+        """
+        if event.key == ' ':
+            self.producer.toggle_pause()
+            print("Running simulation..." if not self.paused else "Paused.")
+
+class ZoomViewer(Viewer):
+    """
+    Level-of-detail viewer with zoom and pan, for boards too large to show whole.
+
+    Frames only cover the visible window. Zoomed out, they are read from the level of
+    a DensityPyramid whose blocks are about one screen pixel, and show the fraction of
+    live cells per block; zoomed in to one cell per pixel or more, they show the cells.
+    The image is placed in cell coordinates, so clicks edit the cell under the cursor
+    at every zoom level.
+
+    Parameters:
+    - simulation (Simulation): Simulation to display and advance.
+    - interval (int): Milliseconds between two display refreshes.
+    - min_cells (int): Smallest number of cells across the view when zoomed in.
+    """
+    def __init__(self, simulation, interval=30, min_cells=16):
+        self.rows, self.cols = simulation.grid.shape
+        self.min_cells = min_cells
+        self.pyramid = DensityPyramid(simulation.grid)
+        self.view = (0.0, 0.0, float(self.rows), float(self.cols))
+        self.pixels = (1, 1)
+        super().__init__(simulation, interval=interval)
+        self.img.set_clim(0, 1)
+        self.ax.set_title("Scroll: Zoom | Arrows: Pan | R: Reset | Space: Pause/Resume")
+        self.fig.canvas.mpl_connect('scroll_event', self.on_scroll)
+        self._apply_view()
+
+    def _fit_to_screen(self):
+        """
+        Remember the size of the axes in screen pixels, which sets the pyramid level.
+        """
+        extent = self.ax.get_window_extent()
+        self.pixels = (max(int(extent.height), 1), max(int(extent.width), 1))
+        self.fig.canvas.draw_idle()
+
+    def level(self):
+        """
+        Pyramid level for the current view: the coarsest one with at least one block
+        per screen pixel (0 means individual cells).
+
+        Returns:
+        - int: Level between 0 and pyramid.levels.
+        """
+        top, left, bottom, right = self.view
+        cells_per_pixel = max((bottom - top) / self.pixels[0], (right - left) / self.pixels[1])
+        if cells_per_pixel < 2:
+            return 0
+        return min(int(np.log2(cells_per_pixel)), self.pyramid.levels)
+
+    def _render(self, grid, changes=None):
+        """
+        Frame of the visible window and its extent in cells (runs in the rendering
+        thread). The pyramid also follows the changes while zoomed in when the backend
+        reports them, as they are not available later.
+        """
+        top, left, bottom, right = self.view
+        top, left = max(int(top), 0), max(int(left), 0)
+        bottom, right = min(int(np.ceil(bottom)), self.rows), min(int(np.ceil(right)), self.cols)
+        level = self.level()
+        if level > 0 or changes is not None:
+            self.pyramid.update(grid, changes)
+        if level == 0:
+            image = self._display(grid[top:bottom, left:right]) / (self.simulation.rule.states - 1)
+        else:
+            image, (top, left, bottom, right) = self.pyramid.window(level, top, left, bottom, right)
+        return image, (left - 0.5, right - 0.5, bottom - 0.5, top - 0.5)
+
+    def _show_frame(self, frame):
+        image, extent = frame
+        self.img.set_data(image)
+        self.img.set_extent(extent)
+
+    def _apply_view(self):
+        """
+        Clamp the view to the board, show it on the axes and ask for a matching frame.
+        """
+        top, left, bottom, right = self.view
+        height = min(max(bottom - top, self.min_cells), self.rows)
+        width = min(max(right - left, self.min_cells), self.cols)
+        top = min(max(top, 0.0), self.rows - height)
+        left = min(max(left, 0.0), self.cols - width)
+        self.view = (top, left, top + height, left + width)
+        self.ax.set_xlim(left - 0.5, left + width - 0.5)
+        self.ax.set_ylim(top + height - 0.5, top - 0.5)
+        self.fig.canvas.draw_idle()
+        self.producer.request_frame()
+
+    def zoom(self, factor, row=None, col=None):
+        """
+        Scale the view around a cell, keeping that cell under the cursor.
+
+        Parameters:
+        - factor (float): Below 1 zooms in, above 1 zooms out.
+        - row, col (float, optional): Fixed point, the centre of the view by default.
+        """
+        top, left, bottom, right = self.view
+        row = (top + bottom) / 2 if row is None else row
+        col = (left + right) / 2 if col is None else col
+        self.view = (row - (row - top) * factor, col - (col - left) * factor,
+                     row + (bottom - row) * factor, col + (right - col) * factor)
+        self._apply_view()
+
+    def pan(self, rows, cols):
+        """
+        Move the view by a fraction of its size.
+
+        Parameters:
+        - rows (float): Fraction of the view height to move down.
+        - cols (float): Fraction of the view width to move right.
+        """
+        top, left, bottom, right = self.view
+        shift_rows, shift_cols = rows * (bottom - top), cols * (right - left)
+        self.view = (top + shift_rows, left + shift_cols, bottom + shift_rows, right + shift_cols)
+        self._apply_view()
+
+    def on_scroll(self, event):
+        """
+        Mouse wheel handler: zoom in (up) or out (down) around the cursor.
+        """
+        if event.inaxes != self.ax or event.xdata is None:
+            return
+        self.zoom(0.8 ** event.step, event.ydata + 0.5, event.xdata + 0.5)
+
+    def on_key(self, event):
+        """
+        Keyboard event handler: space pauses, arrows pan, +/- zoom and R resets the view.
+        """
+        moves = {'up': (-0.25, 0), 'down': (0.25, 0), 'left': (0, -0.25), 'right': (0, 0.25)}
+        if event.key in moves:
+            self.pan(*moves[event.key])
+        elif event.key in ('+', '='):
+            self.zoom(0.5)
+        elif event.key == '-':
+            self.zoom(2.0)
+        elif event.key == 'r':
+            self.view = (0.0, 0.0, float(self.rows), float(self.cols))
+            self._apply_view()
+        else:
+            super().on_key(event)
@@ -0,0 +1,185 @@
+"""
+Game of Life Kernel Warm-up
+-------------------------------------------------------
+Compiles the Numba kernels ahead of time, with compile time reported apart from
+step time.
+
+Every kernel is decorated with @njit(cache=True): the machine code of each
+specialization is saved next to the module (in __pycache__, or in $NUMBA_CACHE_DIR)
+and later processes load it instead of compiling. precompile() runs each
+Numba-backed engine on a small board for a two-state rule and, where supported, a
+Generations rule (stepping and fingerprinting it, as cycle detection does), plus the
+ensemble kernel and compute_next_step() on uint8 and int64 grids, so every
+specialization used in practice is compiled (or loaded) and cached. Running it once
+per machine or deployment, e.g. in an image build, removes the compile from the
+first generation of every later short job.
+
+For each entry the first run (compile or cache load, plus a few generations) is
+timed against an identical second run: the difference is the compile time.
+
+Usage:
+    python warmup.py
+    python warmup.py --backends numba packed --rules B3/S23
+
+Authors: Nathan Ghenassia, Maria Fernanda Camacho
+"""
+
+import argparse
+import importlib
+import time
+import numpy as np
+from rules import as_rule
+from simulation import load_backend
+
+# Backends stepped by Numba kernels.
+KERNEL_BACKENDS = ["numba", "halo", "tiled", "packed", "active", "memmap"]
+# Modules defining Numba kernels.
+KERNEL_MODULES = ["main_numba", "active_region", "outofcore", "ensemble"]
+# Rules compiled by default: one two-state and one Generations rule.
+DEFAULT_RULES = ["B3/S23", "B2/S/C3"]
+# Grid dtypes compute_next_step() is compiled for.
+DIRECT_DTYPES = [np.uint8, np.int64]
+# Edge of the boards used to trigger compilation.
+WARMUP_SIZE = 64
+
+def cache_counts():
+    """
+    Numba cache hits and misses over all kernels so far.
+
+    Returns:
+    - tuple: (hits, misses).
+    """
+    hits = misses = 0
+    for module_name in KERNEL_MODULES:
+        for value in vars(importlib.import_module(module_name)).values():
+            stats = getattr(value, "stats", None)
+            if stats is not None and hasattr(value, "py_func"):
+                hits += sum(stats.cache_hits.values())
+                misses += sum(stats.cache_misses.values())
+    return hits, misses
+
+def _timed(run):
+    """
+    Time a warm-up function twice: (first run, second run) in seconds.
+    """
+    times = []
+    for _ in range(2):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return times
+
+def _run_backend(name, rule):
+    """
+    Warm-up function stepping a small board of a backend once, then three generations
+    in one advance() call, and fingerprinting it (cycle detection).
+    """
+    backend_class = load_backend(name)
+    grid = np.random.default_rng(0).integers(0, rule.states, (WARMUP_SIZE, WARMUP_SIZE))
+
+    def run():
+        backend = backend_class(grid.astype(backend_class.dtype), rule=rule)
+        backend.step()
+        backend.advance(3)
+        backend.fingerprint()
+        close = getattr(backend, "close", None)
+        if close is not None:
+            close()
+    return run
+
+def _run_ensemble(rule):
+    """
+    Warm-up function of the batched ensemble kernel.
+    """
+    from ensemble import Ensemble
+    return lambda: Ensemble.random(2, WARMUP_SIZE, WARMUP_SIZE, seed=0, rule=rule).run(4)
+
+def _run_direct(dtype):
+    """
+    Warm-up function of compute_next_step() on a grid of the given dtype.
+    """
+    from main_numba import compute_next_step
+    grid = np.random.default_rng(0).integers(0, 2, (WARMUP_SIZE, WARMUP_SIZE)).astype(dtype)
+    return lambda: compute_next_step(grid)
+
+def precompile(backends=None, rules=None, ensemble=True, direct=True):
+    """
+    Compile (or load from the cache) the kernels of the given backends and rules.
+
+    Parameters:
+    - backends (list of str, optional): Backends to warm up, KERNEL_BACKENDS by default;
+      names without Numba kernels are skipped.
+    - rules (list of Rule or str, optional): Rules, DEFAULT_RULES by default. Backends
+      without Generations support skip multi-state rules.
+    - ensemble (bool): Also warm up the ensemble kernel.
+    - direct (bool): Also warm up compute_next_step() for DIRECT_DTYPES.
+
+    Returns:
+    - list of dict: One entry per warm-up with name, rule, compile_seconds (first run
+      minus second run), step_seconds (second run), cache_hits and cache_misses.
+    """
+    rules = [as_rule(rule) for rule in (rules or DEFAULT_RULES)]
+    jobs = []
+    for name in backends or KERNEL_BACKENDS:
+        if name not in KERNEL_BACKENDS:
+            continue
+        backend_class = load_backend(name)
+        for rule in rules:
+            if rule.is_generations and not backend_class.supports_generations:
+                continue
+            jobs.append((name, str(rule), _run_backend(name, rule)))
+    if ensemble:
+        jobs += [("ensemble", str(rule), _run_ensemble(rule))
+                 for rule in rules if not rule.is_generations]
+    if direct:
+        jobs += [(f"compute_next_step[{np.dtype(dtype).name}]", "B3/S23", _run_direct(dtype))
+                 for dtype in DIRECT_DTYPES]
+
+    report = []
+    for name, rule, run in jobs:
+        hits, misses = cache_counts()
+        first, second = _timed(run)
+        new_hits, new_misses = cache_counts()
+        report.append({"name": name, "rule": rule, "compile_seconds": max(first - second, 0.0),
+                       "step_seconds": second, "cache_hits": new_hits - hits,
+                       "cache_misses": new_misses - misses})
+    return report
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+
+    Parameters:
+    - argv (list of str, optional): Arguments to parse, defaults to sys.argv[1:].
+
+    Returns:
+    - argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Compile and cache the Numba kernels.")
+    parser.add_argument("--backends", nargs="+", default=KERNEL_BACKENDS,
+                        choices=KERNEL_BACKENDS, help="Backends to warm up.")
+    parser.add_argument("--rules", nargs="+", default=DEFAULT_RULES,
+                        help="Rules to warm up (one two-state and one Generations rule cover "
+                             "every specialization).")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Warm up the kernels given on the command line and print the compile times.
+
+    Parameters:
+    - argv (list of str, optional): Arguments to parse, defaults to sys.argv[1:].
+    """
+    args = parse_args(argv)
+    print(f"{'kernel':>26} {'rule':>8} {'compile s':>10} {'step s':>9} {'cache hits':>10} "
+          f"{'compiled':>8}")
+    report = precompile(args.backends, args.rules)
+    for entry in report:
+        print(f"{entry['name']:>26} {entry['rule']:>8} {entry['compile_seconds']:>10.3f} "
+              f"{entry['step_seconds']:>9.4f} {entry['cache_hits']:>10} "
+              f"{entry['cache_misses']:>8}")
+    print(f"total: compile={sum(entry['compile_seconds'] for entry in report):.3f}s "
+          f"step={sum(entry['step_seconds'] for entry in report):.3f}s")
+
+if __name__ == "__main__":
+    main()